@@ -0,0 +1,106 @@
+# File: src/algorithm/ngram_filter.py
+
+import zlib
+from typing import List
+
+# Trigrams filter exact search; bigrams give a usable q-gram bound for short fuzzy keywords
+EXACT_Q = 3
+FUZZY_Q = 2
+SIGNATURE_BITS = 8192
+
+
+def _gram_bit(gram: str, bits: int) -> int:
+    """
+    Maps a q-gram to a bit position. crc32 is used instead of hash() because
+    hash() is salted per process, and signatures are shared with worker
+    processes and saved to disk.
+    """
+    return zlib.crc32(gram.encode("utf-8")) % bits
+
+
+def _qgrams(text: str, q: int) -> List[str]:
+    return [text[i:i + q] for i in range(len(text) - q + 1)]
+
+
+class NGramSignature:
+    """
+    Bloom-style bitset over the character bigrams and trigrams of a CV.
+
+    A keyword whose trigrams are not all set certainly does not occur in the
+    CV, so the KMP/BM scan of that CV can be skipped. For fuzzy search the
+    q-gram lemma gives a minimum number of the keyword's bigrams any
+    approximate occurrence must contain. Hash collisions only cause extra
+    scans, never missed matches.
+    """
+    def __init__(self, bits: bytes):
+        """
+        Args:
+            bits: The bitset, len(bits) * 8 bits wide.
+        """
+        self.bits = bits
+        self.size = len(bits) * 8
+
+    @classmethod
+    def from_text(cls, text_lower: str, size: int = SIGNATURE_BITS) -> "NGramSignature":
+        """
+        Builds the signature of a (lower-cased) CV text.
+
+        Args:
+            text_lower: The text exactly as the matchers will see it.
+            size: Number of bits, a multiple of 8.
+
+        Returns:
+            NGramSignature: The signature of the text
+        """
+        buffer = bytearray(size // 8)
+        grams = set(_qgrams(text_lower, EXACT_Q))
+        grams.update(_qgrams(text_lower, FUZZY_Q))
+        for gram in grams:
+            bit = _gram_bit(gram, size)
+            buffer[bit >> 3] |= 1 << (bit & 7)
+        return cls(bytes(buffer))
+
+    def contains_gram(self, gram: str) -> bool:
+        bit = _gram_bit(gram, self.size)
+        return bool(self.bits[bit >> 3] & (1 << (bit & 7)))
+
+    def might_contain(self, keyword: str) -> bool:
+        """
+        Returns False only if the keyword certainly does not occur in the text.
+        Single-character keywords cannot be filtered and always pass.
+        """
+        q = EXACT_Q if len(keyword) >= EXACT_Q else FUZZY_Q
+        if len(keyword) < q:
+            return True
+        return all(self.contains_gram(gram) for gram in _qgrams(keyword, q))
+
+    def might_match_fuzzy(self, keyword: str, threshold: int) -> bool:
+        """
+        Returns False only if no substring of the text with the keyword's
+        length is within `threshold` edits of it. Every edit destroys at most
+        q of the keyword's (len - q + 1) q-grams, so a match needs at least
+        (len - q + 1) - threshold * q of them to be present.
+        """
+        grams = _qgrams(keyword, FUZZY_Q)
+        required = len(grams) - threshold * FUZZY_Q
+        if required <= 0:
+            return True
+        present = 0
+        for i, gram in enumerate(grams):
+            if self.contains_gram(gram):
+                present += 1
+                if present >= required:
+                    return True
+            elif present + len(grams) - i - 1 < required:
+                return False
+        return False
+
+
+# For logic testing
+if __name__ == '__main__':
+    signature = NGramSignature.from_text("experienced python developer with sql and django")
+    for keyword in ["python", "django", "kotlin", "pyton"]:
+        print(f"Keyword: '{keyword}'")
+        print(f"Might contain: {signature.might_contain(keyword)}")
+        print(f"Might match fuzzy (k=1): {signature.might_match_fuzzy(keyword, 1)}")
+        print("-" * 30)
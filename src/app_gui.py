@@ -2,20 +2,41 @@ import flet as ft
 import os
 import subprocess
 import platform
-from typing import List, Dict, Any, Optional
+import threading
+import copy
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 import time
 
-from algorithm.KMP import kmp_search
-from algorithm.boyer_moore import bm_search
 from algorithm.aho_corasick import AhoCorasick
-from algorithm.levenshtein import levenshtein_search
-from cv_extractor import extract_info_from_text
 from database import ApplicantDatabaseManager
-from pdf_extractor import extract_text_pypdf2
+from scoring import CorpusStatistics, BM25Scorer, tokenize
+from result_cache import SearchResultCache, CachedSearch, make_cache_key
+from inverted_index import InvertedIndex
+from attribute_filter import AttributeIndex, SearchFilters
+from text_store import TextStore
+from cv_pipeline import CvPipeline, ProcessedCV
+from detail_cache import DetailCache
+from index_store import IndexFormatError, corpus_fingerprint, load_index, save_index
+from query_language import QueryNode, QueryEvaluator, is_boolean_query, parse_query
+from search_executor import (ShardedSearchExecutor, TextMatches, CancellationToken, SearchCancelled,
+                             exact_match_counts, fuzzy_match_counts)
 
 
 LEVENSHTEIN_THRESHOLD = 2
+# IDF multiplier of keywords that only matched within the Levenshtein threshold
+FUZZY_MATCH_WEIGHT = 0.5
+BM25_K1 = 1.2
+BM25_B = 0.75
+RESULT_CACHE_SIZE = 64
+# Worker processes for keyword search; 1 keeps matching in the UI process
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", "1"))
+# A search still running after this many seconds is abandoned (0 = no deadline)
+SEARCH_DEADLINE_SECONDS = float(os.getenv("SEARCH_DEADLINE_SECONDS", "60"))
+# Persistent search index, rebuilt when the CV files or the index format change
+INDEX_PATH = os.getenv("INDEX_PATH", os.path.join("archive", "ats_index.bin"))
+# Extract summary details of the shown results in the background after each search
+PRECOMPUTE_DETAILS = os.getenv("PRECOMPUTE_DETAILS", "1") == "1"
 
 @dataclass
 class ApplicantData:
@@ -29,6 +50,7 @@ class ApplicantData:
     matched_keywords: Dict[str, int]
     total_matches: int
     application_role: Optional[str] = None
+    score: float = 0.0
     summary: Optional[str] = None
     skills: List[str] = None
     job_history: List[Dict] = None
@@ -106,7 +128,7 @@ class CVCard(ft.Card):
                             ),
                             ft.Container(
                                 content=ft.Text(
-                                    f"{self.applicant_data.total_matches} matches",
+                                    f"{self.applicant_data.total_matches} matches · {self.applicant_data.score:.2f}",
                                     size=12,
                                     color=ft.Colors.WHITE,
                                     weight=ft.FontWeight.W_600
@@ -151,18 +173,34 @@ class ATSApp:
         
         self.db = ApplicantDatabaseManager()
         self.cv_database: List[Dict[str, Any]] = []
+        self.corpus_stats = CorpusStatistics()
+        self.scorer = BM25Scorer(self.corpus_stats, k1=BM25_K1, b=BM25_B)
+        self.inverted_index = InvertedIndex()
+        self.attribute_index = AttributeIndex()
+        self.text_store = TextStore()
+        self.first_doc_by_applicant: Dict[int, int] = {}
+        self.detail_cache = DetailCache()
+        self.corpus_version = 0
+        self.result_cache = SearchResultCache(max_entries=RESULT_CACHE_SIZE)
+        self.search_executor = ShardedSearchExecutor(SEARCH_WORKERS) if SEARCH_WORKERS > 1 else None
 
         self._load_cv_data_from_db()
         
         self.search_keywords = ""
         self.selected_algorithm = "KMP"
         self.top_matches = "10"
+        self.role_filter = "All"
+        self.min_age_filter = ""
+        self.max_age_filter = ""
         self.search_results: List[ApplicantData] = []
         self.is_searching = False
+        self.search_token: Optional[CancellationToken] = None
+        self._search_lock = threading.Lock()
         self.current_applicant: Optional[ApplicantData] = None
         
         self.exact_match_time = ""
         self.fuzzy_match_time = ""
+        self.cache_status = ""
         
         self.page.on_route_change = self.route_change
         self.page.on_view_pop = self.view_pop
@@ -173,13 +211,66 @@ class ATSApp:
     
     def _load_cv_data_from_db(self):
         """
-        Fetches data from the database, constructs the full file path, extracts text from each PDF,
-        and prepares it in an in-memory data structure for fast searching.
+        Fetches data from the database and loads the search corpus from the persistent
+        index when it matches the current CV files. Otherwise constructs the full file path,
+        extracts text from each PDF, prepares it in an in-memory data structure for fast
+        searching and saves a new index.
         """
         print("Loading CV data from database...")
         applicant_records = self.db.get_all_applicant_data_joined()
-        
-        temp_database = []
+        fingerprint = corpus_fingerprint(
+            (record, os.path.join("archive", "data", record["cv_path"]))
+            for record in applicant_records if record.get("cv_path")
+        )
+
+        self.corpus_version += 1
+        self.attribute_index = AttributeIndex()
+        self.first_doc_by_applicant = {}
+        if self.search_executor:
+            self.search_executor.shutdown()
+
+        start_load_time = time.perf_counter()
+        try:
+            loaded = load_index(INDEX_PATH, fingerprint)
+        except IndexFormatError as e:
+            print(f"Search index not usable ({e}), rebuilding from PDFs...")
+            loaded = None
+
+        if loaded:
+            self.cv_database = loaded.cv_database
+            self.text_store = loaded.text_store
+            self.corpus_stats = loaded.corpus_stats
+            self.scorer = BM25Scorer(self.corpus_stats, k1=BM25_K1, b=BM25_B)
+            self.inverted_index = loaded.inverted_index
+            for doc_index, cv_entry in enumerate(self.cv_database):
+                self.attribute_index.add_document(doc_index, cv_entry.get("role"), cv_entry.get("birthdate"))
+                self.first_doc_by_applicant.setdefault(cv_entry["id"], doc_index)
+            print(f"Loaded {len(self.cv_database)} CVs ({len(self.text_store)} distinct texts) "
+                  f"from search index {INDEX_PATH} in {(time.perf_counter() - start_load_time) * 1000:.1f} ms.")
+        else:
+            self._build_corpus_from_pdfs(applicant_records)
+            try:
+                save_index(INDEX_PATH, self.cv_database, self.text_store, self.inverted_index,
+                           self.corpus_stats, fingerprint)
+            except OSError as e:
+                print(f"Warning: could not save search index to {INDEX_PATH}: {e}")
+
+        if self.search_executor:
+            self.search_executor.load(self.text_store)
+            print(f"Search corpus distributed over {self.search_executor.num_workers} worker processes.")
+
+    def _build_corpus_from_pdfs(self, applicant_records: List[Dict[str, Any]]):
+        """
+        Runs every CV through the ingest pipeline and builds the in-memory corpus, statistics
+        and index. Identical CV files are only extracted once. Field extraction is left to
+        the detail cache, so the pipeline stops after reading the text.
+        """
+        self.cv_database = []
+        self.text_store = TextStore()
+        self.corpus_stats = CorpusStatistics()
+        self.scorer = BM25Scorer(self.corpus_stats, k1=BM25_K1, b=BM25_B)
+        self.inverted_index = InvertedIndex()
+        pipeline = CvPipeline(parse=False, indexer=self._index_processed_cv)
         for record in applicant_records:
             relative_cv_path = record.get("cv_path")
             
@@ -187,26 +278,56 @@ class ATSApp:
                 full_cv_path = os.path.join("archive", "data", relative_cv_path)
 
                 if os.path.exists(full_cv_path):
-                    cv_text = extract_text_pypdf2(full_cv_path)
-                    full_name = f"{record.get('first_name', '')} {record.get('last_name', '')}".strip()
-
-                    temp_database.append({
-                        "id": record.get("applicant_id"),
-                        "name": full_name,
-                        "email": "", 
-                        "phone": record.get("phone_number"),
-                        "address": record.get("address"),
-                        "birthdate": str(record.get("date_of_birth", "")),
-                        "cv_path": full_cv_path, # Store the full, correct path
-                        "cv_text": cv_text,
-                    })
+                    pipeline.process(full_cv_path, record)
                 else:
                     print(f"Warning: CV file not found at constructed path for applicant_id {record.get('applicant_id')}: {full_cv_path}")
             else:
                 print(f"Warning: CV path is missing in the database for applicant_id {record.get('applicant_id')}")
 
-        self.cv_database = temp_database
-        print(f"Successfully loaded {len(self.cv_database)} CVs.")
+        print(f"Successfully loaded {len(self.cv_database)} CVs ({len(self.text_store)} distinct texts).")
+        print(pipeline.stats.report())
+
+    def _index_processed_cv(self, processed: ProcessedCV, record: Dict[str, Any]):
+        """Index stage of the ingest pipeline: adds a CV and its database record to the corpus."""
+        full_name = f"{record.get('first_name', '')} {record.get('last_name', '')}".strip()
+        self.add_cv_to_corpus({
+            "id": record.get("applicant_id"),
+            "name": full_name,
+            "email": "", 
+            "phone": record.get("phone_number"),
+            "address": record.get("address"),
+            "birthdate": str(record.get("date_of_birth", "")),
+            "role": record.get("application_role"),
+            "cv_path": processed.path, # Store the full, correct path
+            "cv_text": processed.text,
+        })
+
+    def add_cv_to_corpus(self, cv_entry: Dict[str, Any]) -> int:
+        """
+        Appends a CV to the in-memory corpus and bumps the corpus version so cached results are dropped.
+        The text is stored once per distinct content and shared by the entries using it; the ranking
+        statistics, the inverted index and the search workers are keyed by text id, so only a new
+        distinct text is tokenized and indexed.
+        Returns the document index of the new entry.
+        """
+        doc_index = len(self.cv_database)
+        self.cv_database.append(cv_entry)
+        text_count = len(self.text_store)
+        text_id = self.text_store.add(cv_entry.get("cv_text", ""))
+        self.text_store.link(text_id, doc_index)
+        cv_text = cv_entry["cv_text"] = self.text_store.texts[text_id]
+        cv_entry["text_id"] = text_id
+        cv_entry["signature"] = self.text_store.signatures[text_id]
+        if text_id == text_count:
+            tokens = tokenize(cv_text)
+            self.corpus_stats.add_document(text_id, cv_text, tokens)
+            self.inverted_index.add_document(text_id, cv_text, tokens)
+            if self.search_executor and self.search_executor.is_running:
+                self.search_executor.add_text(text_id, self.text_store.lowered[text_id], cv_entry["signature"])
+        self.attribute_index.add_document(doc_index, cv_entry.get("role"), cv_entry.get("birthdate"))
+        self.first_doc_by_applicant.setdefault(cv_entry["id"], doc_index)
+        self.corpus_version += 1
+        return doc_index
 
     def init_views(self):
         """
@@ -251,7 +372,7 @@ class ATSApp:
             content=ft.Column([
                 ft.TextField(
                     label="Search Keywords",
-                    hint_text="e.g., Python, React, SQL",
+                    hint_text='e.g., Python, React, SQL  or  Python AND ("machine learning" OR SQL) NOT PHP',
                     value=self.search_keywords,
                     on_change=self.on_keywords_change,
                     on_submit=self.on_search_click,
@@ -300,7 +421,6 @@ class ATSApp:
                                     color=ft.Colors.WHITE,
                                     shape=ft.RoundedRectangleBorder(radius=8)
                                 ),
-                                disabled=self.is_searching,
                                 height=50,
                                 width=100
                             ),
@@ -312,6 +432,47 @@ class ATSApp:
                             )
                         ]),
                         alignment=ft.alignment.center
+                    ),
+                    
+                    ft.OutlinedButton(
+                        text="Cancel",
+                        icon=ft.Icons.STOP_CIRCLE_OUTLINED,
+                        on_click=self.on_cancel_search_click,
+                        style=ft.ButtonStyle(
+                            color=ft.Colors.RED_700,
+                            shape=ft.RoundedRectangleBorder(radius=8)
+                        ),
+                        visible=self.is_searching,
+                        height=50
+                    )
+                ], spacing=12),
+
+                ft.Row([
+                    ft.Dropdown(
+                        label="Role",
+                        options=[ft.dropdown.Option("All")] + [
+                            ft.dropdown.Option(role) for role in self.attribute_index.roles()
+                        ],
+                        value=self.role_filter,
+                        width=260,
+                        on_change=self.on_role_filter_change,
+                        dense=True,
+                    ),
+                    ft.TextField(
+                        label="Min age",
+                        value=self.min_age_filter,
+                        on_change=self.on_min_age_change,
+                        keyboard_type=ft.KeyboardType.NUMBER,
+                        width=100,
+                        dense=True
+                    ),
+                    ft.TextField(
+                        label="Max age",
+                        value=self.max_age_filter,
+                        on_change=self.on_max_age_change,
+                        keyboard_type=ft.KeyboardType.NUMBER,
+                        width=100,
+                        dense=True
                     )
                 ], spacing=12)
             ], spacing=8, tight=True),
@@ -344,6 +505,12 @@ class ATSApp:
                         color=ft.Colors.ORANGE_800,
                         visible=bool(self.fuzzy_match_time)
                     ),
+                    ft.Text(
+                        f"Cache: {self.cache_status}" if self.cache_status else "",
+                        size=12,
+                        color=ft.Colors.BLUE_GREY_600,
+                        visible=bool(self.cache_status)
+                    ),
                 ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.END)
             ], tight=True),
             padding=ft.padding.symmetric(horizontal=12, vertical=8),
@@ -674,6 +841,24 @@ class ATSApp:
         """
         self.top_matches = e.control.value
     
+    def on_role_filter_change(self, e):
+        """
+        Handles the change event for the role filter dropdown.
+        """
+        self.role_filter = e.control.value
+
+    def on_min_age_change(self, e):
+        """
+        Handles the change event for the minimum age field.
+        """
+        self.min_age_filter = e.control.value
+
+    def on_max_age_change(self, e):
+        """
+        Handles the change event for the maximum age field.
+        """
+        self.max_age_filter = e.control.value
+
     def on_search_click(self, e):
         """
         Handles the click event for the search button.
@@ -681,8 +866,33 @@ class ATSApp:
         if not self.search_keywords.strip():
             self.show_snackbar("Please enter search keywords")
             return
+
+        try:
+            self.current_filters()
+        except ValueError:
+            self.show_snackbar("Age filters must be whole numbers")
+            return
         
-        self.perform_search()
+        self.start_search()
+
+    def current_filters(self) -> SearchFilters:
+        """
+        Builds the attribute filters from the filter controls.
+
+        Raises:
+            ValueError: If an age field is not a whole number
+        """
+        roles = () if self.role_filter in (None, "", "All") else (self.role_filter,)
+        min_age = int(self.min_age_filter) if self.min_age_filter.strip() else None
+        max_age = int(self.max_age_filter) if self.max_age_filter.strip() else None
+        return SearchFilters(roles=roles, min_age=min_age, max_age=max_age)
+    
+    def on_cancel_search_click(self, e):
+        """
+        Handles the click event for the cancel button shown while searching.
+        """
+        if self.search_token:
+            self.search_token.cancel()
     
     def on_summary_click(self, applicant_id: int):
         """
@@ -696,127 +906,386 @@ class ATSApp:
         """
         self.open_pdf_file(cv_path)
     
-    def perform_search(self):
+    def start_search(self):
         """
-        Performs the CV search using exact and fuzzy matching algorithms.
+        Cancels the search in flight, if any, and runs a new one on a
+        background thread so the UI stays responsive.
         """
-        self.is_searching = True
-        self.exact_match_time = ""
-        self.fuzzy_match_time = ""
+        with self._search_lock:
+            if self.search_token:
+                self.search_token.cancel()
+            token = CancellationToken(SEARCH_DEADLINE_SECONDS)
+            self.search_token = token
+            self.is_searching = True
+            self.exact_match_time = ""
+            self.fuzzy_match_time = ""
+            self.cache_status = ""
         self.update_search_ui()
-        self.page.update()
-        time.sleep(0.1)
 
+        request = (self.search_keywords, self.selected_algorithm, int(self.top_matches), self.current_filters())
+        threading.Thread(target=self.perform_search, args=(token, *request), daemon=True).start()
+    
+    def perform_search(self, token: CancellationToken, query: str, algorithm: str, top_n: int,
+                       filters: SearchFilters = SearchFilters()):
+        """
+        Performs the CV search using exact and fuzzy matching algorithms, or
+        evaluates it on the inverted index when the query language is used.
+        Only the CVs passing the attribute filters are scanned.
+        Runs on a background thread; exact results are published before the
+        fuzzy stage starts.
+        """
         found_applicants_map: Dict[int, ApplicantData] = {}
+        doc_term_frequencies: Dict[int, Dict[str, int]] = {}
+        keyword_idf: Dict[str, float] = {}
         
         try:
-            keywords = [k.strip().lower() for k in self.search_keywords.split(',') if k.strip()]
-            if not keywords:
-                self.show_snackbar("Keywords cannot be empty.")
+            start_search_time = time.perf_counter()
+            if is_boolean_query(query):
+                query_plan = parse_query(query)
+                cache_key = make_cache_key([str(query_plan)], "QUERY", 0, top_n, str(filters))
+            else:
+                query_plan = None
+                keywords = [k.strip().lower() for k in query.split(',') if k.strip()]
+                if not keywords:
+                    self.show_snackbar("Keywords cannot be empty.")
+                    return
+                cache_key = make_cache_key(keywords, algorithm, LEVENSHTEIN_THRESHOLD, top_n, str(filters))
+            cached = self.result_cache.get(cache_key, self.corpus_version)
+            if cached:
+                lookup_ms = (time.perf_counter() - start_search_time) * 1000
+                self._publish_results(
+                    token, list(cached.results), cached.exact_match_time, cached.fuzzy_match_time,
+                    cache_status=f"hit in {lookup_ms:.2f} ms (saved {cached.elapsed_ms - lookup_ms:.2f} ms)"
+                )
+                self._start_detail_precompute(token, cached.results)
                 return
 
-            start_exact_time = time.perf_counter()
-            found_keywords_exact = set()
-
-            search_function = None
-            if self.selected_algorithm == "KMP":
-                search_function = kmp_search
-            elif self.selected_algorithm == "BM":
-                search_function = bm_search
-            
-            if self.selected_algorithm == "AC":
-                ac_automaton = AhoCorasick(keywords)
-                for applicant_data in self.cv_database:
-                    cv_text_lower = applicant_data["cv_text"].lower()
-                    matches = ac_automaton.search(cv_text_lower)
-                    
-                    if matches:
-                        total_matches_count = 0
-                        matched_keywords_details = {}
-                        for keyword, indices in matches.items():
-                            count = len(indices)
-                            matched_keywords_details[keyword.capitalize()] = count
-                            total_matches_count += count
-                            found_keywords_exact.add(keyword)
-                        
-                        if applicant_data["id"] not in found_applicants_map:
-                             found_applicants_map[applicant_data["id"]] = ApplicantData(id=applicant_data["id"], name=applicant_data["name"], cv_path=applicant_data["cv_path"], email=applicant_data["email"], phone=applicant_data["phone"], address=applicant_data["address"], birthdate=applicant_data["birthdate"], matched_keywords={}, total_matches=0)
-                        found_applicants_map[applicant_data["id"]].matched_keywords.update(matched_keywords_details)
-                        found_applicants_map[applicant_data["id"]].total_matches += total_matches_count
+            doc_indexes = self.attribute_index.doc_indexes(filters)
+            if query_plan is not None:
+                exact_match_time, fuzzy_match_time = self._run_query_plan_search(
+                    query_plan, found_applicants_map, doc_term_frequencies, token, doc_indexes)
+            elif self.search_executor:
+                exact_match_time, fuzzy_match_time = self._run_sharded_search(
+                    keywords, algorithm, top_n, found_applicants_map, doc_term_frequencies, keyword_idf,
+                    token, doc_indexes)
             else:
-                for applicant_data in self.cv_database:
-                    cv_text_lower = applicant_data["cv_text"].lower()
-                    for keyword in keywords:
-                        matches = search_function(cv_text_lower, keyword)
-                        if matches:
-                            count = len(matches)
-                            found_keywords_exact.add(keyword)
-                            
-                            if applicant_data["id"] not in found_applicants_map:
-                                found_applicants_map[applicant_data["id"]] = ApplicantData(id=applicant_data["id"], name=applicant_data["name"], cv_path=applicant_data["cv_path"], email=applicant_data["email"], phone=applicant_data["phone"], address=applicant_data["address"], birthdate=applicant_data["birthdate"], matched_keywords={}, total_matches=0)
-                            
-                            applicant = found_applicants_map[applicant_data["id"]]
-                            applicant.matched_keywords[keyword.capitalize()] = applicant.matched_keywords.get(keyword.capitalize(), 0) + count
-                            applicant.total_matches += count
-
-            end_exact_time = time.perf_counter()
-            self.exact_match_time = f"{(end_exact_time - start_exact_time) * 1000:.2f} ms"
-
-            unfound_keywords = [k for k in keywords if k not in found_keywords_exact]
-            if unfound_keywords:
-                start_fuzzy_time = time.perf_counter()
-                
-                for applicant_data in self.cv_database:
-                    cv_text_lower = applicant_data["cv_text"].lower()
-                    for keyword in unfound_keywords:
-                        matches = levenshtein_search(cv_text_lower, keyword, LEVENSHTEIN_THRESHOLD)
-                        if matches:
-                            count = len(matches)
-                            
-                            if applicant_data["id"] not in found_applicants_map:
-                                found_applicants_map[applicant_data["id"]] = ApplicantData(id=applicant_data["id"], name=applicant_data["name"], cv_path=applicant_data["cv_path"], email=applicant_data["email"], phone=applicant_data["phone"], address=applicant_data["address"], birthdate=applicant_data["birthdate"], matched_keywords={}, total_matches=0)
-                            
-                            applicant = found_applicants_map[applicant_data["id"]]
-                            fuzzy_keyword_label = f"{keyword.capitalize()} (fuzzy)"
-                            applicant.matched_keywords[fuzzy_keyword_label] = applicant.matched_keywords.get(fuzzy_keyword_label, 0) + count
-                            applicant.total_matches += count
-                
-                end_fuzzy_time = time.perf_counter()
-                self.fuzzy_match_time = f"{(end_fuzzy_time - start_fuzzy_time) * 1000:.2f} ms"
-            else:
-                 self.fuzzy_match_time = "N/A (all found)"
+                exact_match_time, fuzzy_match_time = self._run_keyword_search(
+                    keywords, algorithm, top_n, found_applicants_map, doc_term_frequencies, keyword_idf,
+                    token, doc_indexes)
+            final_results = self._rank_results(found_applicants_map, doc_term_frequencies, keyword_idf)
 
-            final_results = list(found_applicants_map.values())
-            final_results.sort(key=lambda x: x.total_matches, reverse=True)
-            self.search_results = final_results[:int(self.top_matches)]
+            final_results = final_results[:top_n]
+            elapsed_ms = (time.perf_counter() - start_search_time) * 1000
+            self.result_cache.put(cache_key, self.corpus_version, CachedSearch(
+                results=list(final_results),
+                exact_match_time=exact_match_time,
+                fuzzy_match_time=fuzzy_match_time,
+                elapsed_ms=elapsed_ms
+            ))
+            self._publish_results(
+                token, final_results, exact_match_time, fuzzy_match_time,
+                cache_status=f"miss ({self.result_cache.hits} hits / {self.result_cache.misses} misses)"
+            )
+            self._start_detail_precompute(token, final_results)
 
+        except SearchCancelled as ex:
+            with self._search_lock:
+                if token is self.search_token:
+                    if not self.exact_match_time:
+                        self.exact_match_time = f"stopped ({ex})"
+                    self.fuzzy_match_time = f"stopped ({ex})"
         except Exception as ex:
-            self.show_snackbar(f"Search error: {str(ex)}")
+            if token is self.search_token:
+                self.show_snackbar(f"Search error: {str(ex)}")
         finally:
-            self.is_searching = False
+            with self._search_lock:
+                if token is self.search_token:
+                    self.is_searching = False
             self.update_search_ui()
     
+    def _publish_results(self, token: CancellationToken, results: List[ApplicantData],
+                         exact_match_time: str, fuzzy_match_time: str, cache_status: str = ""):
+        """
+        Shows results of a search unless a newer search has replaced it.
+        """
+        with self._search_lock:
+            if token is not self.search_token:
+                return
+            self.search_results = results
+            self.exact_match_time = exact_match_time
+            self.fuzzy_match_time = fuzzy_match_time
+            self.cache_status = cache_status
+        self.update_search_ui()
+    
+    def _rank_results(self, found_applicants_map: Dict[int, ApplicantData],
+                      doc_term_frequencies: Dict[int, Dict[str, int]],
+                      keyword_idf: Optional[Dict[str, float]] = None) -> List[ApplicantData]:
+        """
+        Scores the found applicants with BM25 and sorts them best first.
+        Documents are scored through the statistics of the text they use;
+        keywords missing from keyword_idf use the index document frequency.
+        """
+        for applicant in found_applicants_map.values():
+            applicant.score = 0.0
+        for doc_index, term_frequencies in doc_term_frequencies.items():
+            cv_entry = self.cv_database[doc_index]
+            found_applicants_map[cv_entry["id"]].score += self.scorer.score(
+                cv_entry["text_id"], term_frequencies, keyword_idf)
+
+        results = list(found_applicants_map.values())
+        results.sort(key=lambda x: (x.score, x.total_matches), reverse=True)
+        return results
+
+    def _fill_keyword_idf(self, keyword_idf: Dict[str, float], doc_term_frequencies: Dict[int, Dict[str, int]],
+                          text_count: int, fuzzy_keywords: Set[str] = frozenset()):
+        """
+        Sets the IDF of every matched keyword from the number of distinct texts this
+        search matched it in, out of the text_count texts it scanned, so the document
+        frequency follows the same substring or Levenshtein rule as the match counts.
+        Keywords that only matched fuzzily are weighted down by FUZZY_MATCH_WEIGHT.
+        """
+        matched_texts: Dict[str, Set[int]] = {}
+        for doc_index, term_frequencies in doc_term_frequencies.items():
+            text_id = self.cv_database[doc_index]["text_id"]
+            for keyword in term_frequencies:
+                matched_texts.setdefault(keyword, set()).add(text_id)
+        keyword_idf.clear()
+        for keyword, text_ids in matched_texts.items():
+            weight = FUZZY_MATCH_WEIGHT if keyword in fuzzy_keywords else 1.0
+            keyword_idf[keyword] = weight * self.scorer.idf(keyword, len(text_ids), text_count)
+    
+    def _run_keyword_search(self, keywords: List[str], algorithm: str, top_n: int,
+                            found_applicants_map: Dict[int, ApplicantData],
+                            doc_term_frequencies: Dict[int, Dict[str, int]],
+                            keyword_idf: Dict[str, float],
+                            token: CancellationToken, doc_indexes: Optional[List[int]] = None) -> Tuple[str, str]:
+        """
+        Runs the exact stage with the selected algorithm, publishes its results,
+        then runs the Levenshtein stage for keywords that had no exact match
+        anywhere. Only the CVs in doc_indexes are scanned (all when None), and
+        every distinct text is matched once for all CVs sharing it. keyword_idf
+        is filled from the texts each keyword matched, see _fill_keyword_idf.
+        Returns the exact and fuzzy timing labels.
+        """
+        text_groups = self._text_groups(doc_indexes)
+        doc_count = sum(len(group) for group in text_groups.values())
+        start_exact_time = time.perf_counter()
+        found_keywords_exact = set()
+        skipped_exact = 0
+
+        ac_automaton = AhoCorasick(keywords) if algorithm == "AC" else None
+        for text_id, group in text_groups.items():
+            token.check()
+            signature = self.text_store.signatures[text_id]
+            candidate_keywords = [k for k in keywords if signature.might_contain(k)]
+            if not candidate_keywords:
+                skipped_exact += len(group)
+                continue
+            matches = exact_match_counts(self.text_store.lowered[text_id], candidate_keywords, algorithm, ac_automaton)
+            found_keywords_exact.update(matches)
+            if matches:
+                for doc_index in group:
+                    self._record_matches(doc_index, matches, "", found_applicants_map, doc_term_frequencies)
+
+        end_exact_time = time.perf_counter()
+        exact_match_time = (f"{(end_exact_time - start_exact_time) * 1000:.2f} ms "
+                            f"({skipped_exact} of {doc_count} CVs skipped, {len(text_groups)} distinct texts)")
+
+        unfound_keywords = [k for k in keywords if k not in found_keywords_exact]
+        self._fill_keyword_idf(keyword_idf, doc_term_frequencies, len(text_groups))
+        if not unfound_keywords:
+            return exact_match_time, "N/A (all found)"
+
+        interim_results = self._rank_results(found_applicants_map, doc_term_frequencies, keyword_idf)[:top_n]
+        self._publish_results(token, [copy.deepcopy(a) for a in interim_results], exact_match_time, "running...")
+
+        start_fuzzy_time = time.perf_counter()
+        skipped_fuzzy = 0
+        for text_id, group in text_groups.items():
+            token.check()
+            signature = self.text_store.signatures[text_id]
+            candidate_keywords = [
+                k for k in unfound_keywords
+                if signature.might_match_fuzzy(k, LEVENSHTEIN_THRESHOLD)
+            ]
+            if not candidate_keywords:
+                skipped_fuzzy += len(group)
+                continue
+            matches = fuzzy_match_counts(self.text_store.lowered[text_id], candidate_keywords, LEVENSHTEIN_THRESHOLD)
+            if matches:
+                for doc_index in group:
+                    self._record_matches(doc_index, matches, " (fuzzy)", found_applicants_map, doc_term_frequencies)
+        
+        end_fuzzy_time = time.perf_counter()
+        self._fill_keyword_idf(keyword_idf, doc_term_frequencies, len(text_groups), set(unfound_keywords))
+        return exact_match_time, (f"{(end_fuzzy_time - start_fuzzy_time) * 1000:.2f} ms "
+                                  f"({skipped_fuzzy} of {doc_count} CVs skipped)")
+
+    def _text_groups(self, doc_indexes: Optional[List[int]]) -> Dict[int, List[int]]:
+        """
+        Groups the documents to scan by the distinct text they use.
+        """
+        if doc_indexes is None:
+            return self.text_store.linked_docs
+        groups: Dict[int, List[int]] = {}
+        for doc_index in doc_indexes:
+            groups.setdefault(self.cv_database[doc_index]["text_id"], []).append(doc_index)
+        return groups
+
+    def _record_matches(self, doc_index: int, matches: Dict[str, int], label_suffix: str,
+                        found_applicants_map: Dict[int, ApplicantData],
+                        doc_term_frequencies: Dict[int, Dict[str, int]]):
+        """
+        Adds the keyword matches of one CV to its applicant's search result.
+        """
+        applicant_data = self.cv_database[doc_index]
+        if applicant_data["id"] not in found_applicants_map:
+            found_applicants_map[applicant_data["id"]] = self._new_applicant_data(applicant_data)
+        applicant = found_applicants_map[applicant_data["id"]]
+        for keyword, count in matches.items():
+            doc_term_frequencies.setdefault(doc_index, {})[keyword] = count
+            keyword_label = f"{keyword.capitalize()}{label_suffix}"
+            applicant.matched_keywords[keyword_label] = applicant.matched_keywords.get(keyword_label, 0) + count
+            applicant.total_matches += count
+
+    def _run_sharded_search(self, keywords: List[str], algorithm: str, top_n: int,
+                            found_applicants_map: Dict[int, ApplicantData],
+                            doc_term_frequencies: Dict[int, Dict[str, int]],
+                            keyword_idf: Dict[str, float],
+                            token: CancellationToken, doc_indexes: Optional[List[int]] = None) -> Tuple[str, str]:
+        """
+        Runs the keyword search on the worker processes and records their
+        per-text matches for every CV using the text, publishing the exact-only
+        results before the fuzzy stage. keyword_idf is filled as in
+        _run_keyword_search. Returns the timing labels.
+        """
+        text_groups = self._text_groups(doc_indexes)
+        workers_label = f"{self.search_executor.num_workers} workers"
+
+        def on_exact_matches(matches: TextMatches, exact_ms: float):
+            interim_map: Dict[int, ApplicantData] = {}
+            interim_frequencies: Dict[int, Dict[str, int]] = {}
+            self._record_text_matches(matches, text_groups, "", interim_map, interim_frequencies)
+            interim_idf: Dict[str, float] = {}
+            self._fill_keyword_idf(interim_idf, interim_frequencies, len(text_groups))
+            self._publish_results(token, self._rank_results(interim_map, interim_frequencies, interim_idf)[:top_n],
+                                  f"{exact_ms:.2f} ms ({workers_label})", "running...")
+
+        result = self.search_executor.search(
+            keywords, algorithm, LEVENSHTEIN_THRESHOLD, token=token, on_exact_matches=on_exact_matches,
+            text_ids=None if doc_indexes is None else list(text_groups)
+        )
+        self._record_text_matches(result.exact_matches, text_groups, "", found_applicants_map, doc_term_frequencies)
+        self._record_text_matches(result.fuzzy_matches, text_groups, " (fuzzy)",
+                                  found_applicants_map, doc_term_frequencies)
+        self._fill_keyword_idf(keyword_idf, doc_term_frequencies, len(text_groups), set(result.unfound_keywords))
+
+        exact_match_time = (f"{result.exact_ms:.2f} ms ({workers_label}, "
+                            f"{result.exact_skipped} of {len(text_groups)} distinct texts skipped)")
+        if result.unfound_keywords:
+            fuzzy_match_time = (f"{result.fuzzy_ms:.2f} ms "
+                                f"({result.fuzzy_skipped} of {len(text_groups)} distinct texts skipped)")
+        else:
+            fuzzy_match_time = "N/A (all found)"
+        return exact_match_time, fuzzy_match_time
+
+    def _record_text_matches(self, matches: TextMatches, text_groups: Dict[int, List[int]], label_suffix: str,
+                             found_applicants_map: Dict[int, ApplicantData],
+                             doc_term_frequencies: Dict[int, Dict[str, int]]):
+        """
+        Records the matches of every matching text for the CVs of text_groups using it.
+        """
+        for text_id, counts in matches.items():
+            for doc_index in text_groups.get(text_id, ()):
+                self._record_matches(doc_index, counts, label_suffix, found_applicants_map, doc_term_frequencies)
+
+    def _run_query_plan_search(self, query_plan: QueryNode, found_applicants_map: Dict[int, ApplicantData],
+                               doc_term_frequencies: Dict[int, Dict[str, int]],
+                               token: CancellationToken, doc_indexes: Optional[List[int]] = None) -> Tuple[str, str]:
+        """
+        Evaluates a boolean/phrase query on the inverted index, which is keyed by
+        text id, and maps the matching texts to the CVs using them, restricted
+        to the filtered doc_indexes if given. Only the texts in the final
+        postings list are visited to collect counts. Returns the timing labels.
+        """
+        token.check()
+        start_exact_time = time.perf_counter()
+        evaluator = QueryEvaluator(self.inverted_index)
+        matching_texts = evaluator.evaluate(query_plan)
+        text_groups = self._text_groups(doc_indexes)
+        matching_docs = 0
+
+        for text_id in matching_texts:
+            group = text_groups.get(text_id)
+            if not group:
+                continue
+            term_frequencies = evaluator.match_counts(query_plan, text_id)
+            for doc_index in group:
+                applicant_data = self.cv_database[doc_index]
+                doc_term_frequencies[doc_index] = term_frequencies
+                matching_docs += 1
+
+                if applicant_data["id"] not in found_applicants_map:
+                    found_applicants_map[applicant_data["id"]] = self._new_applicant_data(applicant_data)
+                applicant = found_applicants_map[applicant_data["id"]]
+                for label, count in term_frequencies.items():
+                    applicant.matched_keywords[label.capitalize()] = applicant.matched_keywords.get(label.capitalize(), 0) + count
+                    applicant.total_matches += count
+
+        end_exact_time = time.perf_counter()
+        exact_match_time = f"{(end_exact_time - start_exact_time) * 1000:.2f} ms ({matching_docs} docs via postings)"
+        return exact_match_time, "N/A (query language)"
+
+    def _new_applicant_data(self, applicant_data: Dict[str, Any]) -> ApplicantData:
+        """
+        Creates an empty search result for a CV entry of the corpus.
+        """
+        return ApplicantData(id=applicant_data["id"], name=applicant_data["name"], cv_path=applicant_data["cv_path"], email=applicant_data["email"], phone=applicant_data["phone"], address=applicant_data["address"], birthdate=applicant_data["birthdate"], matched_keywords={}, total_matches=0, application_role=applicant_data.get("role"))
+
     def load_applicant_details(self, applicant: ApplicantData):
         """
-        Populates detailed information for an applicant by parsing their CV text.
+        Populates detailed information for an applicant from their first CV. The CV
+        is looked up by applicant id and the parsed details come from the detail cache,
+        so only the first view of a CV text parses it.
         """
-        full_applicant_data = next((item for item in self.cv_database if item["id"] == applicant.id), None)
+        extracted_data = self._applicant_details(applicant.id)
 
-        if not full_applicant_data:
+        if extracted_data is None:
             applicant.summary = "Applicant data not found."
             applicant.skills = []
             applicant.job_history = []
             applicant.education = []
             return
-
-        cv_text = full_applicant_data.get("cv_text", "")
-        extracted_data = extract_info_from_text(cv_text)
         
         applicant.summary = extracted_data.get("summary", "Summary could not be extracted.")
         applicant.skills = extracted_data.get("skills", [])
         applicant.job_history = extracted_data.get("experience", [])
         applicant.education = extracted_data.get("education", [])
     
+    def _applicant_details(self, applicant_id: int) -> Optional[Dict[str, Any]]:
+        doc_index = self.first_doc_by_applicant.get(applicant_id)
+        if doc_index is None:
+            return None
+        cv_entry = self.cv_database[doc_index]
+        text_id = cv_entry["text_id"]
+        return self.detail_cache.get_or_extract(self.text_store.hashes[text_id], self.text_store.texts[text_id])
+
+    def _start_detail_precompute(self, token: CancellationToken, results: List[ApplicantData]):
+        """
+        Extracts the summary details of the shown results on a background thread,
+        so opening a summary is a cache lookup. Stops when a new search starts.
+        """
+        if not PRECOMPUTE_DETAILS or not results:
+            return
+
+        def precompute():
+            for applicant in results:
+                if token.cancelled:
+                    return
+                self._applicant_details(applicant.id)
+
+        threading.Thread(target=precompute, daemon=True).start()
+
     def open_pdf_file(self, cv_path: str):
         """
         Opens a PDF file using the default system viewer.
@@ -876,6 +1345,8 @@ def main(page: ft.Page):
             print("Closing database connection...")
             if app.db:
                 app.db.close()
+            if app.search_executor:
+                app.search_executor.shutdown()
             page.window_destroy()
 
     page.window_prevent_close = True
@@ -0,0 +1,129 @@
+# src/async_database.py
+
+import asyncio
+import functools
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional
+
+from storage import StorageError
+
+# Seconds a query may take before its awaiter gives up; None waits forever
+DEFAULT_QUERY_TIMEOUT = float(os.getenv('DB_QUERY_TIMEOUT', '15'))
+# Worker threads when the backend has no connection pool (SQLite)
+DEFAULT_ASYNC_WORKERS = 4
+
+
+class QueryTimeoutError(StorageError):
+    """Raised when an awaited query does not finish within its timeout."""
+
+
+class AsyncApplicantDatabase:
+    """
+    asyncio facade over an ApplicantDatabaseManager.
+
+    Every manager method is available as a coroutine with the same name and
+    arguments (`await adb.get_applicant_by_id(1)`). The blocking call runs on
+    a dedicated thread pool sized to the connection pool, so the event loop
+    (a Flet handler, an HTTP endpoint) never waits on a database round trip
+    and queries awaited together run on separate connections.
+
+    A query that exceeds its timeout raises QueryTimeoutError in the awaiter.
+    The statement itself cannot be interrupted from Python: it keeps its
+    worker thread and connection until the server finishes it.
+    """
+    def __init__(self, db, workers: Optional[int] = None,
+                 timeout: Optional[float] = DEFAULT_QUERY_TIMEOUT):
+        """
+        Args:
+            db: The ApplicantDatabaseManager to wrap.
+            workers: Threads running queries (default: the backend's pool size).
+            timeout: Default per-query timeout in seconds, None for no limit.
+        """
+        self.db = db
+        self.timeout = timeout
+        self.workers = workers or getattr(db.backend, "pool_size", None) or DEFAULT_ASYNC_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="db-query")
+
+    async def run(self, function: Callable[..., Any], *args, timeout: Optional[float] = ..., **kwargs) -> Any:
+        """
+        Runs a blocking callable on the query threads and awaits its result.
+
+        Args:
+            function: Callable taking the manager's connections, e.g. a manager method.
+            timeout: Seconds to wait; defaults to the facade's timeout, None waits forever.
+
+        Raises:
+            QueryTimeoutError: If the call does not finish in time
+        """
+        if timeout is ...:
+            timeout = self.timeout
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            name = getattr(function, "__name__", repr(function))
+            raise QueryTimeoutError(f"{name} did not finish within {timeout:.1f} s") from None
+
+    async def gather(self, *calls: Awaitable[Any], return_exceptions: bool = False) -> List[Any]:
+        """
+        Awaits several queries at once; they run concurrently on the query threads.
+
+        Example:
+            applicant, applications = await adb.gather(
+                adb.get_applicant_by_id(7), adb.get_applicant_applications(7))
+        """
+        return list(await asyncio.gather(*calls, return_exceptions=return_exceptions))
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        # Only called for names the facade itself does not define
+        if name.startswith("_") or name.startswith("iter_"):
+            # Generators would run on the event loop thread once iterated
+            raise AttributeError(f"{type(self).__name__} does not expose {name!r}")
+        if "db" not in self.__dict__:
+            raise AttributeError(name)
+        method = getattr(self.db, name)
+        if not callable(method):
+            raise AttributeError(f"{name!r} is not a database method")
+
+        @functools.wraps(method)
+        async def call(*args, timeout: Optional[float] = ..., **kwargs):
+            return await self.run(method, *args, timeout=timeout, **kwargs)
+        return call
+
+    async def close(self, close_database: bool = True):
+        """Stops the query threads, waiting for running statements, and closes the manager's connections."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True, cancel_futures=True))
+        if close_database:
+            self.db.close()
+
+    async def __aenter__(self) -> "AsyncApplicantDatabase":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+# Usage: python async_database.py [applicant_id ...]
+# Fetches the applicants and their applications, the two batched queries concurrently.
+if __name__ == '__main__':
+    from database import ApplicantDatabaseManager
+
+    async def show(applicant_ids: List[int]):
+        async with AsyncApplicantDatabase(ApplicantDatabaseManager()) as adb:
+            if not await adb.connect():
+                sys.exit(1)
+            start = time.perf_counter()
+            applicants, applications = await adb.gather(adb.get_applicants_by_ids(applicant_ids),
+                                                        adb.get_applications_by_applicant_ids(applicant_ids))
+            elapsed = (time.perf_counter() - start) * 1000
+            for applicant_id in applicant_ids:
+                applicant = (applicants or {}).get(applicant_id)
+                print(f"{applicant_id}: {applicant} ({len((applications or {}).get(applicant_id, []))} applications)")
+            print(f"2 queries in {elapsed:.1f} ms on {adb.workers} threads")
+
+    asyncio.run(show([int(arg) for arg in sys.argv[1:]] or [1, 2, 3]))
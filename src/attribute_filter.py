@@ -0,0 +1,166 @@
+# src/attribute_filter.py
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """
+    Attribute restrictions of a search. Empty fields do not restrict.
+
+    Attributes:
+        roles: Application roles to keep (any of them).
+        min_age: Smallest applicant age to keep, in years.
+        max_age: Largest applicant age to keep, in years.
+    """
+    roles: Tuple[str, ...] = ()
+    min_age: Optional[int] = None
+    max_age: Optional[int] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.roles and self.min_age is None and self.max_age is None
+
+    def __str__(self) -> str:
+        parts = []
+        if self.roles:
+            parts.append("role=" + "|".join(sorted(self.roles)))
+        if self.min_age is not None or self.max_age is not None:
+            low = "" if self.min_age is None else self.min_age
+            high = "" if self.max_age is None else self.max_age
+            parts.append(f"age={low}-{high}")
+        return " ".join(parts)
+
+
+def age_from_birthdate(birthdate: str, today: Optional[date] = None) -> Optional[int]:
+    """
+    Computes an age in whole years from a "YYYY-MM-DD" birthdate.
+
+    Returns:
+        Optional[int]: The age, or None if the birthdate is missing or malformed
+    """
+    try:
+        born = datetime.strptime(str(birthdate)[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    today = today or date.today()
+    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+
+
+def bits_to_indexes(mask: int) -> List[int]:
+    """Returns the positions of the set bits of a mask in ascending order."""
+    bits = bin(mask)[:1:-1]
+    indexes: List[int] = []
+    position = bits.find("1")
+    while position != -1:
+        indexes.append(position)
+        position = bits.find("1", position + 1)
+    return indexes
+
+
+class AttributeIndex:
+    """
+    Per-attribute bitsets over the document indexes of the CV corpus, where
+    bit i stands for document i. Combining filters is a bitwise AND of the
+    attribute masks, and a single-role filter is answered straight from the
+    role's partition list.
+
+    Ages are computed once, when a document is added.
+
+    Attributes:
+        role_bits (Dict[str, int]): Documents of each application role.
+        age_bits (Dict[int, int]): Documents of each applicant age.
+        role_partitions (Dict[str, List[int]]): Sorted document indexes per role.
+        all_bits (int): Every indexed document.
+    """
+    def __init__(self, today: Optional[date] = None):
+        self.today = today or date.today()
+        self.role_bits: Dict[str, int] = {}
+        self.age_bits: Dict[int, int] = {}
+        self.role_partitions: Dict[str, List[int]] = {}
+        self.all_bits = 0
+        self._doc_attributes: Dict[int, Tuple[Optional[str], Optional[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_attributes)
+
+    def roles(self) -> List[str]:
+        return sorted(self.role_bits)
+
+    def add_document(self, doc_index: int, role: Optional[str], birthdate: Optional[str]):
+        """
+        Args:
+            doc_index: Key of the document in the search corpus.
+            role: Application role of the CV.
+            birthdate: Birthdate of the applicant, "YYYY-MM-DD".
+        """
+        if doc_index in self._doc_attributes:
+            self.remove_document(doc_index)
+
+        bit = 1 << doc_index
+        age = age_from_birthdate(birthdate, self.today) if birthdate else None
+        self._doc_attributes[doc_index] = (role, age)
+        self.all_bits |= bit
+        if role:
+            self.role_bits[role] = self.role_bits.get(role, 0) | bit
+            partition = self.role_partitions.setdefault(role, [])
+            if partition and partition[-1] > doc_index:
+                partition.append(doc_index)
+                partition.sort()
+            else:
+                partition.append(doc_index)
+        if age is not None:
+            self.age_bits[age] = self.age_bits.get(age, 0) | bit
+
+    def remove_document(self, doc_index: int):
+        """Removes a document from every bitset. Unknown indexes are ignored."""
+        if doc_index not in self._doc_attributes:
+            return
+        role, age = self._doc_attributes.pop(doc_index)
+        bit = 1 << doc_index
+        self.all_bits &= ~bit
+        if role:
+            self.role_bits[role] &= ~bit
+            self.role_partitions[role].remove(doc_index)
+            if not self.role_bits[role]:
+                del self.role_bits[role]
+                del self.role_partitions[role]
+        if age is not None:
+            self.age_bits[age] &= ~bit
+            if not self.age_bits[age]:
+                del self.age_bits[age]
+
+    def mask(self, filters: SearchFilters) -> int:
+        """
+        Returns the bitset of documents passing all filters.
+        """
+        result = self.all_bits
+        if filters.roles:
+            role_mask = 0
+            for role in filters.roles:
+                role_mask |= self.role_bits.get(role, 0)
+            result &= role_mask
+        if filters.min_age is not None or filters.max_age is not None:
+            low = filters.min_age if filters.min_age is not None else 0
+            high = filters.max_age if filters.max_age is not None else 200
+            age_mask = 0
+            for age, bits in self.age_bits.items():
+                if low <= age <= high:
+                    age_mask |= bits
+            result &= age_mask
+        return result
+
+    def doc_indexes(self, filters: SearchFilters) -> Optional[List[int]]:
+        """
+        Returns the sorted document indexes a filtered search has to scan.
+
+        Returns:
+            Optional[List[int]]: None when the filters are empty (scan everything)
+        """
+        if filters.is_empty:
+            return None
+        if len(filters.roles) == 1 and filters.min_age is None and filters.max_age is None:
+            return list(self.role_partitions.get(filters.roles[0], []))
+        return bits_to_indexes(self.mask(filters))
@@ -0,0 +1,240 @@
+# src/bulk_seed.py
+
+import csv
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from storage import DatabaseError
+
+DEFAULT_SEED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "tubes3_seeding.sql")
+# Rows per multi-row INSERT; 500 rows of 6 columns stay far below the
+# placeholder limits of both drivers
+INSERT_BATCH_ROWS = 500
+
+# Tables a seed replaces, children first so deleting never orphans a row
+SEEDED_TABLES = ("ApplicationSkill", "JobHistory", "EducationHistory", "CvExtraction",
+                 "ApplicationDetail", "ApplicantProfile")
+
+# One SQL token: whitespace, a comment, a quoted string (with '' or \' escapes),
+# punctuation, or a bare word (keyword, identifier, number, NULL)
+SQL_TOKEN_PATTERN = re.compile(r"\s+|--[^\n]*|'(?:[^'\\]|\\.|'')*'|[(),;]|[^\s(),;']+")
+SQL_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+
+# (table, columns, row)
+SeedRow = Tuple[str, Tuple[str, ...], Tuple[Any, ...]]
+
+
+@dataclass
+class SeedReport:
+    """
+    Outcome of one bulk load.
+
+    Attributes:
+        rows: Rows inserted per table, in load order.
+        statements: Multi-row INSERT statements executed.
+        seconds: Wall-clock duration, parsing included.
+    """
+    rows: Dict[str, int] = field(default_factory=dict)
+    statements: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+    def __str__(self) -> str:
+        rate = self.total_rows / self.seconds if self.seconds else 0.0
+        tables = ", ".join(f"{count} {table}" for table, count in self.rows.items())
+        return (f"Seed data loaded: {tables} ({self.total_rows} rows in {self.statements} statements, "
+                f"{self.seconds:.3f} s, {rate:,.0f} rows/s)")
+
+
+def _sql_tokens(lines: Iterable[str]) -> Iterator[str]:
+    """Tokens of a SQL dump read line by line; a string literal may span lines."""
+    pending = ""
+    for line in lines:
+        text = pending + line
+        position = 0
+        while position < len(text):
+            match = SQL_TOKEN_PATTERN.match(text, position)
+            if match is None:
+                break
+            position = match.end()
+            token = match.group()
+            if not token[0].isspace() and not token.startswith("--"):
+                yield token
+        # An unterminated quote does not match; carry it into the next line
+        pending = text[position:]
+    if pending.strip():
+        raise ValueError(f"unterminated string literal in seed file: {pending[:40]!r}")
+
+
+def _sql_value(token: str) -> Any:
+    if token.startswith("'"):
+        body = token[1:-1].replace("''", "'")
+        return re.sub(r"\\(.)", lambda match: SQL_ESCAPES.get(match.group(1), match.group(1)), body)
+    if token.upper() == "NULL":
+        return None
+    try:
+        return int(token)
+    except ValueError:
+        try:
+            return float(token)
+        except ValueError:
+            return token
+
+
+def iter_sql_rows(path: str) -> Iterator[SeedRow]:
+    """
+    Streams the rows of the INSERT ... VALUES statements in a MySQL dump such
+    as tubes3_seeding.sql. Every other statement (SET, DROP, CREATE) is skipped:
+    the tables come from the storage backend's own DDL.
+    """
+    with open(path, encoding="utf-8") as sql_file:
+        tokens = _sql_tokens(sql_file)
+        for token in tokens:
+            if token.upper() != "INSERT":
+                continue
+            word = next(tokens)
+            if word.upper() == "INTO":
+                word = next(tokens)
+            table = word.strip("`")
+
+            columns: List[str] = []
+            word = next(tokens)
+            if word == "(":
+                for word in tokens:
+                    if word == ")":
+                        break
+                    if word != ",":
+                        columns.append(word.strip("`"))
+                word = next(tokens)
+            if word.upper() not in ("VALUES", "VALUE"):
+                raise ValueError(f"unsupported INSERT into {table} in seed file")
+
+            for word in tokens:
+                if word == ";":
+                    break
+                if word != "(":
+                    continue
+                row = []
+                for value in tokens:
+                    if value == ")":
+                        break
+                    if value != ",":
+                        row.append(_sql_value(value))
+                yield table, tuple(columns), tuple(row)
+
+
+def iter_csv_rows(path: str, table: Optional[str] = None) -> Iterator[SeedRow]:
+    """
+    Streams the rows of a CSV file with a header row of column names. The
+    table defaults to the file name (ApplicantProfile.csv); empty fields load
+    as NULL.
+    """
+    table = table or os.path.splitext(os.path.basename(path))[0]
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        reader = csv.reader(csv_file)
+        columns = tuple(next(reader))
+        for row in reader:
+            yield table, columns, tuple(value if value != "" else None for value in row)
+
+
+def iter_seed_rows(path: str) -> Iterator[SeedRow]:
+    """Rows of a .sql dump or a .csv file, by extension."""
+    if path.lower().endswith(".csv"):
+        return iter_csv_rows(path)
+    return iter_sql_rows(path)
+
+
+def _batches(rows: Iterable[SeedRow],
+             batch_rows: int) -> Iterator[Tuple[str, Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """Groups consecutive rows of the same table and columns into batches of at most batch_rows."""
+    key = None
+    batch: List[Tuple[Any, ...]] = []
+    for table, columns, row in rows:
+        if (table, columns) != key or len(batch) >= batch_rows:
+            if batch:
+                yield key[0], key[1], batch
+            key, batch = (table, columns), []
+        batch.append(row)
+    if batch:
+        yield key[0], key[1], batch
+
+
+def bulk_seed(db, paths: Sequence[str] = (DEFAULT_SEED_PATH,),
+              batch_rows: int = INSERT_BATCH_ROWS) -> Optional[SeedReport]:
+    """
+    Replaces the applicant data with the rows streamed from seed files.
+
+    Everything runs in one transaction under the backend's bulk_load
+    settings (foreign key and unique checks off), and rows are sent as
+    multi-row INSERTs of batch_rows rows. A failure rolls the whole load back
+    and leaves the previous data in place.
+
+    Args:
+        db: A connected ApplicantDatabaseManager.
+        paths: .sql dumps and/or .csv files, loaded in order (parents first).
+        batch_rows: Rows per INSERT statement.
+
+    Returns:
+        SeedReport: Rows per table and throughput, or None if the load failed
+    """
+    start = time.perf_counter()
+    report = SeedReport()
+    backend = db.backend
+    connection = cursor = None
+    try:
+        connection = db._acquire()
+        cursor = db.query_timings.cursor(connection.cursor(), "bulk_seed")
+        with backend.bulk_load(connection):
+            for table in SEEDED_TABLES:
+                if backend.table_exists(cursor, table):
+                    cursor.execute(f"DELETE FROM {table}")
+            # No AUTO_INCREMENT reset: on MySQL that is DDL and would commit the
+            # deletes early. The seed rows carry their ids anyway.
+
+            for path in paths:
+                for table, columns, rows in _batches(iter_seed_rows(path), batch_rows):
+                    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+                    query = (f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+                             + ", ".join([row_placeholders] * len(rows)))
+                    cursor.execute(backend.sql(query), [value for row in rows for value in row])
+                    report.rows[table] = report.rows.get(table, 0) + len(rows)
+                    report.statements += 1
+
+            # Recounted in the same transaction; before the schema migration creates them, they don't exist yet
+            if backend.table_exists(cursor, "RoleStatistics"):
+                db._rebuild_statistics(cursor)
+            connection.commit()
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    except (*DatabaseError, OSError, ValueError) as e:
+        print(f"Data seeding error: {e}")
+        return None
+    finally:
+        # Releasing rolls back a failed load
+        if cursor:
+            cursor.close()
+        if connection:
+            backend.release(connection)
+
+
+# Usage: python bulk_seed.py [seed.sql | Table.csv ...]
+if __name__ == '__main__':
+    from database import ApplicantDatabaseManager
+
+    db = ApplicantDatabaseManager()
+    if not db.connect():
+        sys.exit(1)
+    try:
+        report = db.seed_all_data(sys.argv[1:] or None)
+        sys.exit(0 if report else 1)
+    finally:
+        db.disconnect()
@@ -1,19 +1,70 @@
 # src/cv_extractor.py
 
 import re
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional
 from pdf_extractor import extract_text_pypdf2
 
+# Section headers in English and Indonesian. A header line holds the header
+# word with at most two capitalized words before and three after it
+# ("Professional Summary", "Education and Training", "Pengalaman Kerja") and
+# ends at a colon or the end of the line, so prose such as "I have experience
+# in ..." is not taken for a header. A section runs until the next header.
+SECTION_HEADERS: Dict[str, List[str]] = {
+    "summary": ["summary", "profile", "objective", "ringkasan", "profil", "tentang saya"],
+    "skills": ["skills", "skill highlights", "keahlian", "keterampilan", "kemampuan"],
+    "experience": ["experience", "work history", "employment history", "pengalaman", "riwayat pekerjaan"],
+    "education": ["education", "pendidikan", "riwayat pendidikan"],
+    "other": ["projects", "proyek", "certifications", "sertifikasi", "awards", "penghargaan",
+              "languages", "bahasa", "interests", "hobi", "references", "referensi"],
+}
+
+# Capitalized word or connector allowed around a header word
+HEADER_WORD = r'(?:(?-i:[A-Z])[^\W\d_]*|&|(?-i:and|of|dan))'
+# The lookahead rejects blank and punctuation-led lines before the header
+# alternation is tried, which keeps texts made of short lines cheap to scan.
+SECTION_HEADER_PATTERN = re.compile(
+    r'^[ \t]*(?=[^\W\d_]|&)(?:' + HEADER_WORD + r'[ \t]+){0,2}(?:' + '|'.join(
+        f'(?P<{section}>' + '|'.join(re.escape(h) for h in sorted(headers, key=len, reverse=True)) + ')'
+        for section, headers in SECTION_HEADERS.items()
+    ) + r')\b(?:[ \t]+' + HEADER_WORD + r'){0,3}[ \t]*(?::|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+SECTION_LEAD_PATTERN = re.compile(r'\s*:?\s*')
+# Leading whitespace is only tried where a whitespace run starts, so long runs
+# without a bullet are scanned once instead of once per position
+BULLET_PATTERN = re.compile(r'(?<!\s)\s*[•●]\s*|[•●]\s*')
+SKILL_SPLIT_PATTERN = re.compile(r'[\n,•-]\s*')
+
+# Experience and education are parsed with a forward cursor instead of one
+# pattern with nested unbounded runs, so every character is looked at a
+# bounded number of times and long or oddly formatted CVs stay linear.
+# Every pattern below is either anchored at a given position or a single
+# character class, so none of them can backtrack over more than one run.
+POSITION_RUN_PATTERN = re.compile(r'[A-Za-z][A-Za-z \t,.-]*')
+ROLE_PATTERN = re.compile(r'(?:developer|engineer|manager|analyst|intern|specialist|scientist)\b', re.IGNORECASE)
+COMPANY_LINK_PATTERN = re.compile(r'\s*(?:(?:at|di)\b|@)?\s*', re.IGNORECASE)
+COMPANY_RUN_PATTERN = re.compile(r'[A-Za-z][A-Za-z \t,.]*')
+COMPANY_SUFFIXES = ("inc.", "corp.", "solutions", "agency", "net")
+PERIOD_PATTERN = re.compile(r'\s*\(([^)\n]*)\)')
+
+DEGREE_PATTERN = re.compile(
+    r'\b(B\.?Sc\.?|M\.?Sc\.?|Bachelor|Master|Sarjana|Ph\.?D)[ \t]+(?:(?:of|in)[ \t]+)?',
+    re.IGNORECASE
+)
+INSTITUTION_SUFFIXES = ("university", "institute of technology")
+INSTITUTION_PREFIXES = ("universitas", "sma")
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
-    (PLACEHOLDER) Extract text content from a PDF file.
-    TODO: Implement
+    Extracts the text of every page of a PDF file with PyPDF2.
 
     Args:
         pdf_path (str): Path to the PDF file to extract text from
 
     Returns:
-        str: Extracted text content from the PDF
+        str: Text of the pages joined in order, or an empty string if the file
+             cannot be read or holds no extractable text
     """
     text = extract_text_pypdf2(pdf_path)
     if text:
@@ -28,16 +79,9 @@ def extract_summary(text: str) -> str:
         text (str): The full CV text to extract summary from
 
     Returns:
-        str: Extracted summary text or "Summary not found" if no summary is found
+        str: First paragraph of the summary section or "Summary not found." if the CV has none
     """
-    pattern = re.compile(
-        r'(?:summary|profile|objective|ringkasan)\s*:?\s*\n?(.*?)(?:\n\n|\n\s*(?:skills|experience|education|keahlian|pengalaman|pendidikan))', 
-        re.IGNORECASE | re.DOTALL
-    )
-    match = pattern.search(text)
-    if match:
-        return match.group(1).strip().replace('\n', ' ')
-    return "Summary not found."
+    return _summary_from_sections(segment_sections(text))
 
 def extract_skills(text: str) -> List[str]:
     """
@@ -47,23 +91,54 @@ def extract_skills(text: str) -> List[str]:
         text (str): The full CV text to extract skills from
 
     Returns:
-        List[str]: List of extracted skills, empty list if no skills are found
-    """
-    pattern = re.compile(
-        r'(?:skills|keahlian)\s*:?\s*\n?([\s\S]*?)(?:\n\n|\n\s*(?:experience|education|projects|pengalaman|pendidikan))', 
-        re.IGNORECASE
-    )
-    match = pattern.search(text)
-    if match:
-        skills_text = match.group(1).strip()
-        skills = re.split(r'[\n,•-]\s*', skills_text)
-        return [skill.strip() for skill in skills if skill.strip()]
-    return []
+        List[str]: Skills in the first paragraph of the skills section, empty list if the CV has none
+    """
+    return _skills_from_sections(segment_sections(text))
+
+def _summary_from_sections(sections: Dict[str, List[str]]) -> str:
+    if "summary" not in sections:
+        return "Summary not found."
+    return _first_paragraph(sections["summary"][0]).strip().replace('\n', ' ') or "Summary not found."
+
+def _skills_from_sections(sections: Dict[str, List[str]]) -> List[str]:
+    if "skills" not in sections:
+        return []
+    return _split_skills(_first_paragraph(sections["skills"][0]))
+
+def _split_skills(skills_text: str) -> List[str]:
+    skills = SKILL_SPLIT_PATTERN.split(skills_text.strip())
+    return [skill.strip() for skill in skills if skill.strip()]
+
+def _last_role_end(text: str, start: int, end: int) -> Optional[int]:
+    role_end = None
+    for match in ROLE_PATTERN.finditer(text, start, end):
+        role_end = match.end()
+    return role_end
+
+def _has_word_suffix(value: str, suffixes) -> bool:
+    lowered = value.lower()
+    for suffix in suffixes:
+        if lowered.endswith(suffix):
+            before = len(value) - len(suffix) - 1
+            return before < 0 or not value[before].isalpha()
+    return False
+
+def _has_word_prefix(value: str, prefixes) -> bool:
+    lowered = value.lower()
+    for prefix in prefixes:
+        if lowered.startswith(prefix):
+            return len(value) == len(prefix) or not value[len(prefix)].isalpha()
+    return False
 
 def extract_experience(text: str) -> List[Dict[str, str]]:
     """
     Extracts work experience (position, company, dates) from the CV text.
 
+    An entry is a position ending in a role word ("Senior Software Engineer"),
+    optionally "at"/"@"/"di", a company ending in Inc./Corp./Solutions/Agency/Net
+    on the same or the next line, then the period in parentheses. Runs in
+    time linear in the length of the text.
+
     Args:
         text (str): The full CV text to extract experience from
 
@@ -72,23 +147,44 @@ def extract_experience(text: str) -> List[Dict[str, str]]:
             each with keys: 'position', 'company', 'period'
     """
     experiences: List[Dict[str, str]] = []
-    pattern = re.compile(
-        r'([A-Z][a-zA-Z\s,.-]+(?:developer|engineer|manager|analyst|intern|specialist|scientist))\s*(?:at|@|di)?\s*\n?([A-Z][a-zA-Z\s,.]+ Inc\.|Corp\.|Solutions|Agency|Net)\s*\n?\((.*?)\)',
-        re.IGNORECASE | re.MULTILINE
-    )
-    matches = pattern.findall(text)
-    for match in matches:
+    pos = 0
+    while True:
+        run = POSITION_RUN_PATTERN.search(text, pos)
+        if not run:
+            break
+        pos = run.end()
+        role_end = _last_role_end(text, run.start(), run.end())
+        if role_end is None:
+            continue
+
+        link_end = COMPANY_LINK_PATTERN.match(text, role_end).end()
+        company = COMPANY_RUN_PATTERN.match(text, link_end)
+        if not company:
+            continue
+        company_text = company.group().rstrip()
+        if not _has_word_suffix(company_text, COMPANY_SUFFIXES):
+            continue
+        period = PERIOD_PATTERN.match(text, company.start() + len(company_text))
+        if not period:
+            continue
+
         experiences.append({
-            "position": match[0].strip(),
-            "company": match[1].strip(),
-            "period": match[2].strip()
+            "position": text[run.start():role_end].strip(),
+            "company": company_text.strip(),
+            "period": period.group(1).strip()
         })
+        pos = period.end()
     return experiences
 
 def extract_education(text: str) -> List[Dict[str, str]]:
     """
     Extracts education history (degree, university, dates) from the CV text.
 
+    An entry is a degree and major on one line, the institution on the next
+    line (ending in University / Institute of Technology, containing Institut
+    Teknologi, or starting with Universitas / SMA), then the period in
+    parentheses. Runs in time linear in the length of the text.
+
     Args:
         text (str): The full CV text to extract education details from
 
@@ -96,32 +192,88 @@ def extract_education(text: str) -> List[Dict[str, str]]:
         List[Dict[str, str]]: List of dictionaries containing education details,
                               each with keys: 'degree', 'institution', 'period'
     """
-    educations: List[Dict[str, str]] = []    # Looks for degree, major, university, and dates
-    pattern = re.compile(
-        r'(B\.?Sc\.?|M\.?Sc\.?|Bachelor|Master|Sarjana|Ph\.?D)\s(?:of|in)?\s(.*?)\n(.*?University|.*?Institute of Technology|.*?Institut Teknologi.*?|Universitas.*?|SMA.*?)\s*\n?\((.*?)\)',
-        re.IGNORECASE | re.MULTILINE
-    )
-    matches = pattern.findall(text)
-    for match in matches:
-        degree = f"{match[0].strip()} in {match[1].strip()}"
+    educations: List[Dict[str, str]] = []
+    pos = 0
+    while True:
+        degree = DEGREE_PATTERN.search(text, pos)
+        if not degree:
+            break
+        major_end = text.find('\n', degree.end())
+        if major_end == -1:
+            break
+        # Every later degree on this line shares its institution line, so a
+        # failed line is skipped as a whole
+        pos = major_end
+
+        institution_start = major_end + 1
+        institution_end = text.find('\n', institution_start)
+        if institution_end == -1:
+            institution_end = len(text)
+        paren = text.find('(', institution_start, institution_end)
+        if paren != -1:
+            institution_end = paren
+        institution = text[institution_start:institution_end].strip()
+        if not (_has_word_suffix(institution, INSTITUTION_SUFFIXES)
+                or "institut teknologi" in institution.lower()
+                or _has_word_prefix(institution, INSTITUTION_PREFIXES)):
+            continue
+        period = PERIOD_PATTERN.match(text, institution_end)
+        if not period:
+            continue
+
         educations.append({
-            "degree": degree,
-            "institution": match[2].strip(),
-            "period": match[3].strip()
+            "degree": f"{degree.group(1).strip()} in {text[degree.end():major_end].strip()}",
+            "institution": institution,
+            "period": period.group(1).strip()
         })
+        pos = period.end()
     return educations
 
-def extract_info_from_text(full_text: str) -> Dict[str, Any]:
+def segment_sections(text: str) -> Dict[str, List[str]]:
     """
-    Takes a CV text string and returns all extracted information in a dictionary format.
-    The extracted information includes summary, skills, experience, and education details.
+    Splits a CV into its sections in a single pass over the text.
 
     Args:
-        full_text (str): The complete CV text to extract all information from
+        text (str): The full CV text
 
     Returns:
-        Dict[str, Any]: Dictionary containing all extracted information 
-                        with keys:'summary', 'skills', 'experience', 'education'
+        Dict[str, List[str]]: Body of every section found, by section kind
+                              ('summary', 'skills', 'experience', 'education', 'other'),
+                              in order of appearance
+    """
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    body_start = 0
+    for match in SECTION_HEADER_PATTERN.finditer(text):
+        if current is not None:
+            sections.setdefault(current, []).append(text[body_start:match.start()])
+        current = match.lastgroup
+        body_start = match.end()
+    if current is not None:
+        sections.setdefault(current, []).append(text[body_start:])
+    return sections
+
+def _first_paragraph(section: str) -> str:
+    body = section[SECTION_LEAD_PATTERN.match(section).end():]
+    end = body.find('\n\n')
+    return body if end == -1 else body[:end]
+
+def normalize_text(full_text: str) -> str:
+    """Puts every bullet on its own "- " line, so list items split like dash lists."""
+    return BULLET_PATTERN.sub('\n- ', full_text)
+
+def parse_sections(full_text: str, sections: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Runs the field parsers over the sections of a normalized CV text.
+    Summary and skills only come from their own sections; experience and education
+    fall back to searching the full text when their section header is missing.
+
+    Args:
+        full_text (str): The normalized CV text
+        sections (Dict[str, List[str]]): Output of segment_sections for that text
+
+    Returns:
+        Dict[str, Any]: Dictionary with keys:'summary', 'skills', 'experience', 'education'
     """
     if not full_text:
         return {
@@ -130,18 +282,33 @@ def extract_info_from_text(full_text: str) -> Dict[str, Any]:
             "experience": [],
             "education": []
         }
-      # Normalize text for consistency
-    full_text = re.sub(r'\s*[•●]\s*', '\n- ', full_text)
 
     extracted_data : Dict[str, Any]= {
-        "summary": extract_summary(full_text),
-        "skills": extract_skills(full_text),
-        "experience": extract_experience(full_text),
-        "education": extract_education(full_text)
+        "summary": _summary_from_sections(sections),
+        "skills": _skills_from_sections(sections),
+        "experience": extract_experience('\n'.join(sections["experience"]) if "experience" in sections else full_text),
+        "education": extract_education('\n'.join(sections["education"]) if "education" in sections else full_text)
     }
     
     return extracted_data
 
+def extract_info_from_text(full_text: str) -> Dict[str, Any]:
+    """
+    Takes a CV text string and returns all extracted information in a dictionary format.
+    The extracted information includes summary, skills, experience, and education details.
+    The text is normalized and segmented once and every section only goes to its own
+    field parser (see cv_pipeline for the same flow with per-stage timings).
+
+    Args:
+        full_text (str): The complete CV text to extract all information from
+
+    Returns:
+        Dict[str, Any]: Dictionary containing all extracted information 
+                        with keys:'summary', 'skills', 'experience', 'education'
+    """
+    full_text = normalize_text(full_text) if full_text else ""
+    return parse_sections(full_text, segment_sections(full_text))
+
 def extract_all_info_from_pdf(pdf_path: str) -> Dict[str, Any]:
     """
     Main integration function that extracts all information from a PDF file.
@@ -154,15 +321,48 @@ def extract_all_info_from_pdf(pdf_path: str) -> Dict[str, Any]:
         Dict[str, Any]: Dictionary containing all extracted information
                         with keys:'summary', 'skills', 'experience', 'education'
     """
-    full_text = extract_text_from_pdf(pdf_path)
-    summary = extract_summary(full_text)
-    skills = extract_skills(full_text)
-    experience = extract_experience(full_text)
-    education = extract_education(full_text)
-    data: Dict[str, str | List[str] | List[Dict[str,str]]] = {
-        "summary": summary,
-        "skills": skills,
-        "experience": experience,
-        "education": education
-    }
-    return data
\ No newline at end of file
+    return extract_info_from_text(extract_text_from_pdf(pdf_path))
+
+def benchmark_extraction(texts: List[str], repeats: int = 3) -> Dict[str, float]:
+    """
+    Compares the segmented extraction with running every field extractor on
+    its own over the full text, on the same CV texts.
+
+    Args:
+        texts (List[str]): CV texts to extract from
+        repeats (int): Runs per variant; the best run is kept
+
+    Returns:
+        Dict[str, float]: Seconds of the 'full_text' and 'segmented' variants and the 'speedup'
+    """
+    def full_text_fields(text: str):
+        text = normalize_text(text)
+        return (extract_summary(text), extract_skills(text), extract_experience(text), extract_education(text))
+
+    timings: Dict[str, float] = {}
+    for name, function in (("full_text", full_text_fields), ("segmented", extract_info_from_text)):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for text in texts:
+                function(text)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    timings["speedup"] = timings["full_text"] / timings["segmented"] if timings["segmented"] else 0.0
+    return timings
+
+
+# For benchmarking: python cv_extractor.py [pdf_root]
+if __name__ == '__main__':
+    import glob
+    import os
+    import sys
+
+    pdf_root = sys.argv[1] if len(sys.argv) > 1 else os.path.join("archive", "data", "data")
+    pdf_paths = sorted(glob.glob(os.path.join(pdf_root, "*", "*.pdf")))
+    cv_texts = [text for text in (extract_text_from_pdf(path) for path in pdf_paths) if text]
+    print(f"Extracting from {len(cv_texts)} CVs under {pdf_root}")
+
+    result = benchmark_extraction(cv_texts)
+    print(f"full text: {result['full_text']:.3f} s  segmented: {result['segmented']:.3f} s  "
+          f"speedup: {result['speedup']:.2f}x")
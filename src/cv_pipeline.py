@@ -0,0 +1,243 @@
+# src/cv_pipeline.py
+
+import hashlib
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cv_extractor import normalize_text, parse_sections, segment_sections
+from pdf_extractor import extract_text_pypdf2_bytes
+
+# Every CV goes through these stages in order. normalize, segment and parse
+# only feed field extraction; index receives the raw extracted text, which
+# is what the matchers search.
+STAGES = ("read", "extract", "normalize", "segment", "parse", "index")
+SLOWEST_KEPT = 5
+# Distinct files whose text is kept for identical files processed later
+REUSED_TEXTS_KEPT = 256
+
+
+@dataclass
+class StageMetrics:
+    """
+    Cost of one stage.
+
+    Attributes:
+        seconds: Time spent in the stage.
+        bytes_in: Size of the stage input (file bytes or UTF-8 text).
+        bytes_out: Size of the stage output.
+    """
+    seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    def add(self, other: "StageMetrics"):
+        self.seconds += other.seconds
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+
+
+@dataclass
+class ProcessedCV:
+    """
+    One CV after the pipeline.
+
+    Attributes:
+        path: Location of the PDF.
+        digest: SHA-256 of the file bytes.
+        text: Raw extracted text (what is indexed and searched).
+        normalized: Text with bullets normalized, input of segmentation.
+        sections: Output of segment_sections.
+        details: Output of parse_sections, None when parsing is off.
+        reused: True if the text came from an identical file processed before
+            (segment and parse still run on it).
+        metrics: Cost of every stage that ran, by stage name.
+    """
+    path: str
+    digest: bytes = b""
+    text: str = ""
+    normalized: str = ""
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+    details: Optional[Dict[str, Any]] = None
+    reused: bool = False
+    metrics: Dict[str, StageMetrics] = field(default_factory=dict)
+
+    @property
+    def seconds(self) -> float:
+        return sum(metrics.seconds for metrics in self.metrics.values())
+
+
+def _utf8_size(text: str) -> int:
+    return len(text.encode("utf-8", "surrogatepass"))
+
+
+class PipelineStats:
+    """
+    Per-stage totals over the documents a pipeline processed.
+
+    Attributes:
+        documents: Documents processed.
+        reused: Documents whose text came from an identical earlier file.
+        stages (Dict[str, StageMetrics]): Totals per stage.
+        slowest (List[Tuple[float, str]]): Slowest documents as (seconds, path).
+    """
+    def __init__(self):
+        self.documents = 0
+        self.reused = 0
+        self.stages: Dict[str, StageMetrics] = {name: StageMetrics() for name in STAGES}
+        self.slowest: List[Tuple[float, str]] = []
+
+    def add(self, path: str, metrics: Dict[str, StageMetrics], reused: bool = False):
+        self.documents += 1
+        self.reused += reused
+        seconds = 0.0
+        for name, stage_metrics in metrics.items():
+            self.stages[name].add(stage_metrics)
+            seconds += stage_metrics.seconds
+        self.slowest.append((seconds, path))
+        self.slowest.sort(reverse=True)
+        del self.slowest[SLOWEST_KEPT:]
+
+    def report(self) -> str:
+        total = sum(metrics.seconds for metrics in self.stages.values())
+        lines = [f"{self.documents} documents ({self.reused} reused), {total:.3f} s"]
+        lines.append(f"{'stage':<10}{'seconds':>10}{'share':>8}{'MB in':>10}{'MB out':>10}{'ms/doc':>10}")
+        for name, metrics in self.stages.items():
+            if not metrics.seconds and not metrics.bytes_in:
+                continue
+            share = metrics.seconds / total if total else 0.0
+            per_doc = metrics.seconds * 1000 / self.documents if self.documents else 0.0
+            lines.append(f"{name:<10}{metrics.seconds:>10.3f}{share:>8.1%}{metrics.bytes_in / 1e6:>10.2f}"
+                         f"{metrics.bytes_out / 1e6:>10.2f}{per_doc:>10.2f}")
+        for seconds, path in self.slowest:
+            lines.append(f"  slowest: {seconds * 1000:8.1f} ms  {path}")
+        return "\n".join(lines)
+
+
+class CvPipeline:
+    """
+    Staged CV processing shared by the GUI loader, the batch extraction job
+    and the command line: read -> extract -> normalize -> segment -> parse -> index.
+
+    Every stage is timed and its input/output sizes recorded, per document
+    (ProcessedCV.metrics) and in total (stats). Identical files are only
+    extracted and normalized once, as long as the earlier copy is among the
+    reused_texts_kept most recently seen files.
+    """
+    def __init__(self, parse: bool = True, indexer: Optional[Callable[[ProcessedCV, Any], Any]] = None,
+                 reused_texts_kept: int = REUSED_TEXTS_KEPT):
+        """
+        Args:
+            parse: Run normalize, segment and parse. The GUI only needs the
+                text at load time and parses lazily, so it turns this off.
+            indexer: Called with every processed CV and the context passed to
+                process as the index stage.
+            reused_texts_kept: Distinct files whose extracted text is kept for reuse.
+        """
+        self.parse = parse
+        self.indexer = indexer
+        self.reused_texts_kept = reused_texts_kept
+        self.stats = PipelineStats()
+        # File digest -> (text, normalized), least recently used first
+        self._texts_by_digest: "OrderedDict[bytes, Tuple[str, str]]" = OrderedDict()
+
+    def _timed(self, processed: ProcessedCV, stage: str, bytes_in: int, function: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = function()
+        processed.metrics[stage] = StageMetrics(time.perf_counter() - start, bytes_in)
+        return result
+
+    def process(self, path: str, context: Any = None) -> ProcessedCV:
+        """
+        Runs one PDF through every stage.
+
+        Args:
+            path: Location of the PDF.
+            context: Passed on to the indexer (e.g. the database record of the CV).
+
+        Returns:
+            ProcessedCV: The text, sections, details and stage metrics of the CV
+        """
+        processed = ProcessedCV(path)
+
+        def read() -> bytes:
+            with open(path, "rb") as pdf_file:
+                data = pdf_file.read()
+            processed.digest = hashlib.sha256(data).digest()
+            return data
+
+        pdf_bytes = self._timed(processed, "read", 0, read)
+        processed.metrics["read"].bytes_out = len(pdf_bytes)
+
+        previous = self._texts_by_digest.get(processed.digest)
+        if previous is not None:
+            self._texts_by_digest.move_to_end(processed.digest)
+            processed.reused = True
+            processed.text, processed.normalized = previous
+            if self.parse:
+                self._run_structure_stages(processed, _utf8_size(processed.normalized))
+        else:
+            processed.text = self._timed(processed, "extract", len(pdf_bytes),
+                                         lambda: extract_text_pypdf2_bytes(pdf_bytes))
+            self._run_text_stages(processed)
+            self._keep_text(processed)
+
+        self._index(processed, context)
+        self.stats.add(path, processed.metrics, processed.reused)
+        return processed
+
+    def _keep_text(self, processed: ProcessedCV):
+        if self.reused_texts_kept <= 0:
+            return
+        self._texts_by_digest[processed.digest] = (processed.text, processed.normalized)
+        while len(self._texts_by_digest) > self.reused_texts_kept:
+            self._texts_by_digest.popitem(last=False)
+
+    def process_text(self, name: str, text: str, context: Any = None) -> ProcessedCV:
+        """Runs an already extracted text through the stages after extract."""
+        processed = ProcessedCV(name, text=text)
+        self._run_text_stages(processed)
+        self._index(processed, context)
+        self.stats.add(name, processed.metrics)
+        return processed
+
+    def _run_text_stages(self, processed: ProcessedCV):
+        text_size = _utf8_size(processed.text)
+        if "extract" in processed.metrics:
+            processed.metrics["extract"].bytes_out = text_size
+        if not self.parse:
+            return
+
+        processed.normalized = self._timed(processed, "normalize", text_size,
+                                           lambda: normalize_text(processed.text) if processed.text else "")
+        normalized_size = _utf8_size(processed.normalized)
+        processed.metrics["normalize"].bytes_out = normalized_size
+        self._run_structure_stages(processed, normalized_size)
+
+    def _run_structure_stages(self, processed: ProcessedCV, normalized_size: int):
+        processed.sections = self._timed(processed, "segment", normalized_size,
+                                         lambda: segment_sections(processed.normalized))
+        processed.metrics["segment"].bytes_out = sum(
+            _utf8_size(body) for bodies in processed.sections.values() for body in bodies)
+
+        processed.details = self._timed(processed, "parse", normalized_size,
+                                        lambda: parse_sections(processed.normalized, processed.sections))
+
+    def _index(self, processed: ProcessedCV, context: Any):
+        if self.indexer is not None:
+            self._timed(processed, "index", _utf8_size(processed.text), lambda: self.indexer(processed, context))
+
+
+# Usage: python cv_pipeline.py [pdf_root] [--no-parse]
+if __name__ == '__main__':
+    import glob
+    import os
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    pdf_root = args[0] if args else os.path.join("archive", "data", "data")
+    pipeline = CvPipeline(parse="--no-parse" not in sys.argv)
+    for pdf_path in sorted(glob.glob(os.path.join(pdf_root, "**", "*.pdf"), recursive=True)):
+        pipeline.process(pdf_path)
+    print(pipeline.stats.report())
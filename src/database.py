@@ -1,21 +1,32 @@
-import mysql.connector
-from mysql.connector import Error
 import os
+import time
+from contextlib import contextmanager
+import threading
 from datetime import datetime
 from dotenv import load_dotenv
-import json
-import csv
+
+from bulk_seed import DEFAULT_SEED_PATH, bulk_seed
+from exporters import export_query, write_json
+from query_stats import QueryStats
+from storage import IN_LIST_CHUNK_SIZE, SCHEMA_VERSION, STREAM_BATCH_SIZE, DatabaseError, StorageBackend, StorageError, create_backend
+
+# Key of an application in RoleStatistics, as get_role_statistics labels it
+ROLE_STATISTICS_KEY = "COALESCE(application_role, 'No Role Specified')"
 
 class ApplicantDatabaseManager:
-    def __init__(self, host='localhost', database='applicant_db', user='root', password=''):
+    def __init__(self, host='localhost', database='applicant_db', user='root', password='', backend=None,
+                 check_schema=None):
         """
-        Initialize MySQL connection for applicant database
+        Initialize the applicant database (MySQL by default)
         
         Args:
             host: MySQL server host (default: localhost)
             database: Database name (default: applicant_db)
             user: MySQL username (default: root)
             password: MySQL password (default: empty)
+            backend: StorageBackend instance or name, "mysql" or "sqlite" (default: DB_BACKEND env, else mysql)
+            check_schema: Verify (and if needed provision) the schema on connect; False trusts it and
+                          connects on the first query only (default: DB_CHECK_SCHEMA env, else True)
         """
         load_dotenv()
         self.config = {
@@ -27,8 +38,18 @@ class ApplicantDatabaseManager:
             'charset': os.getenv('MYSQL_CHARSET', 'utf8mb4'),
             'collation': os.getenv('MYSQL_COLLATION', 'utf8mb4_unicode_ci')
         }
-        self.connection = None
         self.database_name = database
+        if isinstance(backend, StorageBackend):
+            self.backend = backend
+        else:
+            self.backend = create_backend(backend, self.config, self.database_name)
+        if check_schema is None:
+            check_schema = os.getenv('DB_CHECK_SCHEMA', '1') != '0'
+        self.check_schema = check_schema
+        self._connected = False
+        self._connect_lock = threading.Lock()
+        # Latency per calling method and the slow-query log (threshold: DB_SLOW_QUERY_MS)
+        self.query_timings = QueryStats()
         
         # Create local directories for exports
         os.makedirs("exports", exist_ok=True)
@@ -37,908 +58,315 @@ class ApplicantDatabaseManager:
       
 
     def connect(self):
-        """Connect to MySQL database, create if doesn't exist"""
-        try:
-            # First, connect without specifying database to check if it exists
-            temp_config = self.config.copy()
-            temp_config.pop('database')
-            
-            temp_connection = mysql.connector.connect(**temp_config)
-            cursor = temp_connection.cursor()
-            
-            # Check if database exists
-            cursor.execute(f"SHOW DATABASES LIKE '{self.database_name}'")
-            db_exists = cursor.fetchone()
-            
-            if not db_exists:
-                print(f"Database '{self.database_name}' doesn't exist. Creating...")
-                cursor.execute(f"CREATE DATABASE {self.database_name} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
-                print(f"Database '{self.database_name}' created successfully")
-            
-            cursor.close()
-            temp_connection.close()
-            
-            # Now connect to the database
-            self.connection = mysql.connector.connect(**self.config)
-            if self.connection.is_connected():
-                print(f"Successfully connected to MySQL database: {self.config['database']}")
-                
-                # Check if tables exist and setup if needed
-                self.check_and_setup_tables()
+        """Open the storage backend and, unless check_schema is off, check the tables in one query"""
+        with self._connect_lock:
+            if self._connected:
                 return True
-                
-        except Error as e:
-            print(f"MySQL connection error: {e}")
+            if not self.backend.open():
+                return False
+            self._connected = True
+        
+        # The schema check is also the first round trip, so it tells whether the server is reachable
+        if self.check_schema and not self.check_and_setup_tables():
+            self.disconnect()
             return False
+        return True
+    
+    @contextmanager
+    def _connection(self):
+        """Borrow a backend connection, connecting first if needed. Safe to use from any thread."""
+        if not self._connected and not self.connect():
+            raise StorageError("Not connected to the database")
+        with self.backend.connection() as connection:
+            yield connection
+    
+    def _acquire(self):
+        """Check a connection out of the backend for a multi-statement transaction; pair with self.backend.release"""
+        if not self._connected and not self.connect():
+            raise StorageError("Not connected to the database")
+        return self.backend.acquire()
+    
+    def pool_stats(self):
+        """Get usage counters of the backend's connections"""
+        return self.backend.stats()
+    
+    def query_stats(self):
+        """Get call and row counts and latency percentiles of the statements run so far, per query name"""
+        return self.query_timings.snapshot()
     
     def check_and_setup_tables(self):
-        """Check if tables exist, create and seed if they don't"""
+        """
+        Check the recorded schema version and that applicants exist in a single query; only
+        if either is off, look at the tables one by one, then create, seed and migrate them
+        
+        Returns:
+            bool: False if the database could not be reached
+        """
         try:
-            cursor = self.connection.cursor()
-            
-            # Check if ApplicantProfile table exists
-            cursor.execute("SHOW TABLES LIKE 'ApplicantProfile'")
-            applicant_table_exists = cursor.fetchone()
-
-            cursor.execute("SHOW TABLES LIKE 'ApplicationDetail'")
-            application_table_exists = cursor.fetchone()
-            
-            if not applicant_table_exists or not application_table_exists:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                version, has_data = self.backend.schema_state(cursor) or (None, False)
+                tables_exist = version is not None
+                if version is None:
+                    # Never provisioned by this code, or tables dropped since: check them the slow way
+                    tables_exist = (self.backend.table_exists(cursor, 'ApplicantProfile')
+                                    and self.backend.table_exists(cursor, 'ApplicationDetail'))
+                    if tables_exist:
+                        cursor.execute("SELECT COUNT(*) FROM ApplicantProfile")
+                        has_data = cursor.fetchone()[0] > 0
+                cursor.close()
+            
+            if version is not None and version > SCHEMA_VERSION:
+                print(f"Warning: database schema version {version} is newer than this code's ({SCHEMA_VERSION})")
+            elif not tables_exist:
                 print("Tables don't exist. Setting up database...")
                 self.setup_database()
                 self.seed_all_data()
-            else:
-                # Check if tables have data
-                cursor.execute("SELECT COUNT(*) FROM ApplicantProfile")
-                count = cursor.fetchone()[0]
-                if count == 0:
-                    print("Tables exist but no data found. Loading seed data...")
-                    self.seed_all_data()
-                else:
-                    print(f"Database ready with {count} applicants")
+            elif not has_data:
+                print("Tables exist but no data found. Loading seed data...")
+                self.seed_all_data()
             
-            cursor.close()
+            if version is None or version < SCHEMA_VERSION:
+                self.migrate_schema()
+            print(f"Database ready (schema version {max(version or 0, SCHEMA_VERSION)})")
+            return True
             
-        except Error as e:
+        except DatabaseError as e:
             print(f"Table check error: {e}")
+            return False
+    
+    def migrate_schema(self):
+        """
+        Create the secondary indexes, the full-text name index and the statistics tables if missing,
+        recount the statistics and record the schema version (safe to run repeatedly)
+        """
+        connection = cursor = None
+        try:
+            connection = self._acquire()
+            cursor = connection.cursor()
+            for command in self.backend.statistics_schema().split(';'):
+                if command.strip():
+                    cursor.execute(command)
+            created = self.backend.create_indexes(cursor)
+            # DDL commits implicitly on MySQL; the recount and version row form one transaction
+            self.backend.begin(connection)
+            self._rebuild_statistics(cursor)
+            self.backend.record_schema_version(cursor)
+            connection.commit()
+            if created:
+                print(f"Indexes created: {', '.join(created)}")
+            return created
+            
+        except DatabaseError as e:
+            print(f"Schema migration error: {e}")
+            return None
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                self.backend.release(connection)
     
     def disconnect(self):
-        """Disconnect from MySQL"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            print("MySQL connection closed")
+        """Disconnect from the database, closing the backend's connections"""
+        with self._connect_lock:
+            if self._connected:
+                self.backend.close()
+                self._connected = False
+    
+    def close(self):
+        """Same as disconnect"""
+        self.disconnect()
     
     def setup_database(self):
         """Setup database and tables from your seed data"""
+        connection = cursor = None
         try:
-            cursor = self.connection.cursor()
-            
-            # Read the SQL file content (your provided seed)
-            sql_commands = """
-            SET NAMES 'utf8mb4' COLLATE 'utf8mb4_unicode_ci';
+            connection = self._acquire()
+            cursor = connection.cursor()
             
-            SET FOREIGN_KEY_CHECKS = 0;
-            
-            DROP TABLE IF EXISTS ApplicationDetail;
-            DROP TABLE IF EXISTS ApplicantProfile;
-            
-            SET FOREIGN_KEY_CHECKS = 1;
-            
-            CREATE TABLE ApplicantProfile (
-                applicant_id INT AUTO_INCREMENT PRIMARY KEY,
-                first_name VARCHAR(50),
-                last_name VARCHAR(50),
-                date_of_birth DATE,
-                address VARCHAR(255),
-                phone_number VARCHAR(20)
-            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            
-            CREATE TABLE ApplicationDetail (
-                detail_id INT AUTO_INCREMENT PRIMARY KEY,
-                applicant_id INT NOT NULL,
-                application_role VARCHAR(100),
-                cv_path TEXT,
-                FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
-            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            """
+            # Table definitions in the backend's dialect
+            sql_commands = self.backend.core_schema()
             
             # Execute table creation commands
-            for command in sql_commands.split(';'):
+            for command in sql_commands.split(';') + self.backend.statistics_schema().split(';'):
                 if command.strip():
                     cursor.execute(command)
+            self.backend.create_indexes(cursor)
+            self.backend.begin(connection)
+            self._rebuild_statistics(cursor)
+            self.backend.record_schema_version(cursor)
             
-            self.connection.commit()
+            connection.commit()
             print("Database tables created successfully")
             
-        except Error as e:
+        except DatabaseError as e:
             print(f"Database setup error: {e}")
         finally:
-            cursor.close()
+            if cursor:
+                cursor.close()
+            if connection:
+                self.backend.release(connection)
     
-    def seed_all_data(self):
-        """Insert ALL the seed data from your provided SQL"""
+    def setup_extraction_tables(self):
+        """Create the tables holding structured data extracted from the CVs, if missing"""
+        connection = cursor = None
         try:
-            cursor = self.connection.cursor()
-            
-            # Complete ApplicantProfile data (all 80 records)
-            applicant_data = [
-                (1, 'Moh4mm4d', 'Nu9r4h4', '2003-06-14', 'Jl. Kenanga No. 12, Jakarta', '081234567891'),
-                (2, 'MOH4MM4D', 'NUGR4H4', '2004-03-22', 'Jl. Melati No. 45, Bandung', '082123456781'),
-                (3, 'M0hammad', 'Nugr4h4', '2003-11-05', 'Jl. Cemara No. 7, Surabaya', '081345678912'),
-                (4, 'Mohammad', 'NUGR4H4', '2004-01-17', 'Jl. Sakura No. 4, Semarang', '082134567892'),
-                (5, 'm0h4mm4d', 'nu9r4h4', '2003-09-12', 'Jl. Mawar No. 9, Yogyakarta', '081223456789'),
-                (6, 'MoH4mM4d', 'NugR4h4', '2003-12-30', 'Jl. Anggrek No. 18, Medan', '082143256789'),
-                (7, 'M0H4MM4D', 'NuGr4Ha', '2003-05-26', 'Jl. Duku No. 33, Makassar', '081298765432'),
-                (8, 'Mohammad', 'NUGRAHA', '2004-02-11', 'Jl. Apel No. 2, Palembang', '081345679123'),
-                (9, 'm0H4mmad', 'nug9ah4', '2004-04-19', 'Jl. Jambu No. 25, Malang', '082198765432'),
-                (10, 'M0h4mM4D', 'NUGRAHA', '2003-07-07', 'Jl. Pisang No. 66, Denpasar', '081399988877'),
-                (11, 'Ari3l', 'H3rfri50n', '2004-03-14', 'Jl. Jeruk No. 2, Bekasi', '081223498761'),
-                (12, 'AR13L', 'H3RFR1S0N', '2003-08-03', 'Jl. Sawo No. 11, Depok', '082154321789'),
-                (13, '4riel', 'Herfris0n', '2003-11-23', 'Jl. Mangga No. 55, Tangerang', '081276543219'),
-                (14, 'AR1EL', 'H3RFR1S0N', '2003-02-09', 'Jl. Rambutan No. 88, Bogor', '082199876543'),
-                (15, 'Ariel', 'Herfrison', '2003-12-10', 'Jl. Durian No. 6, Cirebon', '081277789912'),
-                (16, 'ar13l', 'h3rfr150n', '2004-06-18', 'Jl. Nangka No. 90, Padang', '082134556789'),
-                (17, '4R13L', 'HERFRI50N', '2004-01-27', 'Jl. Srikaya No. 14, Batam', '081287654321'),
-                (18, 'Ari3L', 'HerfR150n', '2003-10-06', 'Jl. Kedondong No. 70, Solo', '082198123456'),
-                (19, 'Arie1', 'HERFRISON', '2004-02-03', 'Jl. Jambu No. 20, Balikpapan', '081256789123'),
-                (20, 'ARI3L', 'h3rfri50n', '2004-04-28', 'Jl. Salak No. 31, Pontianak', '082123987654'),
-                (21, 'F4rh4n', 'N4f15', '2004-05-05', 'Jl. Kamboja No. 12, Serang', '081254789621'),
-                (22, 'FARH4N', 'N4F15', '2003-06-15', 'Jl. Wijaya Kusuma No. 4, Cimahi', '082145678912'),
-                (23, 'F4rH4n', 'Nafis', '2003-08-09', 'Jl. Lili No. 7, Madiun', '081267898712'),
-                (24, 'Farh4n', 'N4FIS', '2004-01-30', 'Jl. Anyelir No. 1, Kediri', '082134987621'),
-                (25, 'f4rhan', 'naf15', '2003-04-17', 'Jl. Teratai No. 5, Tasikmalaya', '081233221234'),
-                (26, 'F4RH4N', 'N4F15', '2003-10-25', 'Jl. Dahlia No. 44, Manado', '082198726154'),
-                (27, 'f4RH4N', 'NAFIS', '2004-03-03', 'Jl. Tanjung No. 13, Palu', '081267891234'),
-                (28, 'FARH4N', 'N4f15', '2003-07-07', 'Jl. Ketapang No. 23, Kendari', '082111122233'),
-                (29, 'f4rh4n', 'naf15', '2004-02-20', 'Jl. Cemara No. 89, Kupang', '081299887766'),
-                (30, 'FARH4N', 'NAFIS', '2003-09-28', 'Jl. Flamboyan No. 5, Banjarmasin', '082133344455'),
-                (31, 'H41k4l', '455y4uq1', '2003-05-15', 'Jl. Alpukat No. 13, Surakarta', '081222334455'),
-                (32, 'HA1K4L', 'ASSY4UQ1', '2004-07-22', 'Jl. Sukun No. 19, Pekanbaru', '082122334456'),
-                (33, 'Haikal', 'Assy4uqi', '2003-12-03', 'Jl. Nanas No. 33, Tegal', '081267845129'),
-                (34, 'H41k4L', 'Assyauqi', '2003-09-14', 'Jl. Pepaya No. 77, Cianjur', '082198772112'),
-                (35, 'ha1k4l', '455yauqi', '2003-01-01', 'Jl. Sawo No. 21, Banjar', '081212121212'),
-                (36, 'H41K4L', '455YAUQ1', '2004-03-30', 'Jl. Srikaya No. 34, Pangkalpinang', '082187654321'),
-                (37, 'h41K4L', 'Assy4Uq1', '2003-11-11', 'Jl. Damar No. 90, Mojokerto', '081232345678'),
-                (38, 'Ha1KaL', 'Assy4UqI', '2003-06-28', 'Jl. Jati No. 6, Magelang', '082167849512'),
-                (39, 'Haikal', 'ASSYAUQI', '2004-01-09', 'Jl. Jengkol No. 99, Blitar', '081289123456'),
-                (40, 'HA1KAL', '455y4UQ1', '2003-02-18', 'Jl. Kapuk No. 4, Probolinggo', '082145612378'),
-                (41, 'R4d3n', 'Fr4nC15c0', '2003-07-07', 'Jl. Mawar No. 1, Tasikmalaya', '081293847561'),
-                (42, 'RAD3N', 'FRANC15CO', '2004-06-13', 'Jl. Kamboja No. 23, Pontianak', '082145637291'),
-                (43, 'R4den', 'Francisco', '2003-04-04', 'Jl. Cemara No. 88, Pekalongan', '081223489127'),
-                (44, 'R4d3N', 'Fr4nc15co', '2003-12-25', 'Jl. Jeruk No. 4, Sukabumi', '082144478512'),
-                (45, 'r4d3n', 'fr4nc1sco', '2004-01-31', 'Jl. Mangga No. 56, Metro', '081267891255'),
-                (46, 'RADEN', 'FRANCISCO', '2004-04-17', 'Jl. Anggrek No. 45, Bitung', '082198123785'),
-                (47, 'RaD3n', 'FrAnC1sco', '2003-11-19', 'Jl. Apel No. 13, Lhokseumawe', '081212343434'),
-                (48, 'RaDen', 'FrAnC1SCo', '2003-03-09', 'Jl. Pisang No. 7, Sibolga', '082199998877'),
-                (49, 'r4d3n', 'Francisco', '2004-02-23', 'Jl. Duku No. 70, Serang', '081288899900'),
-                (50, 'R4d3N', 'FRANCISCO', '2003-08-08', 'Jl. Cempaka No. 6, Tarakan', '082122456789'),
-                (51, '4l4nd', 'MuL14', '2003-07-10', 'Jl. Lontar No. 13, Pematangsiantar', '081234559999'),
-                (52, 'AL4ND', 'MUL1A', '2003-10-21', 'Jl. Waru No. 8, Salatiga', '082134556677'),
-                (53, 'Al4nd', 'Muli4', '2004-06-12', 'Jl. Belimbing No. 90, Blora', '081233445566'),
-                (54, 'ALAND', 'MULIA', '2003-05-01', 'Jl. Petai No. 21, Kuningan', '082199112233'),
-                (55, '4l4nd', 'muli4', '2003-09-29', 'Jl. Pinang No. 99, Bangkalan', '081223334455'),
-                (56, 'AlaNd', 'MuL14', '2004-03-20', 'Jl. Pisang No. 4, Singkawang', '082122223456'),
-                (57, '4L4ND', 'MUL1A', '2004-01-14', 'Jl. Durian No. 15, Ternate', '081256789456'),
-                (58, 'AlaND', 'MULIA', '2003-12-07', 'Jl. Duku No. 5, Bima', '082134567812'),
-                (59, 'ALaNd', 'MuLiA', '2003-02-26', 'Jl. Tomat No. 3, Ambon', '081245677899'),
-                (60, 'Aland', 'MuL1A', '2003-11-11', 'Jl. Rambutan No. 67, Bau-Bau', '082165432198'),
-                (61, '4hm4d', 'R4f1', '2003-09-12', 'Jl. Ketapang No. 3, Tarakan', '081256712348'),
-                (62, 'AHMAD', 'RAFI', '2004-04-19', 'Jl. Pinus No. 21, Mataram', '082176543210'),
-                (63, 'AhM4d', 'R4fi', '2003-08-28', 'Jl. Rambutan No. 17, Kupang', '081278765432'),
-                (64, '4Hmad', 'RAFI', '2003-07-04', 'Jl. Flamboyan No. 34, Tual', '082134598721'),
-                (65, 'Ahm4d', 'r4f1', '2004-02-12', 'Jl. Meranti No. 18, Tidore', '081233498765'),
-                (66, '4HMaD', 'RAF1', '2003-05-15', 'Jl. Salak No. 6, Sorong', '082177712345'),
-                (67, '4hmad', 'Rafi', '2003-11-03', 'Jl. Teratai No. 9, Langsa', '081287654398'),
-                (68, 'AHm4d', 'RaF1', '2004-06-01', 'Jl. Melati No. 29, Palopo', '082134589743'),
-                (69, 'Ahmad', 'RAFI', '2003-10-10', 'Jl. Cemara No. 77, Lubuklinggau', '081298765411'),
-                (70, '4HMAD', 'r4f1', '2004-01-01', 'Jl. Apel No. 89, Subulussalam', '082134672298'),
-                (71, '1khw4n', '4lH4k1m', '2003-06-06', 'Jl. Kenari No. 23, Pariaman', '081223456789'),
-                (72, 'IKHW4N', 'ALH4KIM', '2003-10-25', 'Jl. Delima No. 2, Tebing Tinggi', '082167891234'),
-                (73, 'IkHwan', 'AlHak1m', '2004-03-18', 'Jl. Mahoni No. 44, Binjai', '081212398765'),
-                (74, '1KHWAN', '4lH4KIM', '2003-09-20', 'Jl. Tanjung No. 15, Tanjungpinang', '082123456781'),
-                (75, 'Ikhw4n', 'ALH4KIM', '2004-02-15', 'Jl. Beringin No. 6, Jambi', '081278991234'),
-                (76, '1khwan', '4lh4k1m', '2003-01-12', 'Jl. Bayam No. 11, Pangkalpinang', '082154321987'),
-                (77, '1kHw4N', '4lHaKIM', '2003-07-23', 'Jl. Singkong No. 9, Prabumulih', '081245678912'),
-                (78, 'Ikhwan', 'ALHAKIM', '2004-04-09', 'Jl. Bengkuang No. 20, Sungai Penuh', '082198762341'),
-                (79, 'IKHWAN', 'Alh4k1M', '2003-03-27', 'Jl. Nangka No. 14, Solok', '081277788899'),
-                (80, '1KHw4N', '4LHAKIM', '2004-01-19', 'Jl. Mangga No. 60, Padang Panjang', '082166655544')
-            ]
+            connection = self._acquire()
+            cursor = connection.cursor()
             
-            cursor.execute("DELETE FROM ApplicationDetail")
-            cursor.execute("DELETE FROM ApplicantProfile")
-            cursor.execute("ALTER TABLE ApplicantProfile AUTO_INCREMENT = 1")
-            cursor.execute("ALTER TABLE ApplicationDetail AUTO_INCREMENT = 1")
-            
-            insert_applicant_query = """
-            INSERT INTO ApplicantProfile (applicant_id, first_name, last_name, date_of_birth, address, phone_number) 
-            VALUES (%s, %s, %s, %s, %s, %s)
-            """
+            sql_commands = self.backend.extraction_schema()
             
-            cursor.executemany(insert_applicant_query, applicant_data)
-            application_data = [
-                (1, 20, 'Software Developer', 'data/INFORMATION-TECHNOLOGY/15118506.pdf'),
-                (2, 27, 'Financial Planner', 'data/FINANCE/12858898.pdf'),
-                (3, 74, None, 'data/CHEF/11121498.pdf'),
-                (4, 13, 'Aviation Mechanic', 'data/AVIATION/11169163.pdf'),
-                (5, 42, 'Sales Consultant', 'data/SALES/15273850.pdf'),
-                (6, 19, 'Reconciliation Officer', 'data/ACCOUNTANT/12065211.pdf'),
-                (7, 34, 'Content Creator', 'data/DIGITAL-MEDIA/15353911.pdf'),
-                (8, 36, None, 'data/CONSTRUCTION/12839152.pdf'),
-                (9, 2, 'Site Supervisor', 'data/CONSTRUCTION/10820510.pdf'),
-                (10, 73, 'Public Affairs Specialist', 'data/PUBLIC-RELATIONS/11624880.pdf'),
-                (11, 3, 'Software Developer', 'data/INFORMATION-TECHNOLOGY/10553553.pdf'),
-                (12, 33, 'Cost Accountant', 'data/FINANCE/12071138.pdf'),
-                (13, 74, 'Anesthesiologist', 'data/HEALTHCARE/10466208.pdf'),
-                (14, 71, 'Process Associate', 'data/BPO/38707449.pdf'),
-                (15, 11, 'Lead Generation Specialist', 'data/BUSINESS-DEVELOPMENT/12814706.pdf'),
-                (16, 71, 'Illustrator', 'data/ARTS/16244633.pdf'),
-                (17, 55, None, 'data/ADVOCATE/12544735.pdf'),
-                (18, 59, 'Pilot', 'data/AVIATION/10189110.pdf'),
-                (19, 71, 'Soil Scientist', 'data/AGRICULTURE/17312146.pdf'),
-                (20, 6, 'Retail Banker', 'data/BANKING/11842348.pdf'),
-                (21, 49, 'Legal Researcher', 'data/ADVOCATE/13967854.pdf'),
-                (22, 60, None, 'data/TEACHER/15850434.pdf'),
-                (23, 74, 'Aircraft Maintenance Engineer', 'data/AVIATION/12043694.pdf'),
-                (24, 25, 'Bank Manager', 'data/BANKING/15553584.pdf'),
-                (25, 18, 'Intellectual Property Attorney', 'data/ADVOCATE/11773767.pdf'),
-                (26, 23, 'IT Consultant', 'data/CONSULTANT/12897903.pdf'),
-                (27, 24, 'Art Director', 'data/ARTS/11187796.pdf'),
-                (28, 62, 'Legal Advisor', 'data/ADVOCATE/11963737.pdf'),
-                (29, 47, 'Crisis Manager', 'data/PUBLIC-RELATIONS/11902276.pdf'),
-                (30, 38, 'Press Secretary', 'data/PUBLIC-RELATIONS/11850315.pdf'),
-                (31, 30, 'Account Executive', 'data/BUSINESS-DEVELOPMENT/10704573.pdf'),
-                (32, 33, 'Banquet Chef', 'data/CHEF/13212436.pdf'),
-                (33, 40, 'Tax Consultant', 'data/FINANCE/15891494.pdf'),
-                (34, 4, 'Financial Consultant', 'data/CONSULTANT/11333660.pdf'),
-                (35, 48, 'Customer Support Executive', 'data/BPO/13964744.pdf'),
-                (36, 69, 'Public Affairs Specialist', 'data/PUBLIC-RELATIONS/12191094.pdf'),
-                (37, 77, 'Retail Banker', 'data/BANKING/13173522.pdf'),
-                (38, 35, 'Teaching Assistant', 'data/TEACHER/12587973.pdf'),
-                (39, 65, 'QA Engineer', 'data/INFORMATION-TECHNOLOGY/11580408.pdf'),
-                (40, 65, 'Corporate Counsel', 'data/ADVOCATE/11188218.pdf'),
-                (41, 63, 'Criminal Lawyer', 'data/ADVOCATE/10344379.pdf'),
-                (42, 57, None, 'data/BPO/24727739.pdf'),
-                (43, 48, 'Customer Support Executive', 'data/BPO/13964744.pdf'),
-                (44, 27, 'BPO Trainer', 'data/BPO/26829350.pdf'),
-                (45, 59, 'Graphic Designer', 'data/DESIGNER/10748989.pdf'),
-                (46, 26, 'Fashion Designer', 'data/DESIGNER/13557622.pdf'),
-                (47, 80, 'Garde Manger', 'data/CHEF/11209758.pdf'),
-                (48, 71, 'Agricultural Engineer', 'data/AGRICULTURE/18242317.pdf'),
-                (49, 48, None, 'data/INFORMATION-TECHNOLOGY/12045067.pdf'),
-                (50, 52, None, 'data/HEALTHCARE/14667957.pdf'),
-                (51, 31, 'Ramp Agent', 'data/AVIATION/12144825.pdf'),
-                (52, 65, 'Systems Engineer', 'data/ENGINEERING/11890896.pdf'),
-                (53, 23, 'Quality Control Inspector', 'data/AUTOMOBILE/15210069.pdf'),
-                (54, 40, None, 'data/APPAREL/12122372.pdf'),
-                (55, 6, 'Fabric Researcher', 'data/APPAREL/14698557.pdf'),
-                (56, 12, 'Teaching Assistant', 'data/TEACHER/15899269.pdf'),
-                (57, 80, 'Doctor', 'data/HEALTHCARE/10568183.pdf'),
-                (58, 52, 'Packaging Designer', 'data/DESIGNER/11919526.pdf'),
-                (59, 64, 'Art Teacher', 'data/ARTS/16962067.pdf'),
-                (60, 56, 'Financial Consultant', 'data/CONSULTANT/11835339.pdf'),
-                (61, 6, None, 'data/TEACHER/16210888.pdf'),
-                (62, 56, 'Inside Sales Representative', 'data/SALES/10898339.pdf'),
-                (63, 14, 'Environmental Engineer', 'data/ENGINEERING/10712803.pdf'),
-                (64, 76, 'Quality Control Inspector', 'data/AUTOMOBILE/22946204.pdf'),
-                (65, 50, 'Compensation Analyst', 'data/HR/15041689.pdf'),
-                (66, 49, None, 'data/ADVOCATE/13967854.pdf'),
-                (67, 55, 'Safety Officer', 'data/CONSTRUCTION/10100240.pdf'),
-                (68, 72, 'Team Leader', 'data/BPO/31064969.pdf'),
-                (69, 40, 'Safety Officer', 'data/CONSTRUCTION/10281555.pdf'),
-                (70, 24, 'Speechwriter', 'data/PUBLIC-RELATIONS/12920612.pdf'),
-                (71, 48, 'Cloud Architect', 'data/INFORMATION-TECHNOLOGY/13385306.pdf'),
-                (72, 70, '3D Modeler', 'data/DESIGNER/10466583.pdf'),
-                (73, 79, None, 'data/FINANCE/14722634.pdf'),
-                (74, 80, 'Nurse', 'data/HEALTHCARE/10568183.pdf'),
-                (75, 65, 'UX/UI Designer', 'data/DESIGNER/14014749.pdf'),
-                (76, 61, None, 'data/INFORMATION-TECHNOLOGY/13405733.pdf'),
-                (77, 24, 'Painter', 'data/ARTS/11187796.pdf'),
-                (78, 18, 'Intellectual Property Attorney', 'data/ADVOCATE/11773767.pdf'),
-                (79, 51, None, 'data/FITNESS/10235429.pdf'),
-                (80, 29, 'Technical Support Associate', 'data/BPO/69097572.pdf'),
-                (81, 53, None, 'data/BUSINESS-DEVELOPMENT/13199813.pdf'),
-                (82, 58, 'Aviation Safety Officer', 'data/AVIATION/11959428.pdf'),
-                (83, 25, 'Intellectual Property Attorney', 'data/ADVOCATE/12171093.pdf'),
-                (84, 34, 'Radiologist', 'data/HEALTHCARE/12315079.pdf'),
-                (85, 30, None, 'data/FINANCE/16449850.pdf'),
-                (86, 35, 'Mechanical Engineer', 'data/ENGINEERING/10030015.pdf'),
-                (87, 13, None, 'data/AVIATION/11614114.pdf'),
-                (88, 74, 'Doctor', 'data/HEALTHCARE/10466208.pdf'),
-                (89, 42, 'HRIS Analyst', 'data/HR/13376919.pdf'),
-                (90, 51, 'Civil Engineer', 'data/ENGINEERING/12748557.pdf'),
-                (91, 10, 'Reconciliation Officer', 'data/ACCOUNTANT/11163645.pdf'),
-                (92, 59, None, 'data/CONSTRUCTION/12666174.pdf'),
-                (93, 18, 'Industrial Engineer', 'data/ENGINEERING/13264796.pdf'),
-                (94, 74, 'Aviation Mechanic', 'data/AVIATION/12043694.pdf'),
-                (95, 11, 'Subject Matter Expert', 'data/TEACHER/10909720.pdf'),
-                (96, 56, 'Merchandiser', 'data/APPAREL/10876132.pdf'),
-                (97, 53, 'Sculptor', 'data/ARTS/17325147.pdf'),
-                (98, 19, 'Corporate Counsel', 'data/ADVOCATE/10186968.pdf'),
-                (99, 58, 'Muralist', 'data/ARTS/11555549.pdf'),
-                (100, 71, 'Art Director', 'data/ARTS/16244633.pdf'),
-                (101, 12, 'Civil Engineer', 'data/ENGINEERING/12022566.pdf'),
-                (102, 25, 'Business Development Executive', 'data/BUSINESS-DEVELOPMENT/12377803.pdf'),
-                (103, 12, 'Primary School Teacher', 'data/TEACHER/15899269.pdf'),
-                (104, 36, 'Nurse', 'data/HEALTHCARE/11704150.pdf'),
-                (105, 12, 'Instructional Coach', 'data/TEACHER/15899269.pdf'),
-                (106, 6, 'Sales Consultant', 'data/SALES/10464113.pdf'),
-                (107, 18, 'Construction Worker', 'data/CONSTRUCTION/11393213.pdf'),
-                (108, 36, None, 'data/CONSTRUCTION/12839152.pdf'),
-                (109, 3, 'Packaging Designer', 'data/DESIGNER/11155153.pdf'),
-                (110, 10, 'Sustainability Consultant', 'data/CONSULTANT/10332998.pdf'),
-                (111, 12, 'Aviation Mechanic', 'data/AVIATION/13195436.pdf'),
-                (112, 44, 'Environmental Engineer', 'data/ENGINEERING/12472574.pdf'),
-                (113, 10, 'Litigation Associate', 'data/ADVOCATE/13909762.pdf'),
-                (114, 15, 'HR Manager', 'data/HR/13520837.pdf'),
-                (115, 25, 'Criminal Lawyer', 'data/ADVOCATE/12171093.pdf'),
-                (116, 16, 'Tax Analyst', 'data/ACCOUNTANT/14224370.pdf'),
-                (117, 31, 'Sports Therapist', 'data/FITNESS/11522068.pdf'),
-                (118, 59, None, 'data/INFORMATION-TECHNOLOGY/10089434.pdf'),
-                (119, 57, 'Team Leader', 'data/BPO/24727739.pdf'),
-                (120, 8, 'HR Generalist', 'data/HR/13879043.pdf'),
-                (121, 80, None, 'data/CHEF/11209758.pdf'),
-                (122, 5, 'Mechanical Engineer', 'data/ENGINEERING/15139979.pdf'),
-                (123, 51, 'Wellness Coach', 'data/FITNESS/10235429.pdf'),
-                (124, 42, 'Agricultural Economist', 'data/AGRICULTURE/11813872.pdf'),
-                (125, 28, 'Garde Manger', 'data/CHEF/14663897.pdf'),
-                (126, 78, 'Graphic Designer', 'data/DESIGNER/14743911.pdf'),
-                (127, 79, 'Banquet Chef', 'data/CHEF/10588874.pdf'),
-                (128, 63, 'Teaching Assistant', 'data/TEACHER/16270906.pdf'),
-                (129, 6, 'Crop Consultant', 'data/AGRICULTURE/18264694.pdf'),
-                (130, 47, 'Agricultural Engineer', 'data/AGRICULTURE/12674256.pdf'),
-                (131, 60, 'Legal Advisor', 'data/ADVOCATE/14146106.pdf'),
-                (132, 39, 'Tax Analyst', 'data/ACCOUNTANT/12202337.pdf'),
-                (133, 41, 'Team Leader', 'data/BPO/63158213.pdf'),
-                (134, 41, 'Operations Manager', 'data/BPO/63158213.pdf'),
-                (135, 14, 'Exhibition Designer', 'data/DESIGNER/12547982.pdf'),
-                (136, 48, 'Digital Marketing Analyst', 'data/DIGITAL-MEDIA/13343786.pdf'),
-                (137, 31, None, 'data/DESIGNER/10751444.pdf'),
-                (138, 42, 'Employee Relations Officer', 'data/HR/13376919.pdf'),
-                (139, 10, 'Sustainability Consultant', 'data/CONSULTANT/10332998.pdf'),
-                (140, 60, None, 'data/TEACHER/15850434.pdf'),
-                (141, 66, 'Actuary', 'data/FINANCE/17775916.pdf'),
-                (142, 3, None, 'data/AUTOMOBILE/17571262.pdf'),
-                (143, 11, 'Process Associate', 'data/BPO/79261033.pdf'),
-                (144, 78, None, 'data/CHEF/12420359.pdf'),
-                (145, 18, 'Financial Analyst', 'data/FINANCE/15011085.pdf'),
-                (146, 25, 'Litigation Associate', 'data/ADVOCATE/12171093.pdf'),
-                (147, 60, 'Business Development Executive', 'data/BUSINESS-DEVELOPMENT/12632728.pdf'),
-                (148, 3, 'QA Engineer', 'data/INFORMATION-TECHNOLOGY/10553553.pdf'),
-                (149, 58, 'Safety Officer', 'data/CONSTRUCTION/12826414.pdf'),
-                (150, 18, 'Influencer Manager', 'data/DIGITAL-MEDIA/14036515.pdf'),
-                (151, 43, 'Litigation Associate', 'data/ADVOCATE/13593241.pdf'),
-                (152, 34, 'Ramp Agent', 'data/AVIATION/13234267.pdf'),
-                (153, 19, 'IT Consultant', 'data/CONSULTANT/14346702.pdf'),
-                (154, 61, 'Crop Consultant', 'data/AGRICULTURE/17640785.pdf'),
-                (155, 50, 'Safety Officer', 'data/CONSTRUCTION/12890045.pdf'),
-                (156, 37, 'Building Inspector', 'data/CONSTRUCTION/10734870.pdf'),
-                (157, 60, 'Backend Developer', 'data/INFORMATION-TECHNOLOGY/10641230.pdf'),
-                (158, 59, 'Pilot', 'data/AVIATION/11804712.pdf'),
-                (159, 37, 'Illustrator', 'data/ARTS/10830646.pdf'),
-                (160, 6, 'Market Research Analyst', 'data/BUSINESS-DEVELOPMENT/10235211.pdf'),
-                (161, 34, 'Air Traffic Controller', 'data/AVIATION/13234267.pdf'),
-                (162, 24, None, 'data/PUBLIC-RELATIONS/12920612.pdf'),
-                (163, 26, 'Project Manager', 'data/CONSTRUCTION/11650031.pdf'),
-                (164, 36, 'Software Developer', 'data/INFORMATION-TECHNOLOGY/11584809.pdf'),
-                (165, 10, None, 'data/ARTS/15306049.pdf'),
-                (166, 19, None, 'data/SALES/15581242.pdf'),
-                (167, 58, 'Agronomist', 'data/AGRICULTURE/10953078.pdf'),
-                (168, 79, 'Commis Chef', 'data/CHEF/11444536.pdf'),
-                (169, 80, 'Kitchen Manager', 'data/CHEF/11209758.pdf'),
-                (170, 52, 'Bank Manager', 'data/BANKING/17131084.pdf'),
-                (171, 7, None, 'data/AGRICULTURE/12341902.pdf'),
-                (172, 22, 'Compliance Officer', 'data/BANKING/11262933.pdf'),
-                (173, 53, 'Quality Control Inspector', 'data/AUTOMOBILE/18448085.pdf'),
-                (174, 11, 'High School Teacher', 'data/TEACHER/10909720.pdf'),
-                (175, 57, 'Digital Marketing Analyst', 'data/DIGITAL-MEDIA/16276121.pdf'),
-                (176, 80, 'Sales Executive', 'data/SALES/12082377.pdf'),
-                (177, 18, 'Art Critic', 'data/ARTS/12334650.pdf'),
-                (178, 42, 'Sustainability Consultant', 'data/CONSULTANT/12526702.pdf'),
-                (179, 60, 'Criminal Lawyer', 'data/ADVOCATE/14146106.pdf'),
-                (180, 80, 'Backend Developer', 'data/INFORMATION-TECHNOLOGY/10247517.pdf'),
-                (181, 15, 'HR Manager', 'data/HR/13520837.pdf'),
-                (182, 2, 'Structural Engineer', 'data/CONSTRUCTION/10820510.pdf'),
-                (183, 20, 'Treasury Analyst', 'data/BANKING/13393401.pdf'),
-                (184, 40, 'Business Development Representative', 'data/SALES/14381464.pdf'),
-                (185, 15, 'HR Manager', 'data/HR/13520837.pdf'),
-                (186, 48, 'Illustrator', 'data/ARTS/12386670.pdf'),
-                (187, 35, None, 'data/DIGITAL-MEDIA/13503650.pdf'),
-                (188, 64, None, 'data/DIGITAL-MEDIA/10515955.pdf'),
-                (189, 65, 'Mechanical Engineer', 'data/ENGINEERING/11890896.pdf'),
-                (190, 59, 'Graphic Designer', 'data/DESIGNER/11958994.pdf'),
-                (191, 25, 'Customer Support Executive', 'data/BPO/11183737.pdf'),
-                (192, 6, 'QA Engineer', 'data/INFORMATION-TECHNOLOGY/12763627.pdf'),
-                (193, 6, 'Customer Support Executive', 'data/BPO/23933031.pdf'),
-                (194, 33, 'Saucier', 'data/CHEF/12717345.pdf'),
-                (195, 40, 'Investment Analyst', 'data/FINANCE/15891494.pdf'),
-                (196, 71, None, 'data/BANKING/10909673.pdf'),
-                (197, 53, 'Civil Engineer', 'data/ENGINEERING/11981094.pdf'),
-                (198, 14, 'Graphic Designer', 'data/DESIGNER/12547982.pdf'),
-                (199, 59, 'Merchandiser', 'data/APPAREL/13764840.pdf'),
-                (200, 29, 'Subject Matter Expert', 'data/TEACHER/13087952.pdf'),
-                (201, 24, 'Sculptor', 'data/ARTS/11187796.pdf'),
-                (202, 18, 'Civil Engineer', 'data/CONSTRUCTION/11393213.pdf'),
-                (203, 59, 'Garment Technologist', 'data/APPAREL/13764840.pdf'),
-                (204, 49, 'Art Critic', 'data/ARTS/11995013.pdf'),
-                (205, 80, 'Recruitment Specialist', 'data/HR/14886205.pdf'),
-                (206, 8, 'Sous Chef', 'data/CHEF/14569498.pdf'),
-                (207, 67, 'HR Consultant', 'data/CONSULTANT/12374933.pdf'),
-                (208, 60, 'Litigation Associate', 'data/ADVOCATE/14146106.pdf'),
-                (209, 57, 'PPC Specialist', 'data/DIGITAL-MEDIA/16276121.pdf'),
-                (210, 19, 'Cost Accountant', 'data/ACCOUNTANT/12065211.pdf'),
-                (211, 27, 'SEO Specialist', 'data/DIGITAL-MEDIA/11270462.pdf'),
-                (212, 39, 'Customer Retention Specialist', 'data/BPO/30709029.pdf'),
-                (213, 12, 'Financial Consultant', 'data/CONSULTANT/13454871.pdf'),
-                (214, 50, 'Painter', 'data/ARTS/13272204.pdf'),
-                (215, 70, None, 'data/ENGINEERING/14206561.pdf'),
-                (216, 31, 'Anesthesiologist', 'data/HEALTHCARE/10062724.pdf'),
-                (217, 31, 'Nurse', 'data/HEALTHCARE/14062078.pdf'),
-                (218, 2, 'Sous Chef', 'data/CHEF/11432686.pdf'),
-                (219, 10, 'Art Critic', 'data/ARTS/15306049.pdf'),
-                (220, 34, 'Doctor', 'data/HEALTHCARE/12315079.pdf'),
-                (221, 64, 'Painter', 'data/ARTS/16962067.pdf'),
-                (222, 10, 'Pharmacist', 'data/HEALTHCARE/10480456.pdf'),
-                (223, 25, 'Retail Banker', 'data/BANKING/15553584.pdf'),
-                (224, 16, 'Costume Designer', 'data/APPAREL/10738095.pdf'),
-                (225, 20, 'DevOps Engineer', 'data/INFORMATION-TECHNOLOGY/15118506.pdf'),
-                (226, 14, 'Treasury Analyst', 'data/BANKING/11065180.pdf'),
-                (227, 78, 'Executive Chef', 'data/CHEF/12420359.pdf'),
-                (228, 75, None, 'data/PUBLIC-RELATIONS/11842274.pdf'),
-                (229, 63, None, 'data/CONSTRUCTION/12654876.pdf'),
-                (230, 67, None, 'data/CONSULTANT/12374933.pdf'),
-                (231, 15, None, 'data/AGRICULTURE/11197262.pdf'),
-                (232, 77, None, 'data/BANKING/13173522.pdf'),
-                (233, 36, None, 'data/INFORMATION-TECHNOLOGY/11584809.pdf'),
-                (234, 48, 'DevOps Engineer', 'data/INFORMATION-TECHNOLOGY/13385306.pdf'),
-                (235, 24, 'Pastry Chef', 'data/CHEF/12254068.pdf'),
-                (236, 44, 'Agronomist', 'data/AGRICULTURE/16661264.pdf'),
-                (237, 48, 'Customer Support Executive', 'data/BPO/13964744.pdf'),
-                (238, 9, 'Financial Planner', 'data/FINANCE/11490673.pdf'),
-                (239, 51, 'Art Critic', 'data/ARTS/11360471.pdf'),
-                (240, 5, 'Crop Consultant', 'data/AGRICULTURE/16172429.pdf'),
-                (241, 56, 'Speechwriter', 'data/PUBLIC-RELATIONS/12545844.pdf'),
-                (242, 44, 'Agricultural Engineer', 'data/AGRICULTURE/16661264.pdf'),
-                (243, 79, 'Pastry Chef', 'data/CHEF/11444536.pdf'),
-                (244, 8, 'Farm Manager', 'data/AGRICULTURE/15546686.pdf'),
-                (245, 77, 'Tax Analyst', 'data/ACCOUNTANT/12442909.pdf'),
-                (246, 36, 'Content Strategist', 'data/DIGITAL-MEDIA/13328680.pdf'),
-                (247, 52, 'Architectural Drafter', 'data/CONSTRUCTION/10176013.pdf'),
-                (248, 80, 'Retail Sales Associate', 'data/SALES/12082377.pdf'),
-                (249, 51, 'Healthcare Administrator', 'data/HEALTHCARE/12938200.pdf'),
-                (250, 72, 'Training and Development Manager', 'data/HR/11763983.pdf'),
-                (251, 45, 'Press Secretary', 'data/PUBLIC-RELATIONS/11635137.pdf'),
-                (252, 77, 'Reconciliation Officer', 'data/ACCOUNTANT/12442909.pdf'),
-                (253, 49, 'Site Supervisor', 'data/CONSTRUCTION/12693146.pdf'),
-                (254, 47, 'Event Coordinator', 'data/PUBLIC-RELATIONS/14009087.pdf'),
-                (255, 10, 'Group Fitness Coordinator', 'data/FITNESS/10969918.pdf'),
-                (256, 36, 'Digital Marketing Analyst', 'data/DIGITAL-MEDIA/13328680.pdf'),
-                (257, 74, 'Press Secretary', 'data/PUBLIC-RELATIONS/10070224.pdf'),
-                (258, 60, 'Client Acquisition Manager', 'data/BUSINESS-DEVELOPMENT/12632728.pdf'),
-                (259, 71, 'Mortgage Advisor', 'data/BANKING/10909673.pdf'),
-                (260, 74, None, 'data/CHEF/12155206.pdf'),
-                (261, 6, 'Account Manager', 'data/SALES/10464113.pdf'),
-                (262, 36, 'Digital Marketing Analyst', 'data/DIGITAL-MEDIA/13328680.pdf'),
-                (263, 60, 'Software Developer', 'data/INFORMATION-TECHNOLOGY/10641230.pdf'),
-                (264, 36, 'Aircraft Maintenance Engineer', 'data/AVIATION/11137306.pdf'),
-                (265, 59, 'Chemical Engineer', 'data/ENGINEERING/12518008.pdf'),
-                (266, 51, 'Aviation Safety Officer', 'data/AVIATION/12504278.pdf'),
-                (267, 14, 'Executive Chef', 'data/CHEF/10001727.pdf'),
-                (268, 9, 'Tax Consultant', 'data/FINANCE/10549585.pdf'),
-                (269, 66, 'Environmental Engineer', 'data/ENGINEERING/15601399.pdf'),
-                (270, 44, None, 'data/ENGINEERING/12472574.pdf'),
-                (271, 51, 'Quality Control Inspector', 'data/AUTOMOBILE/11797122.pdf'),
-                (272, 74, 'Ramp Agent', 'data/AVIATION/12043694.pdf'),
-                (273, 51, 'Transmission Engineer', 'data/AUTOMOBILE/11257723.pdf'),
-                (274, 71, 'Retail Banker', 'data/BANKING/10909673.pdf'),
-                (275, 60, 'Key Account Manager', 'data/BUSINESS-DEVELOPMENT/12632728.pdf'),
-                (276, 59, 'Pilot', 'data/AVIATION/10189110.pdf'),
-                (277, 77, 'Cost Control Specialist', 'data/ACCOUNTANT/12442909.pdf'),
-                (278, 56, 'Legal Consultant', 'data/CONSULTANT/11835339.pdf'),
-                (279, 6, 'Costume Designer', 'data/APPAREL/14698557.pdf'),
-                (280, 27, 'Cost Accountant', 'data/ACCOUNTANT/13072019.pdf'),
-                (281, 9, 'Financial Planner', 'data/FINANCE/10549585.pdf'),
-                (282, 3, None, 'data/INFORMATION-TECHNOLOGY/10553553.pdf'),
-                (283, 18, None, 'data/ARTS/12334650.pdf'),
-                (284, 35, 'Media Buyer', 'data/DIGITAL-MEDIA/13503650.pdf'),
-                (285, 53, 'Test Driver', 'data/AUTOMOBILE/18448085.pdf'),
-                (286, 47, 'Account Executive', 'data/BUSINESS-DEVELOPMENT/11088337.pdf'),
-                (287, 25, 'DevOps Engineer', 'data/INFORMATION-TECHNOLOGY/10840430.pdf'),
-                (288, 45, 'Agricultural Engineer', 'data/AGRICULTURE/15603319.pdf'),
-                (289, 1, 'Compliance Officer', 'data/BANKING/16407619.pdf'),
-                (290, 73, 'Teaching Assistant', 'data/TEACHER/17311685.pdf'),
-                (291, 61, None, 'data/AGRICULTURE/17640785.pdf'),
-                (292, 39, None, 'data/BPO/30709029.pdf'),
-                (293, 42, None, 'data/AGRICULTURE/11813872.pdf'),
-                (294, 58, 'Flight Instructor', 'data/AVIATION/11959428.pdf'),
-                (295, 80, 'Software Developer', 'data/INFORMATION-TECHNOLOGY/10247517.pdf'),
-                (296, 12, 'Risk Compliance Analyst', 'data/ACCOUNTANT/10554236.pdf'),
-                (297, 34, 'Sous Chef', 'data/CHEF/13264154.pdf'),
-                (298, 2, 'Civil Engineer', 'data/CONSTRUCTION/10820510.pdf'),
-                (299, 13, 'Legal Consultant', 'data/CONSULTANT/13586069.pdf'),
-                (300, 25, None, 'data/BANKING/15553584.pdf'),
-                (301, 34, 'Video Editor', 'data/DIGITAL-MEDIA/15353911.pdf'),
-                (302, 16, 'Apparel Production Manager', 'data/APPAREL/10738095.pdf'),
-                (303, 52, 'Mortgage Advisor', 'data/BANKING/17131084.pdf'),
-                (304, 32, 'Nurse', 'data/HEALTHCARE/12333703.pdf'),
-                (305, 48, None, 'data/INFORMATION-TECHNOLOGY/13385306.pdf'),
-                (306, 36, 'Construction Worker', 'data/CONSTRUCTION/10041713.pdf'),
-                (307, 51, 'Civil Engineer', 'data/ENGINEERING/12748557.pdf'),
-                (308, 1, None, 'data/HR/15375009.pdf'),
-                (309, 56, 'Inside Sales Representative', 'data/SALES/12820557.pdf'),
-                (310, 56, 'Flight Dispatcher', 'data/AVIATION/10945968.pdf'),
-                (311, 6, 'Lecturer', 'data/TEACHER/16210888.pdf'),
-                (312, 73, None, 'data/APPAREL/14413257.pdf'),
-                (313, 69, None, 'data/HR/12786012.pdf'),
-                (314, 54, 'Teaching Assistant', 'data/TEACHER/16820422.pdf'),
-                (315, 10, None, 'data/AVIATION/12239749.pdf'),
-                (316, 39, 'Test Driver', 'data/AUTOMOBILE/22732234.pdf'),
-                (317, 66, 'Chemical Engineer', 'data/ENGINEERING/15601399.pdf'),
-                (318, 63, 'Construction Worker', 'data/CONSTRUCTION/12654876.pdf'),
-                (319, 32, None, 'data/AVIATION/12904972.pdf'),
-                (320, 64, 'Sustainability Consultant', 'data/CONSULTANT/12955994.pdf'),
-                (321, 15, 'Bank Manager', 'data/BANKING/16300459.pdf'),
-                (322, 77, 'Cost Control Specialist', 'data/ACCOUNTANT/12442909.pdf'),
-                (323, 72, 'Vehicle Designer', 'data/AUTOMOBILE/16332293.pdf'),
-                (324, 42, 'Sales Operations Analyst', 'data/SALES/15273850.pdf'),
-                (325, 42, 'Talent Acquisition Manager', 'data/HR/13376919.pdf'),
-                (326, 59, 'Packaging Designer', 'data/DESIGNER/11958994.pdf'),
-                (327, 67, 'Legal Consultant', 'data/CONSULTANT/12374933.pdf'),
-                (328, 2, 'Executive Chef', 'data/CHEF/11432686.pdf'),
-                (329, 68, 'Sales Executive', 'data/SALES/14358578.pdf'),
-                (330, 45, None, 'data/FINANCE/15792052.pdf'),
-                (331, 6, 'Software Developer', 'data/INFORMATION-TECHNOLOGY/12763627.pdf'),
-                (332, 71, 'UX/UI Designer', 'data/DESIGNER/11722421.pdf'),
-                (333, 66, 'Sales Executive', 'data/SALES/10603337.pdf'),
-                (334, 30, 'Costume Designer', 'data/APPAREL/12669075.pdf'),
-                (335, 40, 'Radiologist', 'data/HEALTHCARE/13565152.pdf'),
-                (336, 36, 'Client Acquisition Manager', 'data/BUSINESS-DEVELOPMENT/12059198.pdf'),
-                (337, 14, 'Catering Manager', 'data/CHEF/10001727.pdf'),
-                (338, 47, 'Social Media Manager', 'data/DIGITAL-MEDIA/14771530.pdf'),
-                (339, 72, 'Vehicle Dynamics Analyst', 'data/AUTOMOBILE/16332293.pdf'),
-                (340, 28, 'Reconciliation Officer', 'data/ACCOUNTANT/11759079.pdf'),
-                (341, 18, 'Stylist', 'data/APPAREL/14304010.pdf'),
-                (342, 59, None, 'data/INFORMATION-TECHNOLOGY/10089434.pdf'),
-                (343, 13, 'Electrical Engineer', 'data/ENGINEERING/14554542.pdf'),
-                (344, 69, 'Retail Banker', 'data/BANKING/15856762.pdf'),
-                (345, 54, 'Treasury Analyst', 'data/BANKING/12021752.pdf'),
-                (346, 10, 'Instructional Coach', 'data/TEACHER/13296856.pdf'),
-                (347, 27, 'UX/UI Designer', 'data/DESIGNER/13998435.pdf'),
-                (348, 2, 'Healthcare Administrator', 'data/HEALTHCARE/10251432.pdf'),
-                (349, 65, 'Environmental Engineer', 'data/ENGINEERING/11890896.pdf'),
-                (350, 70, 'Chemical Engineer', 'data/ENGINEERING/14206561.pdf'),
-                (351, 27, 'Operations Manager', 'data/BPO/26829350.pdf'),
-                (352, 73, None, 'data/CONSULTANT/13313917.pdf'),
-                (353, 45, 'Retail Sales Associate', 'data/SALES/15620421.pdf'),
-                (354, 15, 'Pest Management Specialist', 'data/AGRICULTURE/11197262.pdf'),
-                (355, 40, 'Air Traffic Controller', 'data/AVIATION/12192507.pdf'),
-                (356, 34, 'Content Strategist', 'data/DIGITAL-MEDIA/15353911.pdf'),
-                (357, 2, 'Financial Planner', 'data/FINANCE/11441764.pdf'),
-                (358, 62, 'Marketing Consultant', 'data/CONSULTANT/13215696.pdf'),
-                (359, 60, 'Quality Control Inspector', 'data/AUTOMOBILE/22452756.pdf'),
-                (360, 72, 'HR Business Partner', 'data/HR/11763983.pdf'),
-                (361, 69, 'Public Affairs Specialist', 'data/PUBLIC-RELATIONS/12191094.pdf'),
-                (362, 16, 'Civil Engineer', 'data/CONSTRUCTION/12212468.pdf'),
-                (363, 42, 'Email Marketing Specialist', 'data/DIGITAL-MEDIA/14209965.pdf'),
-                (364, 43, 'Litigation Associate', 'data/ADVOCATE/10818478.pdf'),
-                (365, 24, 'Financial Consultant', 'data/CONSULTANT/11415967.pdf'),
-                (366, 4, 'Public Affairs Specialist', 'data/PUBLIC-RELATIONS/10873344.pdf'),
-                (367, 59, None, 'data/APPAREL/13764840.pdf'),
-                (368, 63, 'Subject Matter Expert', 'data/TEACHER/16270906.pdf'),
-                (369, 60, 'Speechwriter', 'data/PUBLIC-RELATIONS/10926726.pdf'),
-                (370, 56, 'Tax Analyst', 'data/ACCOUNTANT/13294301.pdf'),
-                (371, 80, 'Pastry Chef', 'data/CHEF/10889157.pdf'),
-                (372, 30, None, 'data/FINANCE/16449850.pdf'),
-                (373, 52, 'Environmental Engineer', 'data/ENGINEERING/13149176.pdf'),
-                (374, 37, 'Ramp Agent', 'data/AVIATION/10567764.pdf'),
-                (375, 15, 'Fabric Researcher', 'data/APPAREL/13418452.pdf'),
-                (376, 45, 'Treasury Analyst', 'data/FINANCE/15792052.pdf'),
-                (377, 79, None, 'data/CHEF/11444536.pdf'),
-                (378, 12, 'Business Development Executive', 'data/BUSINESS-DEVELOPMENT/11289482.pdf'),
-                (379, 63, 'Investment Analyst', 'data/FINANCE/11877150.pdf'),
-                (380, 70, 'Database Administrator', 'data/INFORMATION-TECHNOLOGY/10839851.pdf'),
-                (381, 28, 'Training and Development Manager', 'data/HR/10694288.pdf'),
-                (382, 1, 'IT Consultant', 'data/CONSULTANT/14593060.pdf'),
-                (383, 3, 'Investment Analyst', 'data/FINANCE/17392859.pdf'),
-                (384, 57, None, 'data/DIGITAL-MEDIA/12085736.pdf'),
-                (385, 34, 'Risk Compliance Analyst', 'data/ACCOUNTANT/13491889.pdf'),
-                (386, 70, None, 'data/DESIGNER/10466583.pdf'),
-                (387, 16, 'Mortgage Advisor', 'data/BANKING/13982572.pdf'),
-                (388, 51, 'Quality Control Inspector', 'data/AUTOMOBILE/11797122.pdf'),
-                (389, 40, 'Stylist', 'data/APPAREL/12122372.pdf'),
-                (390, 74, 'Media Buyer', 'data/DIGITAL-MEDIA/13837784.pdf'),
-                (391, 70, 'Vehicle Designer', 'data/AUTOMOBILE/15790602.pdf'),
-                (392, 36, 'Quality Assurance Inspector', 'data/APPAREL/13858219.pdf'),
-                (393, 43, 'Service Manager', 'data/AUTOMOBILE/18932512.pdf'),
-                (394, 61, 'Agronomist', 'data/AGRICULTURE/17640785.pdf'),
-                (395, 19, 'Management Consultant', 'data/CONSULTANT/14346702.pdf'),
-                (396, 51, 'Nurse', 'data/HEALTHCARE/12938200.pdf'),
-                (397, 26, 'HR Consultant', 'data/CONSULTANT/12251115.pdf'),
-                (398, 51, None, 'data/SALES/13637605.pdf'),
-                (399, 65, 'Criminal Lawyer', 'data/ADVOCATE/14064815.pdf'),
-                (400, 70, 'Graphic Designer', 'data/DESIGNER/10466583.pdf'),
-                (401, 50, 'Illustrator', 'data/ARTS/13272204.pdf'),
-                (402, 10, 'Account Executive', 'data/BUSINESS-DEVELOPMENT/12546838.pdf'),
-                (403, 33, 'Lecturer', 'data/TEACHER/13855004.pdf'),
-                (404, 80, 'Payroll Officer', 'data/HR/14886205.pdf'),
-                (405, 53, 'Partnership Manager', 'data/BUSINESS-DEVELOPMENT/13199813.pdf'),
-                (406, 61, 'Farm Manager', 'data/AGRICULTURE/17640785.pdf'),
-                (407, 8, 'Soil Scientist', 'data/AGRICULTURE/15546686.pdf'),
-                (408, 59, 'Aircraft Maintenance Engineer', 'data/AVIATION/11804712.pdf'),
-                (409, 27, None, 'data/FINANCE/12858898.pdf'),
-                (410, 46, 'IT Consultant', 'data/CONSULTANT/10984392.pdf'),
-                (411, 23, 'Pharmacist', 'data/HEALTHCARE/11605833.pdf'),
-                (412, 40, 'Sales Operations Analyst', 'data/SALES/14381464.pdf'),
-                (413, 50, None, 'data/AUTOMOBILE/11152490.pdf'),
-                (414, 38, 'Muralist', 'data/ARTS/14150896.pdf'),
-                (415, 8, None, 'data/AGRICULTURE/15546686.pdf'),
-                (416, 67, 'Safety Officer', 'data/CONSTRUCTION/14585273.pdf'),
-                (417, 68, None, 'data/DIGITAL-MEDIA/14556869.pdf'),
-                (418, 31, 'Personal Trainer', 'data/FITNESS/11522068.pdf'),
-                (419, 52, 'Art Teacher', 'data/ARTS/16887936.pdf'),
-                (420, 31, None, 'data/AVIATION/12144825.pdf'),
-                (421, 6, 'Mortgage Advisor', 'data/BANKING/11842348.pdf'),
-                (422, 71, 'Retail Banker', 'data/BANKING/10909673.pdf'),
-                (423, 18, 'Operations Manager', 'data/BPO/57706851.pdf'),
-                (424, 72, None, 'data/HR/11763983.pdf'),
-                (425, 53, 'Art Teacher', 'data/ARTS/17325147.pdf'),
-                (426, 60, None, 'data/ADVOCATE/14146106.pdf'),
-                (427, 79, 'Agricultural Engineer', 'data/AGRICULTURE/16653657.pdf'),
-                (428, 32, 'Healthcare Administrator', 'data/HEALTHCARE/12333703.pdf'),
-                (429, 59, None, 'data/AUTOMOBILE/23522150.pdf'),
-                (430, 74, 'Garde Manger', 'data/CHEF/11121498.pdf'),
-                (431, 43, 'Quality Assurance Inspector', 'data/APPAREL/10182582.pdf'),
-                (432, 42, 'Pest Management Specialist', 'data/AGRICULTURE/11813872.pdf'),
-                (433, 53, 'Test Driver', 'data/AUTOMOBILE/18448085.pdf'),
-                (434, 51, 'Ramp Agent', 'data/AVIATION/12504278.pdf'),
-                (435, 10, 'Corporate Counsel', 'data/ADVOCATE/13909762.pdf'),
-                (436, 48, 'PPC Specialist', 'data/DIGITAL-MEDIA/13343786.pdf'),
-                (437, 40, 'Building Inspector', 'data/CONSTRUCTION/10281555.pdf'),
-                (438, 80, 'CrossFit Coach', 'data/FITNESS/10333051.pdf'),
-                (439, 56, None, 'data/ACCOUNTANT/13294301.pdf'),
-                (440, 68, 'Sales Operations Analyst', 'data/SALES/14358578.pdf'),
-                (441, 36, 'Media Buyer', 'data/DIGITAL-MEDIA/13328680.pdf'),
-                (442, 53, 'Architectural Drafter', 'data/CONSTRUCTION/12491898.pdf'),
-                (443, 34, 'CAD Designer', 'data/AUTOMOBILE/17510973.pdf'),
-                (444, 37, 'Cost Accountant', 'data/FINANCE/16426777.pdf'),
-                (445, 69, 'Corporate Spokesperson', 'data/PUBLIC-RELATIONS/12191094.pdf'),
-                (446, 71, 'Compliance Officer', 'data/BANKING/14391434.pdf'),
-                (447, 6, None, 'data/SALES/10464113.pdf'),
-                (448, 52, 'Illustrator', 'data/ARTS/16887936.pdf'),
-                (449, 56, 'Sales Executive', 'data/SALES/10898339.pdf'),
-                (450, 56, 'Billing Analyst', 'data/ACCOUNTANT/13294301.pdf'),
-                (451, 50, 'Sculptor', 'data/ARTS/13272204.pdf'),
-                (452, 56, 'Business Development Representative', 'data/SALES/10898339.pdf'),
-                (453, 63, None, 'data/SALES/14267489.pdf'),
-                (454, 34, 'Digital Marketing Analyst', 'data/DIGITAL-MEDIA/15353911.pdf'),
-                (455, 42, 'Curriculum Developer', 'data/TEACHER/13583538.pdf'),
-                (456, 6, 'Frontend Developer', 'data/INFORMATION-TECHNOLOGY/12763627.pdf'),
-                (457, 47, 'Agricultural Engineer', 'data/AGRICULTURE/15053703.pdf'),
-                (458, 15, 'Agronomist', 'data/AGRICULTURE/11197262.pdf'),
-                (459, 15, None, 'data/BANKING/16300459.pdf'),
-                (460, 51, None, 'data/SALES/13178604.pdf'),
-                (461, 13, 'Risk Consultant', 'data/CONSULTANT/13586069.pdf'),
-                (462, 36, None, 'data/APPAREL/13858219.pdf'),
-                (463, 45, 'Treasury Analyst', 'data/FINANCE/14106638.pdf'),
-                (464, 32, 'Radiologist', 'data/HEALTHCARE/12333703.pdf'),
-                (465, 1, 'Business Development Representative', 'data/SALES/12351749.pdf'),
-                (466, 43, 'Quality Assurance Inspector', 'data/APPAREL/10182582.pdf'),
-                (467, 12, 'Cost Control Specialist', 'data/ACCOUNTANT/10554236.pdf'),
-                (468, 42, 'Payroll Officer', 'data/HR/14640322.pdf'),
-                (469, 28, None, 'data/ACCOUNTANT/11759079.pdf'),
-                (470, 25, 'Customer Support Executive', 'data/BPO/15145575.pdf'),
-                (471, 30, 'Pattern Maker', 'data/APPAREL/12669075.pdf'),
-                (472, 56, 'Corporate Spokesperson', 'data/PUBLIC-RELATIONS/12545844.pdf'),
-                (473, 39, 'Recruitment Specialist', 'data/HR/15575117.pdf'),
-                (474, 52, 'Pharmacist', 'data/HEALTHCARE/14667957.pdf'),
-                (475, 19, 'Criminal Lawyer', 'data/ADVOCATE/10186968.pdf'),
-                (476, 64, 'Marketing Consultant', 'data/CONSULTANT/12955994.pdf'),
-                (477, 38, 'Art Director', 'data/ARTS/14150896.pdf'),
-                (478, 55, 'Pilates Instructor', 'data/FITNESS/12695799.pdf'),
-                (479, 56, 'Aircraft Maintenance Engineer', 'data/AVIATION/10945968.pdf'),
-                (480, 76, 'DevOps Engineer', 'data/INFORMATION-TECHNOLOGY/13836471.pdf'),
-                (481, 73, 'Avionics Technician', 'data/AVIATION/11333001.pdf'),
-                (482, 55, 'Legal Researcher', 'data/ADVOCATE/12544735.pdf'),
-                (483, 18, 'Event Coordinator', 'data/PUBLIC-RELATIONS/11160414.pdf'),
-                (484, 14, '3D Modeler', 'data/DESIGNER/12547982.pdf'),
-                (485, 68, 'SEO Specialist', 'data/DIGITAL-MEDIA/14556869.pdf'),
-                (486, 74, 'Press Secretary', 'data/PUBLIC-RELATIONS/10070224.pdf'),
-                (487, 26, 'Commis Chef', 'data/CHEF/10333299.pdf'),
-                (488, 58, 'Aviation Safety Officer', 'data/AVIATION/11959428.pdf'),
-                (489, 23, 'Client Acquisition Manager', 'data/BUSINESS-DEVELOPMENT/14055971.pdf'),
-                (490, 27, 'Payroll Officer', 'data/HR/11698189.pdf'),
-                (491, 1, 'Retail Banker', 'data/BANKING/16407619.pdf'),
-                (492, 51, 'Team Leader', 'data/BPO/41152404.pdf'),
-                (493, 38, 'Speechwriter', 'data/PUBLIC-RELATIONS/14128006.pdf'),
-                (494, 18, 'Corporate Counsel', 'data/ADVOCATE/11773767.pdf'),
-                (495, 16, 'Architectural Drafter', 'data/CONSTRUCTION/12212468.pdf'),
-                (496, 76, 'Legal Researcher', 'data/ADVOCATE/14176254.pdf'),
-                (497, 24, 'Executive Chef', 'data/CHEF/12254068.pdf'),
-                (498, 24, 'Pastry Chef', 'data/CHEF/12254068.pdf'),
-                (499, 31, 'Ramp Agent', 'data/AVIATION/12144825.pdf'),
-                (500, 51, None, 'data/SALES/13637605.pdf'),
-                (501, 52, 'Treasury Analyst', 'data/BANKING/17131084.pdf'),
-                (502, 49, 'Financial Analyst', 'data/FINANCE/15224503.pdf'),
-                (503, 19, 'Agronomist', 'data/AGRICULTURE/14140903.pdf'),
-                (504, 73, None, 'data/AVIATION/11333001.pdf'),
-                (505, 53, 'Vehicle Dynamics Analyst', 'data/AUTOMOBILE/18448085.pdf'),
-                (506, 47, None, 'data/BUSINESS-DEVELOPMENT/11088337.pdf'),
-                (507, 77, 'Treasury Analyst', 'data/BANKING/13173522.pdf'),
-                (508, 74, 'Commis Chef', 'data/CHEF/11121498.pdf'),
-                (509, 26, 'Group Fitness Coordinator', 'data/FITNESS/13037145.pdf'),
-                (510, 38, 'Corporate Spokesperson', 'data/PUBLIC-RELATIONS/11850315.pdf'),
-                (511, 48, 'Systems Analyst', 'data/INFORMATION-TECHNOLOGY/13385306.pdf'),
-                (512, 36, 'Partnership Manager', 'data/BUSINESS-DEVELOPMENT/12059198.pdf'),
-                (513, 49, 'Transmission Engineer', 'data/AUTOMOBILE/23009962.pdf'),
-                (514, 39, 'HR Generalist', 'data/HR/15575117.pdf'),
-                (515, 63, 'Sustainability Consultant', 'data/CONSULTANT/15083600.pdf'),
-                (516, 77, 'Compensation Analyst', 'data/HR/11847784.pdf'),
-                (517, 50, 'Automobile Engineer', 'data/AUTOMOBILE/11152490.pdf'),
-                (518, 18, 'Corporate Counsel', 'data/ADVOCATE/11773767.pdf'),
-                (519, 24, 'Cloud Architect', 'data/INFORMATION-TECHNOLOGY/11957080.pdf'),
-                (520, 71, None, 'data/DESIGNER/11722421.pdf'),
-                (521, 53, 'Yoga Trainer', 'data/FITNESS/12923795.pdf'),
-                (522, 36, 'Quality Assurance Inspector', 'data/APPAREL/13858219.pdf'),
-                (523, 19, 'HR Consultant', 'data/CONSULTANT/14346702.pdf'),
-                (524, 12, 'Environmental Engineer', 'data/ENGINEERING/12022566.pdf'),
-                (525, 37, 'Cloud Architect', 'data/INFORMATION-TECHNOLOGY/12635195.pdf'),
-                (526, 52, 'Art Teacher', 'data/ARTS/16887936.pdf'),
-                (527, 18, 'Content Creator', 'data/DIGITAL-MEDIA/14036515.pdf'),
-                (528, 74, None, 'data/PUBLIC-RELATIONS/10070224.pdf'),
-                (529, 22, None, 'data/BANKING/11262933.pdf'),
-                (530, 23, None, 'data/CHEF/13411858.pdf'),
-                (531, 39, 'Automobile Engineer', 'data/AUTOMOBILE/22732234.pdf'),
-                (532, 64, 'Operations Manager', 'data/BPO/18589927.pdf'),
-                (533, 70, None, 'data/DESIGNER/10466583.pdf'),
-                (534, 35, 'Partnership Manager', 'data/BUSINESS-DEVELOPMENT/10289113.pdf'),
-                (535, 63, 'Construction Worker', 'data/CONSTRUCTION/12654876.pdf'),
-                (536, 4, 'Event Coordinator', 'data/PUBLIC-RELATIONS/10873344.pdf'),
-                (537, 4, 'Press Secretary', 'data/PUBLIC-RELATIONS/10873344.pdf'),
-                (538, 30, 'Costume Designer', 'data/APPAREL/12669075.pdf'),
-                (539, 47, 'Crisis Manager', 'data/PUBLIC-RELATIONS/14009087.pdf'),
-                (540, 31, 'Structural Engineer', 'data/CONSTRUCTION/12695537.pdf'),
-                (541, 76, None, 'data/CHEF/10653119.pdf'),
-                (542, 60, None, 'data/ADVOCATE/14146106.pdf'),
-                (543, 77, 'Payroll Officer', 'data/HR/11847784.pdf'),
-                (544, 35, 'Electrical Engineer', 'data/ENGINEERING/10030015.pdf'),
-                (545, 13, 'Software Engineer', 'data/ENGINEERING/14554542.pdf'),
-                (546, 70, 'UX/UI Designer', 'data/DESIGNER/10466583.pdf'),
-                (547, 28, 'HR Generalist', 'data/HR/10694288.pdf'),
-                (548, 10, 'Gallery Curator', 'data/ARTS/15306049.pdf'),
-                (549, 33, 'Instructional Coach', 'data/TEACHER/13855004.pdf'),
-                (550, 40, None, 'data/HEALTHCARE/13565152.pdf'),
-                (551, 42, None, 'data/HR/13376919.pdf'),
-                (552, 46, 'Financial Consultant', 'data/CONSULTANT/10984392.pdf'),
-                (553, 55, 'Pilates Instructor', 'data/FITNESS/12695799.pdf'),
-                (554, 13, 'Curriculum Developer', 'data/TEACHER/13330982.pdf'),
-                (555, 19, 'Retail Sales Associate', 'data/SALES/15581242.pdf'),
-                (556, 14, 'Kitchen Manager', 'data/CHEF/10001727.pdf'),
-                (557, 16, None, 'data/BANKING/13982572.pdf'),
-                (558, 56, 'Packaging Designer', 'data/DESIGNER/14528265.pdf'),
-                (559, 53, 'Civil Engineer', 'data/ENGINEERING/11981094.pdf'),
-                (560, 28, 'Financial Planner', 'data/ACCOUNTANT/11759079.pdf'),
-                (561, 74, None, 'data/HEALTHCARE/10466208.pdf'),
-                (562, 80, 'Chef de Partie', 'data/CHEF/10889157.pdf'),
-                (563, 49, 'Vehicle Designer', 'data/AUTOMOBILE/23009962.pdf'),
-                (564, 2, 'Commis Chef', 'data/CHEF/11432686.pdf'),
-                (565, 53, None, 'data/CONSTRUCTION/12491898.pdf'),
-                (566, 13, 'Flight Dispatcher', 'data/AVIATION/10176815.pdf'),
-                (567, 47, 'Agronomist', 'data/AGRICULTURE/12674256.pdf'),
-                (568, 36, 'Client Acquisition Manager', 'data/BUSINESS-DEVELOPMENT/12059198.pdf'),
-                (569, 48, 'Customer Retention Specialist', 'data/BPO/13964744.pdf'),
-                (570, 65, 'Electrical Engineer', 'data/ENGINEERING/12488356.pdf'),
-                (571, 52, None, 'data/BANKING/17131084.pdf'),
-                (572, 67, 'Risk Consultant', 'data/CONSULTANT/12374933.pdf'),
-                (573, 32, 'Graphic Designer', 'data/DESIGNER/11807040.pdf'),
-                (574, 60, 'Market Research Analyst', 'data/BUSINESS-DEVELOPMENT/12632728.pdf'),
-                (575, 55, 'Nutritionist', 'data/FITNESS/12938389.pdf'),
-                (576, 48, 'Wellness Coach', 'data/FITNESS/10268614.pdf'),
-                (577, 12, 'Quality Assurance Inspector', 'data/APPAREL/12059610.pdf'),
-                (578, 64, 'Customer Support Executive', 'data/BPO/18589927.pdf'),
-                (579, 64, 'Packaging Designer', 'data/DESIGNER/12674307.pdf'),
-                (580, 24, 'Frontend Developer', 'data/INFORMATION-TECHNOLOGY/11957080.pdf'),
-                (581, 11, 'Curriculum Developer', 'data/TEACHER/10909720.pdf'),
-                (582, 9, 'Tax Consultant', 'data/FINANCE/10549585.pdf'),
-                (583, 32, 'High School Teacher', 'data/TEACHER/10504237.pdf'),
-                (584, 34, 'Reconciliation Officer', 'data/ACCOUNTANT/13491889.pdf'),
-                (585, 66, 'Agronomist', 'data/AGRICULTURE/16507693.pdf'),
-                (586, 18, None, 'data/BPO/27710853.pdf'),
-                (587, 72, None, 'data/ACCOUNTANT/12338274.pdf'),
-                (588, 29, None, 'data/BPO/69097572.pdf'),
-                (589, 6, 'Flight Dispatcher', 'data/AVIATION/10395944.pdf'),
-                (590, 34, 'Digital Marketing Analyst', 'data/DIGITAL-MEDIA/15353911.pdf'),
-                (591, 74, 'Ramp Agent', 'data/AVIATION/12043694.pdf'),
-                (592, 12, 'Market Research Analyst', 'data/BUSINESS-DEVELOPMENT/11289482.pdf'),
-                (593, 44, 'Sports Therapist', 'data/FITNESS/12092347.pdf'),
-                (594, 35, 'Market Research Analyst', 'data/BUSINESS-DEVELOPMENT/10289113.pdf'),
-                (595, 14, 'Electrical Engineer', 'data/ENGINEERING/10712803.pdf'),
-                (596, 33, 'Business Development Representative', 'data/SALES/10138632.pdf'),
-                (597, 51, 'Sales Consultant', 'data/SALES/13178604.pdf'),
-                (598, 12, 'Cost Accountant', 'data/ACCOUNTANT/10554236.pdf'),
-                (599, 20, 'Inside Sales Representative', 'data/SALES/13812481.pdf'),
-                (600, 58, 'Agricultural Engineer', 'data/AGRICULTURE/10953078.pdf')
-            ]
-            
-            insert_application_query = """
-            INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_path) 
-            VALUES (%s, %s, %s, %s)
-            """
-            
-            cursor.executemany(insert_application_query, application_data)
+            for command in sql_commands.split(';'):
+                if command.strip():
+                    cursor.execute(command)
             
-            self.connection.commit()
-            print(f"Seed data loaded: {len(applicant_data)} applicants, {len(application_data)} applications")
+            connection.commit()
+            print("Extraction tables ready")
+            return True
             
-        except Error as e:
-            print(f"Data seeding error: {e}")
-            self.connection.rollback()
+        except DatabaseError as e:
+            print(f"Extraction table setup error: {e}")
+            return False
         finally:
-            cursor.close()
+            if cursor:
+                cursor.close()
+            if connection:
+                self.backend.release(connection)
+    
+    def seed_all_data(self, paths=None):
+        """Load the seed data (tubes3_seeding.sql by default, or .sql/.csv files) in one bulk transaction"""
+        report = bulk_seed(self, paths or (DEFAULT_SEED_PATH,))
+        if report:
+            print(report)
+        return report
     
-    def execute_query(self, query, params=None):
-        """Execute a SELECT query and return results"""
+    def execute_query(self, query, params=None, name="execute_query"):
+        """Execute a SELECT query on a pooled connection and return results (timed under name)"""
         try:
-            cursor = self.connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            result = cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            cursor.close()
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                with self.query_timings.measure(name, query) as measurement:
+                    if params:
+                        cursor.execute(self.backend.sql(query), params)
+                    else:
+                        cursor.execute(self.backend.sql(query))
+                    
+                    result = cursor.fetchall()
+                    measurement.rows = len(result)
+                columns = [desc[0] for desc in cursor.description]
+                cursor.close()
             
             return {"data": result, "columns": columns}
             
-        except Error as e:
+        except DatabaseError as e:
             print(f"Query execution error: {e}")
             return None
     
-    def execute_insert(self, query, params):
-        """Execute INSERT, UPDATE, DELETE queries"""
+    def _stream(self, query, params=None, batch_size=STREAM_BATCH_SIZE, dictionary=False, name="iter_query"):
+        """Generator over a SELECT: yields the column names, then the rows, fetched batch_size at a time"""
+        # Timed over the execute and fetch calls only, not while the consumer holds a batch
+        elapsed = 0.0
+        row_count = 0
+        failed = False
+        with self._connection() as connection:
+            cursor = self.backend.stream_cursor(connection, dictionary)
+            try:
+                start = time.perf_counter()
+                cursor.execute(self.backend.sql(query), params or ())
+                elapsed += time.perf_counter() - start
+                yield [desc[0] for desc in cursor.description]
+                while True:
+                    start = time.perf_counter()
+                    rows = cursor.fetchmany(batch_size)
+                    elapsed += time.perf_counter() - start
+                    if not rows:
+                        break
+                    row_count += len(rows)
+                    yield from rows
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self.backend.close_stream(connection, cursor)
+                self.query_timings.record(name, query, elapsed * 1000, row_count, failed)
+    
+    def iter_query(self, query, params=None, batch_size=STREAM_BATCH_SIZE, dictionary=False, name="iter_query"):
+        """
+        Execute a SELECT query and yield its rows as they arrive, in constant memory
+        
+        The connection stays checked out until the rows are exhausted or the
+        generator is closed, so don't run other queries while iterating from the
+        same thread on a single-connection pool. Errors are raised, not printed.
+        """
+        rows = self._stream(query, params, batch_size, dictionary, name)
+        next(rows)
+        yield from rows
+    
+    def execute_insert(self, query, params, name="execute_insert"):
+        """Execute INSERT, UPDATE, DELETE queries on a pooled connection (rolled back on error, timed like execute_query)"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            
-            affected_rows = cursor.rowcount
-            last_id = cursor.lastrowid
-            cursor.close()
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                with self.query_timings.measure(name, query) as measurement:
+                    cursor.execute(self.backend.sql(query), params)
+                    connection.commit()
+                    measurement.rows = max(cursor.rowcount, 0)
+                
+                affected_rows = cursor.rowcount
+                last_id = cursor.lastrowid
+                cursor.close()
             
             print(f"Query executed successfully. Affected rows: {affected_rows}")
             return last_id if last_id else affected_rows
             
-        except Error as e:
+        except DatabaseError as e:
             print(f"Insert/Update/Delete error: {e}")
-            self.connection.rollback()
             return None
     
     def get_all_applicants(self):
         """Get all applicants"""
         query = "SELECT * FROM ApplicantProfile ORDER BY applicant_id"
-        return self.execute_query(query)
+        return self.execute_query(query, name="get_all_applicants")
     
     def get_applicant_by_id(self, applicant_id):
         """Get applicant by ID"""
         query = "SELECT * FROM ApplicantProfile WHERE applicant_id = %s"
-        return self.execute_query(query, (applicant_id,))
+        return self.execute_query(query, (applicant_id,), name="get_applicant_by_id")
     
     def search_applicants_by_name(self, name):
         """Search applicants by first or last name"""
-        query = """
+        search_term = f"%{name}%"
+        condition = "first_name LIKE %s OR last_name LIKE %s"
+        params = (search_term, search_term)
+        
+        # The full-text index narrows the rows down, LIKE keeps the exact substring semantics.
+        # Names with LIKE wildcards in them are matched by LIKE alone.
+        name_search = None if "%" in name or "_" in name else self.backend.name_search(name)
+        if name_search:
+            index_condition, index_params = name_search
+            condition = f"{index_condition} AND ({condition})"
+            params = index_params + params
+        
+        query = f"""
         SELECT * FROM ApplicantProfile 
-        WHERE first_name LIKE %s OR last_name LIKE %s
+        WHERE {condition}
         ORDER BY applicant_id
         """
-        search_term = f"%{name}%"
-        return self.execute_query(query, (search_term, search_term))
+        return self.execute_query(query, params, name="search_applicants_by_name")
     
     def add_applicant(self, first_name, last_name, date_of_birth, address, phone_number):
-        """Add new applicant"""
+        """Add new applicant, counting them in the age statistics in the same transaction"""
         query = """
         INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number)
         VALUES (%s, %s, %s, %s, %s)
         """
-        return self.execute_insert(query, (first_name, last_name, date_of_birth, address, phone_number))
+        count_query = f"""
+        INSERT INTO BirthYearStatistics (birth_year, applicant_count)
+        SELECT COALESCE({self.backend.birth_year_expression}, 0), 1 FROM ApplicantProfile WHERE applicant_id = %s
+        {self.backend.increment_on_conflict("birth_year", "applicant_count")}
+        """
+        params = (first_name, last_name, date_of_birth, address, phone_number)
+        return self._insert_and_count(query, params, count_query, name="add_applicant")
     
     def get_all_applications(self):
         """Get all applications with applicant details"""
@@ -949,7 +377,7 @@ class ApplicantDatabaseManager:
         JOIN ApplicantProfile ap ON ad.applicant_id = ap.applicant_id
         ORDER BY ad.detail_id
         """
-        return self.execute_query(query)
+        return self.execute_query(query, name="get_all_applications")
     
     def get_applications_by_role(self, role):
         """Get applications by role"""
@@ -958,11 +386,14 @@ class ApplicantDatabaseManager:
                ad.application_role, ad.cv_path
         FROM ApplicationDetail ad
         JOIN ApplicantProfile ap ON ad.applicant_id = ap.applicant_id
-        WHERE ad.application_role LIKE %s
+        WHERE ad.application_role IN (
+            -- Match against the few distinct roles in the role index, then look the rows up by it
+            SELECT DISTINCT application_role FROM ApplicationDetail WHERE application_role LIKE %s
+        )
         ORDER BY ad.detail_id
         """
         search_term = f"%{role}%"
-        return self.execute_query(query, (search_term,))
+        return self.execute_query(query, (search_term,), name="get_applications_by_role")
     
     def get_applicant_applications(self, applicant_id):
         """Get all applications for a specific applicant"""
@@ -974,12 +405,69 @@ class ApplicantDatabaseManager:
         WHERE ad.applicant_id = %s
         ORDER BY ad.detail_id
         """
-        return self.execute_query(query, (applicant_id,))
-    def get_all_applicant_data_joined(self):
-        """Get all applicants with their application details joined"""
+        return self.execute_query(query, (applicant_id,), name="get_applicant_applications")
+    
+    def _id_chunks(self, ids):
+        """Distinct ids in first-seen order, in lists of at most IN_LIST_CHUNK_SIZE"""
+        unique_ids = list(dict.fromkeys(id_ for id_ in ids if id_ is not None))
+        for start in range(0, len(unique_ids), IN_LIST_CHUNK_SIZE):
+            yield unique_ids[start:start + IN_LIST_CHUNK_SIZE]
+    
+    def get_applicants_by_ids(self, applicant_ids):
+        """
+        Get many applicants in one query per IN_LIST_CHUNK_SIZE ids, instead of one get_applicant_by_id each
+        
+        Returns:
+            dict: applicant_id -> profile as a column -> value dict (unknown ids left out), or None on error
+        """
+        applicants = {}
+        for chunk in self._id_chunks(applicant_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            query = f"SELECT * FROM ApplicantProfile WHERE applicant_id IN ({placeholders})"
+            result = self.execute_query(query, chunk, name="get_applicants_by_ids")
+            if result is None:
+                return None
+            columns = result["columns"]
+            for row in result["data"]:
+                applicant = dict(zip(columns, row))
+                applicants[applicant["applicant_id"]] = applicant
+        return applicants
+    
+    def get_applications_by_applicant_ids(self, applicant_ids):
+        """
+        Get the applications of many applicants in one query per IN_LIST_CHUNK_SIZE ids,
+        instead of one get_applicant_applications each
+        
+        Returns:
+            dict: applicant_id -> list of application dicts ordered by detail_id (empty for
+                  applicants without applications), or None on error
+        """
+        applications = {applicant_id: [] for chunk in self._id_chunks(applicant_ids) for applicant_id in chunk}
+        for chunk in self._id_chunks(applicant_ids):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            query = f"""
+            SELECT ad.applicant_id, ad.detail_id, ad.application_role, ad.cv_path,
+                   ap.first_name, ap.last_name
+            FROM ApplicationDetail ad
+            JOIN ApplicantProfile ap ON ad.applicant_id = ap.applicant_id
+            WHERE ad.applicant_id IN ({placeholders})
+            ORDER BY ad.applicant_id, ad.detail_id
+            """
+            result = self.execute_query(query, chunk, name="get_applications_by_applicant_ids")
+            if result is None:
+                return None
+            columns = result["columns"]
+            for row in result["data"]:
+                application = dict(zip(columns, row))
+                applications.setdefault(application["applicant_id"], []).append(application)
+        return applications
+    
+    def iter_all_applicant_data_joined(self, batch_size=STREAM_BATCH_SIZE):
+        """Yield all applicants with their application details joined, as dicts, without loading them all"""
         query = """
             SELECT
                 p.applicant_id,
+                d.detail_id,
                 p.first_name,
                 p.last_name,
                 p.date_of_birth,
@@ -993,57 +481,205 @@ class ApplicantDatabaseManager:
                 ApplicationDetail d ON p.applicant_id = d.applicant_id
             ORDER BY p.applicant_id
         """
-        
+        return self.iter_query(query, batch_size=batch_size, dictionary=True, name="iter_all_applicant_data_joined")
+    
+    def get_all_applicant_data_joined(self):
+        """Get all applicants with their application details joined"""
         try:
-            # Check if connection exists and is active
-            if not self.connection or not self.connection.is_connected():
-                print("Connection lost. Attempting to reconnect...")
-                if not self.connect():
-                    print("Failed to reconnect to database")
-                    return []
-            
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
-            
+            # Connects on first use; the pool replaces connections the server dropped
+            results = list(self.iter_all_applicant_data_joined())
             print(f"Retrieved {len(results)} joined applicant records")
             return results
             
-        except Error as e:
+        except DatabaseError as e:
             print(f"Error fetching joined applicant data: {e}")
             return []
+    def get_extraction_hashes(self):
+        """Get the content hash each application's CV was last extracted from, keyed by detail_id"""
+        result = self.execute_query("SELECT detail_id, content_hash FROM CvExtraction", name="get_extraction_hashes")
+        if not result:
+            return {}
+        return {detail_id: content_hash for detail_id, content_hash in result["data"]}
+    
+    def save_extracted_details(self, extractions):
+        """
+        Replace the extracted skills, jobs and education of a batch of applications in one transaction
+        
+        Args:
+            extractions: List of (detail_id, content_hash, details) where details holds normalized
+                         'summary', 'skills' (names), 'experience' and 'education' (dicts)
+        """
+        if not extractions:
+            return 0
+        connection = cursor = None
+        try:
+            connection = self._acquire()
+            cursor = self.query_timings.cursor(connection.cursor(), "save_extracted_details")
+            self.backend.begin(connection)
+            sql = self.backend.sql
+            detail_ids = [detail_id for detail_id, _, _ in extractions]
+            placeholders = ", ".join(["%s"] * len(detail_ids))
+            for table in ("ApplicationSkill", "JobHistory", "EducationHistory", "CvExtraction"):
+                cursor.execute(sql(f"DELETE FROM {table} WHERE detail_id IN ({placeholders})"), detail_ids)
+            
+            skill_names = sorted({skill for _, _, details in extractions for skill in details["skills"]})
+            skill_ids = {}
+            if skill_names:
+                cursor.executemany(sql(f"{self.backend.insert_ignore} INTO Skill (name) VALUES (%s)"),
+                                   [(name,) for name in skill_names])
+                skill_placeholders = ", ".join(["%s"] * len(skill_names))
+                cursor.execute(sql(f"SELECT skill_id, name FROM Skill WHERE name IN ({skill_placeholders})"), skill_names)
+                skill_ids = {name.lower(): skill_id for skill_id, name in cursor.fetchall()}
+            
+            now = datetime.now()
+            cursor.executemany(
+                sql("INSERT INTO CvExtraction (detail_id, content_hash, extracted_at, summary) VALUES (%s, %s, %s, %s)"),
+                [(detail_id, content_hash, now, details["summary"]) for detail_id, content_hash, details in extractions]
+            )
+            cursor.executemany(
+                sql(f"{self.backend.insert_ignore} INTO ApplicationSkill (detail_id, skill_id) VALUES (%s, %s)"),
+                [(detail_id, skill_ids[skill.lower()])
+                 for detail_id, _, details in extractions for skill in details["skills"] if skill.lower() in skill_ids]
+            )
+            cursor.executemany(
+                sql("INSERT INTO JobHistory (detail_id, position, company, period) VALUES (%s, %s, %s, %s)"),
+                [(detail_id, job["position"], job["company"], job["period"])
+                 for detail_id, _, details in extractions for job in details["experience"]]
+            )
+            cursor.executemany(
+                sql("INSERT INTO EducationHistory (detail_id, degree, institution, period) VALUES (%s, %s, %s, %s)"),
+                [(detail_id, education["degree"], education["institution"], education["period"])
+                 for detail_id, _, details in extractions for education in details["education"]]
+            )
+            connection.commit()
+            return len(extractions)
+            
+        except DatabaseError as e:
+            print(f"Extraction save error: {e}")
+            return None
+        finally:
+            # Releasing rolls back a failed batch
+            if cursor:
+                cursor.close()
+            if connection:
+                self.backend.release(connection)
+    
+    def find_applications_by_skill(self, skill):
+        """Get applications whose CV lists a skill (indexed lookup, case-insensitive)"""
+        query = """
+        SELECT ad.detail_id, ad.applicant_id, ap.first_name, ap.last_name,
+               ad.application_role, ad.cv_path
+        FROM Skill s
+        JOIN ApplicationSkill aps ON aps.skill_id = s.skill_id
+        JOIN ApplicationDetail ad ON ad.detail_id = aps.detail_id
+        JOIN ApplicantProfile ap ON ap.applicant_id = ad.applicant_id
+        WHERE s.name = %s
+        ORDER BY ad.detail_id
+        """
+        return self.execute_query(query, (skill,), name="find_applications_by_skill")
+    
+    def get_top_skills(self, limit=20):
+        """Get the skills listed by the most applications"""
+        query = """
+        SELECT s.name, COUNT(*) as count
+        FROM ApplicationSkill aps
+        JOIN Skill s ON s.skill_id = aps.skill_id
+        GROUP BY s.skill_id, s.name
+        ORDER BY count DESC
+        LIMIT %s
+        """
+        return self.execute_query(query, (limit,), name="get_top_skills")
+    
     def add_application(self, applicant_id, application_role, cv_path):
-        """Add new application"""
+        """Add new application, counting it in the role statistics in the same transaction"""
         query = """
         INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path)
         VALUES (%s, %s, %s)
         """
-        return self.execute_insert(query, (applicant_id, application_role, cv_path))
+        count_query = f"""
+        INSERT INTO RoleStatistics (role, application_count)
+        SELECT {ROLE_STATISTICS_KEY}, 1 FROM ApplicationDetail WHERE detail_id = %s
+        {self.backend.increment_on_conflict("role", "application_count")}
+        """
+        return self._insert_and_count(query, (applicant_id, application_role, cv_path), count_query, name="add_application")
+    
+    def _insert_and_count(self, query, params, count_query, name):
+        """Insert one row and bump its statistics counter (count_query, given the new row's id) in one transaction, timed as name"""
+        try:
+            with self._connection() as connection:
+                cursor = self.query_timings.cursor(connection.cursor(), name)
+                self.backend.begin(connection)
+                cursor.execute(self.backend.sql(query), params)
+                affected_rows = cursor.rowcount
+                last_id = cursor.lastrowid
+                cursor.execute(self.backend.sql(count_query), (last_id,))
+                connection.commit()
+                cursor.close()
+            
+            print(f"Query executed successfully. Affected rows: {affected_rows}")
+            return last_id if last_id else affected_rows
+            
+        except DatabaseError as e:
+            print(f"Insert/Update/Delete error: {e}")
+            return None
+    
+    def _rebuild_statistics(self, cursor):
+        """Recount RoleStatistics and BirthYearStatistics from the tables; the caller commits"""
+        cursor.execute("DELETE FROM RoleStatistics")
+        cursor.execute("DELETE FROM BirthYearStatistics")
+        cursor.execute(f"""
+            INSERT INTO RoleStatistics (role, application_count)
+            SELECT {ROLE_STATISTICS_KEY}, COUNT(*) FROM ApplicationDetail GROUP BY {ROLE_STATISTICS_KEY}
+        """)
+        birth_year = f"COALESCE({self.backend.birth_year_expression}, 0)"
+        cursor.execute(f"""
+            INSERT INTO BirthYearStatistics (birth_year, applicant_count)
+            SELECT {birth_year}, COUNT(*) FROM ApplicantProfile GROUP BY {birth_year}
+        """)
+    
+    def refresh_statistics(self):
+        """
+        Recount the role and age statistics from scratch. add_applicant, add_application and
+        seed_all_data keep them current; call this after changing the tables with other SQL
+        """
+        connection = cursor = None
+        try:
+            connection = self._acquire()
+            cursor = self.query_timings.cursor(connection.cursor(), "refresh_statistics")
+            self.backend.begin(connection)
+            self._rebuild_statistics(cursor)
+            connection.commit()
+            return True
+            
+        except DatabaseError as e:
+            print(f"Statistics refresh error: {e}")
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                self.backend.release(connection)
     
     def get_role_statistics(self):
-        """Get statistics of applications by role"""
+        """Get statistics of applications by role (read from RoleStatistics, no scan of the applications)"""
         query = """
-        SELECT 
-            COALESCE(application_role, 'No Role Specified') as role,
-            COUNT(*) as count
-        FROM ApplicationDetail
-        GROUP BY application_role
-        ORDER BY count DESC
+        SELECT role, application_count as count
+        FROM RoleStatistics
+        ORDER BY count DESC, role
         """
-        return self.execute_query(query)
+        return self.execute_query(query, name="get_role_statistics")
     
     def get_age_distribution(self):
-        """Get age distribution of applicants"""
+        """Get age distribution of applicants (read from BirthYearStatistics, no scan of the applicants)"""
+        # Birth year 0 counts the applicants without a date of birth, whose age is unknown
         query = """
-        SELECT 
-            YEAR(CURDATE()) - YEAR(date_of_birth) as age,
-            COUNT(*) as count
-        FROM ApplicantProfile
-        GROUP BY age
+        SELECT
+            CASE WHEN birth_year = 0 THEN NULL ELSE %s - birth_year END as age,
+            applicant_count as count
+        FROM BirthYearStatistics
         ORDER BY age
         """
-        return self.execute_query(query)
+        return self.execute_query(query, (datetime.now().year,), name="get_age_distribution")
     
     def get_applications_without_role(self):
         """Get applications without specified role"""
@@ -1054,24 +690,31 @@ class ApplicantDatabaseManager:
         WHERE ad.application_role IS NULL
         ORDER BY ad.detail_id
         """
-        return self.execute_query(query)
+        return self.execute_query(query, name="get_applications_without_role")
     
-    def export_to_csv(self, query, filename, params=None):
-        """Export query results to CSV file"""
+    def export_to_file(self, query, filename, fmt="csv", params=None, compress=False):
+        """Export query results to a CSV or NDJSON file (gzipped if compress), streaming the rows in constant memory"""
         try:
-            result = self.execute_query(query, params)
-            if result:
-                filepath = os.path.join("exports", filename)
-                with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(result["columns"])
-                    writer.writerows(result["data"])
-                print(f"Data exported to {filepath}")
-                return filepath
+            report = export_query(self, query, os.path.join("exports", filename), fmt, params, compress)
+            print(f"Data exported to {report.files[0]}")
+            print(report)
+            return report.files[0]
         except Exception as e:
             print(f"Export error: {e}")
             return None
     
+    def export_to_csv(self, query, filename, params=None, compress=False):
+        """Export query results to CSV file"""
+        return self.export_to_file(query, filename, "csv", params, compress)
+    
+    def export_to_ndjson(self, query, filename, params=None, compress=False):
+        """Export query results to a newline-delimited JSON file, one object per row"""
+        return self.export_to_file(query, filename, "ndjson", params, compress)
+    
+    def export_to_json(self, query, filename, params=None, compress=False):
+        """Export query results to a JSON file holding one array of row objects, streamed like the other formats"""
+        return self.export_to_file(query, filename, "json", params, compress)
+    
     def export_applicants_to_csv(self):
         """Export all applicants to CSV"""
         query = "SELECT * FROM ApplicantProfile ORDER BY applicant_id"
@@ -1093,22 +736,12 @@ class ApplicantDatabaseManager:
         return self.export_to_csv(query, filename)
     
     def save_query_result_json(self, result, filename):
-        """Save query result to JSON file"""
+        """Save query result to a JSON file, writing the rows one object at a time"""
         try:
             if result:
-                data = []
-                for row in result["data"]:
-                    row_dict = {}
-                    for i, column in enumerate(result["columns"]):
-                        value = row[i]
-                        if hasattr(value, 'strftime'):
-                            value = value.strftime('%Y-%m-%d')
-                        row_dict[column] = value
-                    data.append(row_dict)
-                
                 filepath = os.path.join("exports", filename)
                 with open(filepath, 'w', encoding='utf-8') as jsonfile:
-                    json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+                    write_json(jsonfile, result["columns"], result["data"])
                 print(f"Data exported to {filepath}")
                 return filepath
         except Exception as e:
@@ -1172,6 +805,10 @@ def main():
             for row in result["data"][:3]:
                 print(f"   {row[0]}: {row[2]} {row[3]}")
         
+        # 7. Query latency
+        print("\n7. Query latency:")
+        print(db.query_timings.report())
+        
         print("\n✅ Demo completed successfully!")
         
     except Exception as e:
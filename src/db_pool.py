@@ -0,0 +1,180 @@
+# src/db_pool.py
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import mysql.connector
+from mysql.connector import Error
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_CHECKOUT_TIMEOUT = 10.0
+# A connection idle for longer than this is pinged before it is handed out
+DEFAULT_HEALTH_CHECK_IDLE = 30.0
+
+
+class PoolTimeoutError(Error):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of MySQL connections.
+
+    At most `size` connections are open; they are created on first demand and
+    reused most-recently-released first, so a light load keeps few of them
+    busy. A checkout waits up to `checkout_timeout` seconds for a free slot.
+    Connections that sat idle longer than `health_check_idle` seconds are
+    pinged before reuse and replaced if the server dropped them, and a
+    connection is discarded when a statement on it fails and it cannot be
+    rolled back. A transaction still open on release is rolled back, so no
+    snapshot or lock leaks to the next borrower; open the connections with
+    autocommit so that only explicit transactions, not every read, pay
+    for that rollback.
+    """
+    def __init__(self, config: Dict[str, Any], size: int = DEFAULT_POOL_SIZE,
+                 checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+                 health_check_idle: float = DEFAULT_HEALTH_CHECK_IDLE,
+                 connect: Callable[..., Any] = mysql.connector.connect):
+        """
+        Args:
+            config: Keyword arguments of mysql.connector.connect.
+            size: Maximum number of open connections.
+            checkout_timeout: Seconds a checkout waits for a free connection.
+            health_check_idle: Idle seconds after which a connection is pinged before reuse.
+            connect: Connection factory, mysql.connector.connect by default.
+        """
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.config = dict(config)
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_idle = health_check_idle
+        self._connect = connect
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: "queue.LifoQueue[Tuple[Any, float]]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.created = 0
+        self.replaced = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Checks a connection out of the pool. Pair with release(), or use connection().
+
+        Raises:
+            PoolTimeoutError: If every connection stays busy for the timeout
+            Error: If a new connection cannot be opened
+        """
+        if self._closed:
+            raise Error("connection pool is closed")
+        wait = self.checkout_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=wait):
+            with self._lock:
+                self.timeouts += 1
+            raise PoolTimeoutError(f"no database connection free after {wait:.1f} s "
+                                   f"(pool size {self.size})")
+        try:
+            connection = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+        return connection
+
+    def _checkout(self):
+        while True:
+            try:
+                connection, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect(**self.config)
+                with self._lock:
+                    self.created += 1
+                return connection
+            if time.monotonic() - idle_since < self.health_check_idle or self._is_healthy(connection):
+                return connection
+            self._close_quietly(connection)
+            with self._lock:
+                self.replaced += 1
+
+    @staticmethod
+    def _is_healthy(connection) -> bool:
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Error:
+            pass
+
+    def release(self, connection, discard: bool = False):
+        """Returns a checked-out connection, or closes it if discard is set or the pool is closed."""
+        try:
+            if not discard and getattr(connection, "in_transaction", False):
+                connection.rollback()
+        except Error:
+            discard = True
+        if discard or self._closed:
+            self._close_quietly(connection)
+        else:
+            self._idle.put((connection, time.monotonic()))
+        with self._lock:
+            self.in_use -= 1
+        self._slots.release()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrows a connection for the duration of a with block. If the block
+        raises, the transaction is rolled back; a connection that cannot be
+        rolled back is discarded instead of returned.
+        """
+        connection = self.acquire(timeout)
+        discard = False
+        try:
+            yield connection
+        except BaseException:
+            try:
+                connection.rollback()
+            except Error:
+                discard = True
+            raise
+        finally:
+            self.release(connection, discard)
+
+    def close(self):
+        """Closes the idle connections; busy ones are closed when released."""
+        self._closed = True
+        idle: List[Any] = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait()[0])
+            except queue.Empty:
+                break
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "open": self.in_use + self._idle.qsize(),
+                "in_use": self.in_use,
+                "created": self.created,
+                "replaced": self.replaced,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+            }
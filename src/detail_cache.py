@@ -0,0 +1,52 @@
+# src/detail_cache.py
+
+import threading
+from typing import Any, Dict, Optional
+
+from cv_extractor import extract_info_from_text
+
+
+class DetailCache:
+    """
+    Thread-safe memo of extract_info_from_text results keyed by the content
+    hash of the CV text, shared by the summary view and the background
+    precompute of the current top-K. Entries are never stale: a changed CV
+    has a different hash.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[bytes, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def get_or_extract(self, key: bytes, cv_text: str) -> Dict[str, Any]:
+        """
+        Returns the extracted details of a CV, extracting them on first use.
+
+        Args:
+            key: Content hash of the CV text.
+            cv_text: The CV text, only read on a miss.
+
+        Returns:
+            Dict[str, Any]: Output of extract_info_from_text (do not mutate)
+        """
+        with self._lock:
+            details = self._entries.get(key)
+            if details is not None:
+                self.hits += 1
+                return details
+            self.misses += 1
+
+        details = extract_info_from_text(cv_text)
+        with self._lock:
+            return self._entries.setdefault(key, details)
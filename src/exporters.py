@@ -0,0 +1,222 @@
+# src/exporters.py
+
+import csv
+import gzip
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Sequence, TextIO
+
+from storage import STREAM_BATCH_SIZE
+
+FORMATS = ("csv", "ndjson", "json")
+EXPORT_DIR = "exports"
+# gzip's own default; level 9 costs far more time for a few percent of size
+GZIP_LEVEL = 6
+
+APPLICATION_EXPORT_QUERY = """
+SELECT ad.detail_id, ad.applicant_id, ap.first_name, ap.last_name,
+       ad.application_role, ad.cv_path, ap.date_of_birth, ap.address, ap.phone_number
+FROM ApplicationDetail ad
+JOIN ApplicantProfile ap ON ad.applicant_id = ap.applicant_id
+{where}
+ORDER BY ad.detail_id
+"""
+NO_ROLE_PARTITION = "no-role"
+
+
+@dataclass
+class ExportReport:
+    """
+    Outcome of an export.
+
+    Attributes:
+        files: Files written.
+        rows: Rows written over all files.
+        bytes_written: Size of the files on disk (compressed size for gzip).
+        seconds: Wall-clock duration.
+    """
+    files: List[str] = field(default_factory=list)
+    rows: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: "ExportReport"):
+        self.files.extend(other.files)
+        self.rows += other.rows
+        self.bytes_written += other.bytes_written
+
+    def __str__(self) -> str:
+        rows_per_second = self.rows / self.seconds if self.seconds else 0.0
+        mb_per_second = self.bytes_written / 1e6 / self.seconds if self.seconds else 0.0
+        return (f"Exported {self.rows} rows to {len(self.files)} file(s), {self.bytes_written / 1e6:.2f} MB "
+                f"in {self.seconds:.3f} s ({rows_per_second:,.0f} rows/s, {mb_per_second:.1f} MB/s)")
+
+
+def _json_value(value: Any) -> Any:
+    # Dates as in save_query_result_json; anything else JSON lacks as text
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+def write_csv(out: TextIO, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Writes a header and the rows as they come. Returns the row count."""
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    # writerows keeps the loop in C; the counter ticks once per row it pulls
+    counter = itertools.count()
+    writer.writerows(row for row, _ in zip(rows, counter))
+    return next(counter)
+
+
+def write_ndjson(out: TextIO, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Writes one JSON object per line, as the rows come. Returns the row count."""
+    encode = json.JSONEncoder(ensure_ascii=False, default=_json_value).encode
+    count = 0
+    for row in rows:
+        out.write(encode(dict(zip(columns, row))) + "\n")
+        count += 1
+    return count
+
+
+def write_json(out: TextIO, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Writes a JSON array with one object per row, laid out as json.dump(..., indent=2)
+    would, but row by row as they come. Returns the row count.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, indent=2, default=_json_value).encode
+    count = 0
+    out.write("[")
+    for row in rows:
+        # Newlines inside string values are escaped, so every raw one is indentation
+        out.write(("," if count else "") + "\n  " + encode(dict(zip(columns, row))).replace("\n", "\n  "))
+        count += 1
+    out.write("\n]" if count else "]")
+    return count
+
+
+WRITERS = {"csv": write_csv, "ndjson": write_ndjson, "json": write_json}
+
+
+def export_path(name: str, fmt: str, compress: bool, directory: str = EXPORT_DIR) -> str:
+    return os.path.join(directory, f"{name}.{fmt}" + (".gz" if compress else ""))
+
+
+def export_query(db, query: str, path: str, fmt: str = "csv", params: Optional[Sequence[Any]] = None,
+                 compress: bool = False, batch_size: int = STREAM_BATCH_SIZE) -> ExportReport:
+    """
+    Streams the result of a query into a CSV, NDJSON or JSON file, optionally
+    gzip-compressed. Rows are written as they are fetched, so memory use does
+    not grow with the result. A failed export leaves no partial file behind.
+
+    Args:
+        db: An ApplicantDatabaseManager.
+        query: SELECT statement.
+        path: Output file.
+        fmt: "csv", "ndjson" or "json" (one array).
+        params: Query parameters.
+        compress: gzip the output.
+        batch_size: Rows fetched per round trip.
+
+    Returns:
+        ExportReport: The file, row count, size and duration
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"unknown export format: {fmt} (expected one of {', '.join(FORMATS)})")
+    start = time.perf_counter()
+    rows = db._stream(query, params, batch_size, name="export")
+    try:
+        columns = next(rows)
+        try:
+            if compress:
+                out = gzip.open(path, "wt", compresslevel=GZIP_LEVEL, newline="", encoding="utf-8")
+            else:
+                out = open(path, "w", newline="", encoding="utf-8")
+            with out:
+                count = WRITERS[fmt](out, columns, rows)
+        except BaseException:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+    finally:
+        rows.close()
+    return ExportReport([path], count, os.path.getsize(path), time.perf_counter() - start)
+
+
+def _partition_name(role: Optional[str]) -> str:
+    if role is None:
+        return NO_ROLE_PARTITION
+    return re.sub(r"[^A-Za-z0-9]+", "-", role).strip("-") or NO_ROLE_PARTITION
+
+
+def export_applications_by_role(db, fmt: str = "csv", compress: bool = False, workers: Optional[int] = None,
+                                directory: str = EXPORT_DIR, prefix: str = "applications") -> ExportReport:
+    """
+    Exports all applications into one file per role, the files written in
+    parallel. Each worker streams its role on its own pooled connection
+    (per-thread connection on SQLite), so keep workers at or below the pool
+    size to avoid waiting on checkouts.
+
+    Returns:
+        ExportReport: Totals over all partitions
+    """
+    start = time.perf_counter()
+    result = db.execute_query("SELECT DISTINCT application_role FROM ApplicationDetail", name="export_applications_by_role")
+    roles = [row[0] for row in result["data"]] if result else []
+    os.makedirs(directory, exist_ok=True)
+
+    # Roles that differ only in punctuation get numbered file names
+    names = {}
+    for role in roles:
+        name = base = f"{prefix}_{_partition_name(role)}"
+        suffix = 2
+        while name in names.values():
+            name, suffix = f"{base}-{suffix}", suffix + 1
+        names[role] = name
+
+    def export_role(role: Optional[str]) -> ExportReport:
+        name = names[role]
+        if role is None:
+            query, params = APPLICATION_EXPORT_QUERY.format(where="WHERE ad.application_role IS NULL"), None
+        else:
+            query, params = APPLICATION_EXPORT_QUERY.format(where="WHERE ad.application_role = %s"), (role,)
+        return export_query(db, query, export_path(name, fmt, compress, directory), fmt, params, compress)
+
+    report = ExportReport()
+    workers = workers or getattr(db.backend, "pool_size", None) or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for partition in pool.map(export_role, roles):
+            report.add(partition)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+# Usage: python exporters.py [csv|ndjson|json] [--gzip] [--by-role] [--workers N]
+if __name__ == '__main__':
+    from database import ApplicantDatabaseManager
+
+    args = sys.argv[1:]
+    fmt = next((arg for arg in args if arg in FORMATS), "csv")
+    compress = "--gzip" in args
+    workers = int(args[args.index("--workers") + 1]) if "--workers" in args else None
+
+    db = ApplicantDatabaseManager()
+    if not db.connect():
+        sys.exit(1)
+    try:
+        if "--by-role" in args:
+            report = export_applications_by_role(db, fmt, compress, workers)
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report = export_query(db, APPLICATION_EXPORT_QUERY.format(where=""),
+                                  export_path(f"applications_{timestamp}", fmt, compress), fmt, compress=compress)
+        print(report)
+    finally:
+        db.disconnect()
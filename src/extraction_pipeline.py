@@ -0,0 +1,194 @@
+# src/extraction_pipeline.py
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from cv_pipeline import CvPipeline, PipelineStats, StageMetrics
+from text_store import file_digest
+
+CV_ROOT = os.path.join("archive", "data")
+WRITE_BATCH_SIZE = 200
+
+# Column widths of the extraction tables
+SKILL_NAME_LENGTH = 100
+FIELD_LENGTH = 255
+PERIOD_LENGTH = 100
+
+
+@dataclass
+class ExtractionReport:
+    """
+    Outcome of one pipeline run.
+
+    Attributes:
+        applications: Applications with a CV on disk.
+        files_extracted: Distinct CV files parsed this run.
+        applications_skipped: Applications whose CV was unchanged since the last run.
+        applications_saved: Applications whose rows were rewritten.
+        missing_files: Applications whose CV file was not found.
+        seconds: Wall-clock duration of the run.
+        pipeline: Per-stage timings and byte counts of the extracted files.
+    """
+    applications: int = 0
+    files_extracted: int = 0
+    applications_skipped: int = 0
+    applications_saved: int = 0
+    missing_files: int = 0
+    seconds: float = 0.0
+    pipeline: PipelineStats = field(default_factory=PipelineStats)
+
+    def __str__(self) -> str:
+        rate = self.files_extracted / self.seconds if self.seconds else 0.0
+        return (f"{self.applications} applications, {self.files_extracted} files extracted "
+                f"({rate:.1f} files/s), {self.applications_skipped} unchanged, "
+                f"{self.applications_saved} saved, {self.missing_files} missing, {self.seconds:.2f} s")
+
+
+def _clip(value: Any, length: int) -> str:
+    return " ".join(str(value or "").split())[:length]
+
+
+def normalize_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shapes extract_info_from_text output for the extraction tables:
+    whitespace collapsed, values clipped to their column width, and skills
+    de-duplicated case-insensitively (the Skill table compares names
+    case-insensitively, so "SQL" and "sql" are one skill).
+    """
+    skills: List[str] = []
+    seen = set()
+    for skill in details.get("skills", []):
+        name = _clip(skill.strip(" -•.;"), SKILL_NAME_LENGTH)
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            skills.append(name)
+    return {
+        "summary": _clip(details.get("summary"), 65535),
+        "skills": skills,
+        "experience": [
+            {"position": _clip(job.get("position"), FIELD_LENGTH),
+             "company": _clip(job.get("company"), FIELD_LENGTH),
+             "period": _clip(job.get("period"), PERIOD_LENGTH)}
+            for job in details.get("experience", [])
+        ],
+        "education": [
+            {"degree": _clip(education.get("degree"), FIELD_LENGTH),
+             "institution": _clip(education.get("institution"), FIELD_LENGTH),
+             "period": _clip(education.get("period"), PERIOD_LENGTH)}
+            for education in details.get("education", [])
+        ],
+    }
+
+
+def _extract_file(cv_path: str) -> Tuple[Dict[str, Any], Dict[str, StageMetrics]]:
+    """Worker task: runs one PDF through the pipeline, returns its normalized details and stage metrics."""
+    processed = CvPipeline().process(cv_path)
+    return normalize_details(processed.details), processed.metrics
+
+
+def run_extraction_pipeline(db, workers: Optional[int] = None, force: bool = False,
+                            cv_root: str = CV_ROOT) -> ExtractionReport:
+    """
+    Extracts the structured fields of every CV in the database in parallel
+    and stores them in the CvExtraction, ApplicationSkill, JobHistory and
+    EducationHistory tables.
+
+    A CV file is parsed once however many applications share it, and an
+    application whose file digest matches the one stored at its last
+    extraction is skipped unless force is set. Results are written in
+    batches, each batch in one transaction.
+
+    Args:
+        db: A connected ApplicantDatabaseManager.
+        workers: Worker processes, defaults to the CPU count.
+        force: Re-extract every CV even if unchanged.
+        cv_root: Directory the cv_path column is relative to.
+
+    Returns:
+        ExtractionReport: Counts and duration of the run
+    """
+    start = time.perf_counter()
+    report = ExtractionReport()
+    db.setup_extraction_tables()
+
+    result = db.execute_query("SELECT detail_id, cv_path FROM ApplicationDetail ORDER BY detail_id",
+                              name="run_extraction_pipeline")
+    stored_hashes = {} if force else db.get_extraction_hashes()
+
+    # digest -> (full path, [detail_id, ...]) of the files that need extracting
+    pending: Dict[str, Tuple[str, List[int]]] = {}
+    for detail_id, cv_path in (result["data"] if result else []):
+        full_path = os.path.join(cv_root, cv_path) if cv_path else ""
+        if not full_path or not os.path.exists(full_path):
+            report.missing_files += 1
+            continue
+        report.applications += 1
+        digest = file_digest(full_path).hex()
+        if stored_hashes.get(detail_id) == digest:
+            report.applications_skipped += 1
+            continue
+        pending.setdefault(digest, (full_path, []))[1].append(detail_id)
+
+    batch: List[Tuple[int, str, Dict[str, Any]]] = []
+
+    def flush():
+        if batch:
+            saved = db.save_extracted_details(batch)
+            report.applications_saved += saved or 0
+            batch.clear()
+
+    jobs = list(pending.items())
+    workers = workers or os.cpu_count() or 1
+    if jobs:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as pool:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = pool.map(_extract_file, [full_path for _, (full_path, _) in jobs], chunksize=chunksize)
+            for (digest, (full_path, detail_ids)), (details, metrics) in zip(jobs, results):
+                report.files_extracted += 1
+                report.pipeline.add(full_path, metrics)
+                batch.extend((detail_id, digest, details) for detail_id in detail_ids)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    flush()
+    flush()
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+# Usage: python extraction_pipeline.py [--force] [skill ...]
+if __name__ == '__main__':
+    from database import ApplicantDatabaseManager
+
+    args = sys.argv[1:]
+    force = "--force" in args
+    skills = [arg for arg in args if arg != "--force"]
+
+    db = ApplicantDatabaseManager()
+    if not db.connect():
+        sys.exit(1)
+    try:
+        report = run_extraction_pipeline(db, force=force)
+        print(report)
+        if report.files_extracted:
+            print(report.pipeline.report())
+
+        for skill in skills:
+            result = db.find_applications_by_skill(skill)
+            rows = result["data"] if result else []
+            print(f"\nApplications listing '{skill}': {len(rows)}")
+            for detail_id, applicant_id, first_name, last_name, role, cv_path in rows[:10]:
+                print(f"  #{detail_id} {first_name} {last_name} ({role}) {cv_path}")
+
+        top = db.get_top_skills(10)
+        if top:
+            print("\nTop skills:")
+            for name, count in top["data"]:
+                print(f"  {name}: {count}")
+    finally:
+        db.disconnect()
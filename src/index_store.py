@@ -0,0 +1,629 @@
+# src/index_store.py
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from algorithm.ngram_filter import NGramSignature, SIGNATURE_BITS
+from inverted_index import InvertedIndex
+from scoring import CorpusStatistics, tokenize
+from text_store import TextStore
+
+# File layout (all integers little-endian, every section starts 8-byte aligned):
+#   header   magic, format version, corpus fingerprint, crc32 of the section table and checked sections
+#   sections offset/length table, then the sections in this order:
+#     META          JSON {"documents": per-document metadata with text id,
+#                         "text_lengths": token count of every distinct text}
+#     TEXT_OFFSETS  uint64 start of every distinct text in TEXT, then the end of the last one
+#     TEXT          distinct UTF-8 CV texts back to back
+#     HASHES        SHA-256 content hash of every distinct text
+#     SIGNATURES    fixed-width q-gram signatures, one per distinct text
+#     VOCAB         indexed tokens in UTF-8, separated by newlines
+#     TERMS         uint32 start of every token's run in POSTINGS, then the end of the last run
+#     POSTINGS      uint32 run per token: its text ids, then the start of each text's positions
+#                   in POSITIONS and the end of the last text's positions
+#     POSITIONS     uint32 token positions
+#     CHUNK_CRCS    uint32 crc32 of every CHECK_CHUNK bytes of TEXT, then POSTINGS, then POSITIONS
+# TEXT, POSTINGS and POSITIONS are left out of the header checksum: they are read
+# through the mapping only when a text or token is looked up, so loading never
+# pages them in. Each chunk of them is checked the first time a lookup reads it.
+INDEX_MAGIC = b"ATSINDEX"
+INDEX_FORMAT_VERSION = 6
+SECTIONS = ("META", "TEXT_OFFSETS", "TEXT", "HASHES", "SIGNATURES", "VOCAB", "TERMS", "POSTINGS", "POSITIONS",
+            "CHUNK_CRCS")
+LAZY_SECTIONS = ("TEXT", "POSTINGS", "POSITIONS")
+CHECK_CHUNK = 1 << 16
+
+HEADER = struct.Struct("<8sI32sI")
+SECTION_ENTRY = struct.Struct("<QQ")
+SECTION_ALIGNMENT = 8
+SIGNATURE_BYTES = SIGNATURE_BITS // 8
+HASH_BYTES = hashlib.sha256().digest_size
+
+# Entry fields served by the text store rather than stored in META
+_DERIVED_FIELDS = ("cv_text", "signature")
+
+
+class IndexFormatError(Exception):
+    """Raised when an index file is missing, corrupt, stale or of another format version."""
+
+
+@dataclass
+class LoadedIndex:
+    cv_database: List[Dict[str, Any]]
+    text_store: TextStore
+    inverted_index: InvertedIndex
+    corpus_stats: CorpusStatistics
+
+
+def corpus_fingerprint(cv_files: Iterable[Tuple[Dict[str, Any], str]]) -> bytes:
+    """
+    Identifies a corpus version without reading any CV.
+
+    Args:
+        cv_files: (database record, cv_path) for every CV, in corpus order.
+
+    Returns:
+        bytes: SHA-256 over the records, paths, file sizes and modification times
+    """
+    digest = hashlib.sha256()
+    for record, cv_path in cv_files:
+        try:
+            stat = os.stat(cv_path)
+            file_state = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            file_state = "missing"
+        record_key = json.dumps(record, sort_keys=True, default=str)
+        digest.update(f"{record_key}\0{cv_path}\0{file_state}\n".encode("utf-8"))
+    return digest.digest()
+
+
+def _little_endian_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _section_array(view: mmap.mmap, offset: int, length: int, typecode: str):
+    """
+    Typed view of a section: zero-copy over the mapping on little-endian
+    hosts, a byte-swapped copy elsewhere.
+    """
+    itemsize = array(typecode).itemsize
+    if length % itemsize:
+        raise IndexFormatError("section length is not a whole number of items")
+    data = memoryview(view)[offset:offset + length]
+    if sys.byteorder == "little":
+        return data.cast(typecode)
+    values = array(typecode)
+    values.frombytes(data)
+    data.release()
+    values.byteswap()
+    return values
+
+
+def _align(offset: int) -> int:
+    return -(-offset // SECTION_ALIGNMENT) * SECTION_ALIGNMENT
+
+
+def _chunk_count(length: int) -> int:
+    return -(-length // CHECK_CHUNK)
+
+
+def _chunk_crcs(section: bytes) -> array:
+    data = memoryview(section)
+    return array("I", (zlib.crc32(data[start:start + CHECK_CHUNK]) for start in range(0, len(section), CHECK_CHUNK)))
+
+
+def save_index(path: str, cv_database: List[Dict[str, Any]], text_store: TextStore,
+               inverted_index: InvertedIndex, corpus_stats: CorpusStatistics, fingerprint: bytes):
+    """
+    Writes the search corpus to an index file. The file is written next to
+    its final path and renamed into place, so a crash never leaves a
+    half-written index behind.
+
+    Args:
+        path: Destination of the index file.
+        cv_database: The in-memory CV corpus (entries with "text_id").
+        text_store: Distinct texts the entries point at.
+        inverted_index: Positional index over the distinct texts, keyed by text id.
+        corpus_stats: Statistics holding the token count of every distinct text.
+        fingerprint: corpus_fingerprint of the corpus being saved.
+    """
+    documents = [{key: value for key, value in entry.items() if key not in _DERIVED_FIELDS}
+                 for entry in cv_database]
+    text_lengths = [corpus_stats.doc_lengths.get(text_id, 0) for text_id in range(len(text_store))]
+
+    text_offsets = array("Q", [0])
+    text_parts: List[bytes] = []
+    signatures: List[bytes] = []
+    for text_id in range(len(text_store)):
+        encoded = text_store.texts[text_id].encode("utf-8", "surrogatepass")
+        text_parts.append(encoded)
+        text_offsets.append(text_offsets[-1] + len(encoded))
+        signature = text_store.signatures[text_id]
+        if len(signature.bits) != SIGNATURE_BYTES:
+            signature = NGramSignature.from_text(text_store.lowered[text_id])
+        signatures.append(signature.bits)
+
+    tokens = inverted_index.vocabulary()
+    terms = array("I", [0])
+    postings = array("I")
+    positions = array("I")
+    for token in tokens:
+        doc_ids = inverted_index.get_postings(token)
+        postings.extend(doc_ids)
+        for doc_id in doc_ids:
+            postings.append(len(positions))
+            positions.extend(inverted_index.get_positions(token, doc_id))
+        postings.append(len(positions))
+        terms.append(len(postings))
+
+    sections = [
+        json.dumps({"documents": documents, "text_lengths": text_lengths},
+                   separators=(",", ":"), default=str).encode("utf-8"),
+        _little_endian_bytes(text_offsets),
+        b"".join(text_parts),
+        b"".join(text_store.hashes[text_id] for text_id in range(len(text_store))),
+        b"".join(signatures),
+        "\n".join(tokens).encode("utf-8"),
+        _little_endian_bytes(terms),
+        _little_endian_bytes(postings),
+        _little_endian_bytes(positions),
+    ]
+    chunk_crcs = array("I")
+    for name, section in zip(SECTIONS, sections):
+        if name in LAZY_SECTIONS:
+            chunk_crcs.extend(_chunk_crcs(section))
+    sections.append(_little_endian_bytes(chunk_crcs))
+
+    table_size = SECTION_ENTRY.size * len(sections)
+    offsets: List[int] = []
+    offset = _align(HEADER.size + table_size)
+    table = bytearray()
+    for section in sections:
+        offsets.append(offset)
+        table += SECTION_ENTRY.pack(offset, len(section))
+        offset = _align(offset + len(section))
+
+    checksum = zlib.crc32(table)
+    for name, section in zip(SECTIONS, sections):
+        if name not in LAZY_SECTIONS:
+            checksum = zlib.crc32(section, checksum)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as index_file:
+        index_file.write(HEADER.pack(INDEX_MAGIC, INDEX_FORMAT_VERSION, fingerprint, checksum))
+        index_file.write(table)
+        for section_offset, section in zip(offsets, sections):
+            index_file.write(b"\0" * (section_offset - index_file.tell()))
+            index_file.write(section)
+    os.replace(temp_path, path)
+
+
+def load_index(path: str, fingerprint: bytes) -> LoadedIndex:
+    """
+    Maps an index file and wraps it in search structures that read from the
+    mapping, without touching any PDF. Only the document metadata, the
+    vocabulary and the offset tables are read here; a text is decoded when
+    it is first used and a token's postings when it is first looked up.
+    The mapping stays open for as long as the returned structures are in use.
+
+    Args:
+        path: Location of the index file.
+        fingerprint: corpus_fingerprint of the corpus the caller expects.
+
+    Returns:
+        LoadedIndex: The CV corpus, inverted index and corpus statistics
+
+    Raises:
+        IndexFormatError: If the file is missing, corrupt, of another format
+            version or built from a different corpus version
+    """
+    try:
+        index_file = open(path, "rb")
+    except OSError as e:
+        raise IndexFormatError(f"cannot open index: {e}")
+
+    with index_file:
+        if os.fstat(index_file.fileno()).st_size < HEADER.size:
+            raise IndexFormatError("index file is truncated")
+        view = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        return _open_sections(view, fingerprint)
+    except BaseException:
+        try:
+            view.close()
+        except BufferError:
+            # A section view of the failed load is still referenced; the mapping goes with it
+            pass
+        raise
+
+
+def _open_sections(view: mmap.mmap, fingerprint: bytes) -> LoadedIndex:
+    magic, version, stored_fingerprint, checksum = HEADER.unpack_from(view, 0)
+    if magic != INDEX_MAGIC:
+        raise IndexFormatError("not an index file")
+    if version != INDEX_FORMAT_VERSION:
+        raise IndexFormatError(f"format version {version}, expected {INDEX_FORMAT_VERSION}")
+    if stored_fingerprint != fingerprint:
+        raise IndexFormatError("corpus changed since the index was built")
+    if len(view) < HEADER.size + SECTION_ENTRY.size * len(SECTIONS):
+        raise IndexFormatError("index file is truncated")
+
+    sections: Dict[str, Tuple[int, int]] = {}
+    for i, name in enumerate(SECTIONS):
+        offset, length = SECTION_ENTRY.unpack_from(view, HEADER.size + i * SECTION_ENTRY.size)
+        if offset + length > len(view):
+            raise IndexFormatError(f"section {name} out of bounds")
+        sections[name] = (offset, length)
+
+    actual = zlib.crc32(view[HEADER.size:HEADER.size + SECTION_ENTRY.size * len(SECTIONS)])
+    for name in SECTIONS:
+        if name not in LAZY_SECTIONS:
+            offset, length = sections[name]
+            with memoryview(view)[offset:offset + length] as data:
+                actual = zlib.crc32(data, actual)
+    if actual != checksum:
+        raise IndexFormatError("checksum mismatch")
+
+    chunk_crcs = _section_array(view, *sections["CHUNK_CRCS"], "I")
+    if len(chunk_crcs) != sum(_chunk_count(sections[name][1]) for name in LAZY_SECTIONS):
+        raise IndexFormatError("chunk checksums do not match the lazily read sections")
+    checks: Dict[str, _ChunkCheck] = {}
+    first_chunk = 0
+    for name in LAZY_SECTIONS:
+        offset, length = sections[name]
+        chunks = _chunk_count(length)
+        checks[name] = _ChunkCheck(name, view, offset, length, chunk_crcs[first_chunk:first_chunk + chunks])
+        first_chunk += chunks
+
+    text_offsets = _section_array(view, *sections["TEXT_OFFSETS"], "Q")
+    text_count = len(text_offsets) - 1
+    if text_count < 0 or text_offsets[-1] != sections["TEXT"][1]:
+        raise IndexFormatError("text offsets do not match the text section")
+    if sections["HASHES"][1] != text_count * HASH_BYTES or sections["SIGNATURES"][1] != text_count * SIGNATURE_BYTES:
+        raise IndexFormatError("hash or signature section does not match the text count")
+
+    vocab_offset, vocab_length = sections["VOCAB"]
+    tokens = view[vocab_offset:vocab_offset + vocab_length].decode("utf-8").split("\n") if vocab_length else []
+    terms = _section_array(view, *sections["TERMS"], "I")
+    postings = _section_array(view, *sections["POSTINGS"], "I")
+    if len(terms) != len(tokens) + 1 or terms[-1] != len(postings):
+        raise IndexFormatError("term table does not match the postings section")
+
+    meta_offset, meta_length = sections["META"]
+    meta = json.loads(view[meta_offset:meta_offset + meta_length])
+    documents = meta["documents"]
+    if len(meta["text_lengths"]) != text_count:
+        raise IndexFormatError("text lengths do not match the text count")
+    text_lengths = dict(enumerate(meta["text_lengths"]))
+    text_store = MappedTextStore(view, text_offsets, sections["TEXT"][0], sections["HASHES"][0],
+                                 sections["SIGNATURES"][0], checks["TEXT"])
+    for doc_index, record in enumerate(documents):
+        text_id = record["text_id"]
+        if not 0 <= text_id < text_count:
+            raise IndexFormatError(f"document {doc_index} points at unknown text {text_id}")
+        text_store.link(text_id, doc_index)
+
+    mapped = MappedPostings(tokens, terms, postings, _section_array(view, *sections["POSITIONS"], "I"),
+                            checks["POSTINGS"], checks["POSITIONS"])
+    inverted_index = MappedInvertedIndex(mapped, text_count)
+    corpus_stats = MappedCorpusStatistics(mapped, text_lengths)
+    return LoadedIndex(documents, text_store, inverted_index, corpus_stats)
+
+
+class _ChunkCheck:
+    """
+    Chunk checksums of a section read through the mapping on demand. A chunk
+    is verified the first time a read touches it and trusted from then on.
+    """
+    def __init__(self, name: str, view: mmap.mmap, offset: int, length: int, crcs):
+        self._name = name
+        self._view = view
+        self._offset = offset
+        self._length = length
+        self._crcs = crcs
+        self._checked = bytearray(len(crcs))
+
+    def verify(self, start: int, end: int):
+        """
+        Checks the chunks holding bytes [start, end) of the section.
+
+        Raises:
+            IndexFormatError: If one of them does not match its checksum
+        """
+        for chunk in range(start // CHECK_CHUNK, _chunk_count(end) if start < end else 0):
+            if self._checked[chunk]:
+                continue
+            chunk_start = self._offset + chunk * CHECK_CHUNK
+            chunk_end = min(chunk_start + CHECK_CHUNK, self._offset + self._length)
+            with memoryview(self._view)[chunk_start:chunk_end] as data:
+                if zlib.crc32(data) != self._crcs[chunk]:
+                    raise IndexFormatError(f"checksum mismatch in section {self._name}")
+            self._checked[chunk] = 1
+
+
+class _MappedColumn:
+    """
+    List-like column of a MappedTextStore. Stored items are decoded from the
+    mapping on access (and kept when cache is set); items added after the
+    load are held in a list behind them.
+    """
+    def __init__(self, count: int, decode: Callable[[int], Any], cache: bool = True):
+        self._count = count
+        self._decode = decode
+        self._decoded: Optional[Dict[int, Any]] = {} if cache else None
+        self._added: List[Any] = []
+
+    def __len__(self) -> int:
+        return self._count + len(self._added)
+
+    def __getitem__(self, item: int) -> Any:
+        if item < 0:
+            item += len(self)
+        if item >= self._count:
+            return self._added[item - self._count]
+        if item < 0:
+            raise IndexError("column index out of range")
+        if self._decoded is None:
+            return self._decode(item)
+        value = self._decoded.get(item)
+        if value is None:
+            value = self._decoded[item] = self._decode(item)
+        return value
+
+    def __iter__(self):
+        for item in range(len(self)):
+            yield self[item]
+
+    def append(self, value: Any):
+        self._added.append(value)
+
+
+class MappedTextStore(TextStore):
+    """
+    TextStore over the text sections of an index file. Texts and hashes are
+    read from the mapping on every access; the lower-cased texts and the
+    signatures searches scan are kept once decoded. Texts added after the
+    load are stored in memory as usual.
+    """
+    def __init__(self, view: mmap.mmap, text_offsets, text_at: int, hashes_at: int, signatures_at: int,
+                 text_check: _ChunkCheck):
+        super().__init__()
+        count = len(text_offsets) - 1
+
+        def text(text_id: int) -> str:
+            start, end = text_offsets[text_id], text_offsets[text_id + 1]
+            text_check.verify(start, end)
+            return view[text_at + start:text_at + end].decode("utf-8", "surrogatepass")
+
+        def digest(text_id: int) -> bytes:
+            start = hashes_at + text_id * HASH_BYTES
+            return view[start:start + HASH_BYTES]
+
+        def signature(text_id: int) -> NGramSignature:
+            start = signatures_at + text_id * SIGNATURE_BYTES
+            return NGramSignature(view[start:start + SIGNATURE_BYTES])
+
+        self.texts = _MappedColumn(count, text, cache=False)
+        self.lowered = _MappedColumn(count, lambda text_id: self.texts[text_id].lower())
+        self.signatures = _MappedColumn(count, signature)
+        self.hashes = _MappedColumn(count, digest, cache=False)
+        self.linked_docs = {text_id: [] for text_id in range(count)}
+        self._ids_by_hash = None
+
+    def add(self, text: str, signature: Optional[NGramSignature] = None) -> int:
+        if self._ids_by_hash is None:
+            self._ids_by_hash = {self.hashes[text_id]: text_id for text_id in range(len(self.hashes))}
+        return super().add(text, signature)
+
+
+class MappedPostings:
+    """
+    Term table of an index file. Decodes the doc ids or positions of one
+    token at a time, straight from the mapped sections, checking the chunks
+    it reads on the way.
+
+    Attributes:
+        term_ids (Dict[str, int]): Position of every stored token in the term table.
+    """
+    def __init__(self, tokens: List[str], terms, postings, positions,
+                 postings_check: _ChunkCheck, positions_check: _ChunkCheck):
+        self.term_ids: Dict[str, int] = dict(zip(tokens, range(len(tokens))))
+        self._terms = terms
+        self._postings = postings
+        self._positions = positions
+        self._postings_check = postings_check
+        self._positions_check = positions_check
+
+    def _check_run(self, term_id: int) -> int:
+        start = self._terms[term_id]
+        itemsize = self._postings.itemsize
+        self._postings_check.verify(start * itemsize, self._terms[term_id + 1] * itemsize)
+        return start
+
+    def _check_positions(self, start: int, end: int):
+        itemsize = self._positions.itemsize
+        self._positions_check.verify(start * itemsize, end * itemsize)
+
+    def doc_freq(self, term_id: int) -> int:
+        return (self._terms[term_id + 1] - self._terms[term_id] - 1) // 2
+
+    def doc_ids(self, term_id: int) -> List[int]:
+        start = self._check_run(term_id)
+        return self._postings[start:start + self.doc_freq(term_id)].tolist()
+
+    def positions(self, term_id: int, doc_id: int) -> List[int]:
+        start = self._check_run(term_id)
+        doc_freq = self.doc_freq(term_id)
+        i = bisect_left(self._postings, doc_id, start, start + doc_freq)
+        if i == start + doc_freq or self._postings[i] != doc_id:
+            return []
+        bound = i + doc_freq
+        self._check_positions(self._postings[bound], self._postings[bound + 1])
+        return self._positions[self._postings[bound]:self._postings[bound + 1]].tolist()
+
+    def token_positions(self, term_id: int) -> Dict[int, List[int]]:
+        """Every document of a token with its positions, as InvertedIndex.positions holds them."""
+        start = self._check_run(term_id)
+        doc_freq = self.doc_freq(term_id)
+        bounds = self._postings[start + doc_freq:start + 2 * doc_freq + 1]
+        self._check_positions(bounds[0], bounds[-1])
+        return {
+            self._postings[start + i]: self._positions[bounds[i]:bounds[i + 1]].tolist()
+            for i in range(doc_freq)
+        }
+
+    def terms_of(self, doc_id: int) -> List[str]:
+        """Stored tokens of a document. Scans the whole term table."""
+        return [token for token, term_id in self.term_ids.items() if self.positions(term_id, doc_id)]
+
+
+class MappedInvertedIndex(InvertedIndex):
+    """
+    InvertedIndex over the postings of an index file. Lookups decode the
+    token they need from the mapping; a token is moved into the in-memory
+    dicts once a document containing it is added or removed, and from then
+    on behaves as in a plain InvertedIndex.
+    """
+    def __init__(self, mapped: MappedPostings, doc_count: int):
+        super().__init__()
+        self.doc_ids = list(range(doc_count))
+        self._mapped = mapped
+        self._mapped_docs = doc_count
+        self._loaded_tokens: Set[str] = set()
+        self._adopted_docs: Set[int] = set()
+        self._doc_id_cache: Dict[str, List[int]] = {}
+
+    def _load_token(self, token: str):
+        if token in self._loaded_tokens:
+            return
+        self._loaded_tokens.add(token)
+        term_id = self._mapped.term_ids.get(token)
+        if term_id is not None:
+            token_positions = self._mapped.token_positions(term_id)
+            self.positions[token] = token_positions
+            self.postings[token] = list(token_positions)
+
+    def _adopt_document(self, doc_id: int):
+        # Stored documents do not list their tokens, so replacing or removing one scans the term table
+        if doc_id >= self._mapped_docs or doc_id in self._adopted_docs:
+            return
+        self._adopted_docs.add(doc_id)
+        doc_terms = self._mapped.terms_of(doc_id)
+        for token in doc_terms:
+            self._load_token(token)
+        self._doc_terms[doc_id] = doc_terms
+
+    def add_document(self, doc_id: int, text: str, tokens: Optional[List[str]] = None):
+        if tokens is None:
+            tokens = tokenize(text)
+        self._adopt_document(doc_id)
+        for token in set(tokens):
+            self._load_token(token)
+        super().add_document(doc_id, text, tokens)
+
+    def remove_document(self, doc_id: int):
+        self._adopt_document(doc_id)
+        super().remove_document(doc_id)
+
+    def get_postings(self, token: str) -> List[int]:
+        if token in self._loaded_tokens:
+            return super().get_postings(token)
+        doc_ids = self._doc_id_cache.get(token)
+        if doc_ids is None:
+            term_id = self._mapped.term_ids.get(token)
+            doc_ids = self._doc_id_cache[token] = [] if term_id is None else self._mapped.doc_ids(term_id)
+        return doc_ids
+
+    def get_positions(self, token: str, doc_id: int) -> List[int]:
+        if token in self._loaded_tokens:
+            return super().get_positions(token, doc_id)
+        term_id = self._mapped.term_ids.get(token)
+        return [] if term_id is None else self._mapped.positions(term_id, doc_id)
+
+    def vocabulary(self) -> List[str]:
+        stored = [token for token in self._mapped.term_ids if token not in self._loaded_tokens]
+        return stored + list(self.postings)
+
+
+class _MappedDocFreq:
+    """
+    doc_freq of a MappedCorpusStatistics: stored frequencies come from the
+    term table, changed ones from a dict (0 marks a removed token).
+    """
+    def __init__(self, mapped: MappedPostings):
+        self._mapped = mapped
+        self._changed: Dict[str, int] = {}
+
+    def get(self, token: str, default: Optional[int] = None) -> Optional[int]:
+        if token in self._changed:
+            return self._changed[token] or default
+        term_id = self._mapped.term_ids.get(token)
+        return default if term_id is None else self._mapped.doc_freq(term_id)
+
+    def __getitem__(self, token: str) -> int:
+        count = self.get(token)
+        if count is None:
+            raise KeyError(token)
+        return count
+
+    def __setitem__(self, token: str, count: int):
+        self._changed[token] = count
+
+    def __delitem__(self, token: str):
+        if token not in self:
+            raise KeyError(token)
+        self._changed[token] = 0
+
+    def __contains__(self, token: str) -> bool:
+        return self.get(token) is not None
+
+
+class MappedCorpusStatistics(CorpusStatistics):
+    """
+    CorpusStatistics whose document frequencies are read from the term
+    table of an index file instead of being counted at load.
+    """
+    def __init__(self, mapped: MappedPostings, doc_lengths: Dict[int, int]):
+        super().__init__()
+        self.doc_lengths = doc_lengths
+        self.total_length = sum(doc_lengths.values())
+        self.doc_freq = _MappedDocFreq(mapped)
+        self._mapped = mapped
+        self._mapped_docs = len(doc_lengths)
+
+    def remove_document(self, doc_id: int):
+        if doc_id < self._mapped_docs and doc_id in self.doc_lengths and doc_id not in self._doc_terms:
+            self._doc_terms[doc_id] = self._mapped.terms_of(doc_id)
+        super().remove_document(doc_id)
+
+
+# For inspection: python index_store.py [index_path]
+if __name__ == '__main__':
+    index_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("archive", "ats_index.bin")
+    with open(index_path, "rb") as f:
+        magic, version, stored_fingerprint, checksum = HEADER.unpack(f.read(HEADER.size))
+        print(f"{index_path}: magic={magic!r} version={version} fingerprint={stored_fingerprint.hex()[:16]}...")
+        for name in SECTIONS:
+            offset, length = SECTION_ENTRY.unpack(f.read(SECTION_ENTRY.size))
+            print(f"{name:>12} offset={offset:>12} bytes={length:>12}")
+    start = time.perf_counter()
+    loaded = load_index(index_path, stored_fingerprint)
+    print(f"Cold start: {len(loaded.cv_database)} CVs, {len(loaded.text_store)} distinct texts "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
@@ -0,0 +1,154 @@
+# src/inverted_index.py
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional
+
+from scoring import tokenize
+
+
+class InvertedIndex:
+    """
+    Positional inverted index over the CV corpus.
+
+    Attributes:
+        postings (Dict[str, List[int]]): Sorted document ids containing each token.
+        positions (Dict[str, Dict[int, List[int]]]): Token positions per document.
+        doc_ids (List[int]): Sorted ids of all indexed documents.
+    """
+    def __init__(self):
+        self.postings: Dict[str, List[int]] = {}
+        self.positions: Dict[str, Dict[int, List[int]]] = {}
+        self.doc_ids: List[int] = []
+        self._doc_terms: Dict[int, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def add_document(self, doc_id: int, text: str, tokens: Optional[List[str]] = None):
+        """
+        Indexes a document. Documents are normally added with increasing ids,
+        which keeps every postings list append-only.
+
+        Args:
+            doc_id: Key of the document in the search corpus.
+            text: Full text of the document.
+            tokens: Already tokenized text, to avoid tokenizing twice.
+        """
+        if tokens is None:
+            tokens = tokenize(text)
+        if doc_id in self._doc_terms:
+            self.remove_document(doc_id)
+
+        _insert_sorted(self.doc_ids, doc_id)
+        doc_terms: List[str] = []
+        for position, token in enumerate(tokens):
+            doc_positions = self.positions.setdefault(token, {})
+            if doc_id not in doc_positions:
+                doc_positions[doc_id] = []
+                doc_terms.append(token)
+                _insert_sorted(self.postings.setdefault(token, []), doc_id)
+            doc_positions[doc_id].append(position)
+        self._doc_terms[doc_id] = doc_terms
+
+    def remove_document(self, doc_id: int):
+        """
+        Removes a document from the index. Unknown ids are ignored.
+
+        Args:
+            doc_id: Key of the document in the search corpus.
+        """
+        if doc_id not in self._doc_terms:
+            return
+        self.doc_ids.pop(bisect_left(self.doc_ids, doc_id))
+        for token in self._doc_terms.pop(doc_id):
+            del self.positions[token][doc_id]
+            postings = self.postings[token]
+            postings.pop(bisect_left(postings, doc_id))
+            if not postings:
+                del self.postings[token]
+                del self.positions[token]
+
+    def get_postings(self, token: str) -> List[int]:
+        """Returns the sorted document ids containing a token (do not mutate)."""
+        return self.postings.get(token, [])
+
+    def get_positions(self, token: str, doc_id: int) -> List[int]:
+        """Returns the sorted positions of a token inside a document."""
+        return self.positions.get(token, {}).get(doc_id, [])
+
+    def vocabulary(self) -> List[str]:
+        """Returns every indexed token."""
+        return list(self.postings)
+
+
+def _insert_sorted(values: List[int], value: int):
+    if not values or values[-1] < value:
+        values.append(value)
+    else:
+        insort(values, value)
+
+
+def intersect_postings(a: List[int], b: List[int]) -> List[int]:
+    """
+    Intersects two sorted postings lists. When one list is much shorter its
+    ids are located in the other by binary search instead of a full merge.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    result: List[int] = []
+    if not a:
+        return result
+
+    if len(a) * 8 < len(b):
+        lo = 0
+        for doc_id in a:
+            lo = bisect_left(b, doc_id, lo)
+            if lo == len(b):
+                break
+            if b[lo] == doc_id:
+                result.append(doc_id)
+        return result
+
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def union_postings(a: List[int], b: List[int]) -> List[int]:
+    """Merges two sorted postings lists without duplicates."""
+    result: List[int] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            result.append(a[i])
+            i += 1
+        else:
+            result.append(b[j])
+            j += 1
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
+def difference_postings(a: List[int], b: List[int]) -> List[int]:
+    """Returns the ids of sorted list a that are not in sorted list b."""
+    result: List[int] = []
+    j = 0
+    for doc_id in a:
+        while j < len(b) and b[j] < doc_id:
+            j += 1
+        if j == len(b) or b[j] != doc_id:
+            result.append(doc_id)
+    return result
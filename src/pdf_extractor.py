@@ -1,29 +1,39 @@
+import io
+
 import PyPDF2
 
+def _read_pages(pdf_reader) -> str:
+    # Extract text from all pages
+    return "".join(page.extract_text() + "\n" for page in pdf_reader.pages).strip()
+
 def extract_text_pypdf2(pdf_path: str) -> str:
     """
     Extract text from PDF using PyPDF2
     args:
         pdf_path (str): Path to the PDF file
     returns:
-        str: Extracted text from the PDF file, or None if an error occurs
+        str: Extracted text from the PDF file, or an empty string if an error occurs
     """
-    text = ""
-    
     try:
         with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            # Extract text from all pages
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-                
+            return _read_pages(PyPDF2.PdfReader(file))
+    except Exception as e:
+        print(f"Error reading PDF: {e}")
+        return ""
+
+def extract_text_pypdf2_bytes(pdf_bytes: bytes) -> str:
+    """
+    Extract text from a PDF already read into memory, see extract_text_pypdf2
+    args:
+        pdf_bytes (bytes): Content of the PDF file
+    returns:
+        str: Extracted text from the PDF, or an empty string if an error occurs
+    """
+    try:
+        return _read_pages(PyPDF2.PdfReader(io.BytesIO(pdf_bytes)))
     except Exception as e:
         print(f"Error reading PDF: {e}")
         return ""
-    
-    return text.strip()
 
 if __name__ == '__main__':
     pdf_text = extract_text_pypdf2("test/ACCOUNTANT/10554236.pdf")
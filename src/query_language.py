@@ -0,0 +1,282 @@
+# src/query_language.py
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from inverted_index import InvertedIndex, intersect_postings, union_postings, difference_postings
+from scoring import tokenize
+
+# Query syntax:
+#   python AND "machine learning"     both must occur, the phrase as adjacent words
+#   java OR kotlin, scala             "," is an alias of OR
+#   sql NOT (oracle OR db2)           NOT binds tighter than AND, AND tighter than OR
+#   python django                     adjacent terms are AND-ed
+# Operators must be written in upper case; lower case "and"/"or"/"not" are words.
+
+TOKEN_REGEX = re.compile(r'\s*(?:(?P<lparen>\()|(?P<rparen>\))|(?P<comma>,)|"(?P<phrase>[^"]*)"|(?P<word>[^\s(),"]+))')
+OPERATORS = {"AND", "OR", "NOT"}
+OPERATOR_REGEX = re.compile(r'\b(?:AND|OR|NOT)\b|["()]')
+
+
+class QuerySyntaxError(ValueError):
+    """Raised when a query string cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class Term:
+    token: str
+
+    def __str__(self) -> str:
+        return self.token
+
+
+@dataclass(frozen=True)
+class Phrase:
+    tokens: Tuple[str, ...]
+
+    def __str__(self) -> str:
+        return '"' + " ".join(self.tokens) + '"'
+
+
+@dataclass(frozen=True)
+class And:
+    children: Tuple["QueryNode", ...]
+
+    def __str__(self) -> str:
+        return "(" + " AND ".join(str(c) for c in self.children) + ")"
+
+
+@dataclass(frozen=True)
+class Or:
+    children: Tuple["QueryNode", ...]
+
+    def __str__(self) -> str:
+        return "(" + " OR ".join(str(c) for c in self.children) + ")"
+
+
+@dataclass(frozen=True)
+class Not:
+    child: "QueryNode"
+
+    def __str__(self) -> str:
+        return f"NOT {self.child}"
+
+
+QueryNode = Union[Term, Phrase, And, Or, Not]
+
+
+def is_boolean_query(query: str) -> bool:
+    """
+    Tells whether a search box string uses the query language, as opposed to
+    the plain comma separated keyword list.
+    """
+    return bool(OPERATOR_REGEX.search(query))
+
+
+def _lex(query: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    query = query.rstrip()
+    while pos < len(query):
+        match = TOKEN_REGEX.match(query, pos)
+        if not match or match.end() == pos:
+            raise QuerySyntaxError(f"Unexpected character at position {pos}: {query[pos:pos + 10]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "word" and value in OPERATORS:
+            kind = value
+        elif kind == "comma":
+            kind = "OR"
+        tokens.append((kind, value))
+    return tokens
+
+
+def _make_leaf(text: str) -> Optional[QueryNode]:
+    words = tokenize(text)
+    if not words:
+        return None
+    if len(words) == 1:
+        return Term(words[0])
+    return Phrase(tuple(words))
+
+
+class _Parser:
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self) -> Tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> QueryNode:
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Unexpected {self.tokens[self.pos][1]!r}")
+        return node
+
+    def parse_or(self) -> QueryNode:
+        children = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(tuple(children))
+
+    def parse_and(self) -> QueryNode:
+        children = [self.parse_not()]
+        while self.peek() not in (None, "OR", "rparen"):
+            if self.peek() == "AND":
+                self.take()
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else And(tuple(children))
+
+    def parse_not(self) -> QueryNode:
+        if self.peek() == "NOT":
+            self.take()
+            return Not(self.parse_not())
+        return self.parse_primary()
+
+    def parse_primary(self) -> QueryNode:
+        kind = self.peek()
+        if kind is None:
+            raise QuerySyntaxError("Query ends unexpectedly")
+        _, value = self.take()
+        if kind == "lparen":
+            node = self.parse_or()
+            if self.peek() != "rparen":
+                raise QuerySyntaxError("Missing closing parenthesis")
+            self.take()
+            return node
+        if kind in ("word", "phrase"):
+            leaf = _make_leaf(value)
+            if leaf is None:
+                raise QuerySyntaxError(f"{value!r} contains no searchable word")
+            return leaf
+        raise QuerySyntaxError(f"Unexpected {value!r}")
+
+
+def parse_query(query: str) -> QueryNode:
+    """
+    Parses a query string into a query plan.
+
+    Args:
+        query (str): The query as typed in the search box
+
+    Returns:
+        QueryNode: Root of the parsed plan
+
+    Raises:
+        QuerySyntaxError: If the query is empty or malformed
+    """
+    tokens = _lex(query)
+    if not tokens:
+        raise QuerySyntaxError("Query is empty")
+    return _Parser(tokens).parse()
+
+
+def positive_leaves(node: QueryNode) -> List[Union[Term, Phrase]]:
+    """Returns the terms and phrases of a plan that are not under a NOT."""
+    if isinstance(node, (Term, Phrase)):
+        return [node]
+    if isinstance(node, Not):
+        return []
+    leaves: List[Union[Term, Phrase]] = []
+    for child in node.children:
+        for leaf in positive_leaves(child):
+            if leaf not in leaves:
+                leaves.append(leaf)
+    return leaves
+
+
+def phrase_positions(index: InvertedIndex, tokens: Tuple[str, ...], doc_id: int) -> List[int]:
+    """Returns the start positions of a phrase inside a document."""
+    first_positions = index.get_positions(tokens[0], doc_id)
+    following = [set(index.get_positions(token, doc_id)) for token in tokens[1:]]
+    return [
+        start for start in first_positions
+        if all(start + offset in positions for offset, positions in enumerate(following, 1))
+    ]
+
+
+class QueryEvaluator:
+    """
+    Evaluates query plans against an InvertedIndex using sorted postings.
+
+    AND nodes intersect their operands smallest-first and stop as soon as the
+    running result is empty, so selective queries only touch a few postings.
+    """
+    def __init__(self, index: InvertedIndex):
+        self.index = index
+
+    def evaluate(self, node: QueryNode) -> List[int]:
+        """
+        Args:
+            node: Root of a plan returned by parse_query.
+
+        Returns:
+            List[int]: Sorted ids of the matching documents
+        """
+        if isinstance(node, Term):
+            return self.index.get_postings(node.token)
+        if isinstance(node, Phrase):
+            return self._evaluate_phrase(node)
+        if isinstance(node, Not):
+            return difference_postings(self.index.doc_ids, self.evaluate(node.child))
+        if isinstance(node, Or):
+            result: List[int] = []
+            for child in node.children:
+                result = union_postings(result, self.evaluate(child))
+            return result
+        return self._evaluate_and(node)
+
+    def _evaluate_and(self, node: And) -> List[int]:
+        positives = [c for c in node.children if not isinstance(c, Not)]
+        negatives = [c.child for c in node.children if isinstance(c, Not)]
+
+        if positives:
+            operands = sorted((self.evaluate(c) for c in positives), key=len)
+            result = operands[0]
+            for operand in operands[1:]:
+                if not result:
+                    break
+                result = intersect_postings(result, operand)
+        else:
+            result = self.index.doc_ids
+
+        for negative in negatives:
+            if not result:
+                break
+            result = difference_postings(result, self.evaluate(negative))
+        return result
+
+    def _evaluate_phrase(self, node: Phrase) -> List[int]:
+        operands = sorted((self.index.get_postings(t) for t in set(node.tokens)), key=len)
+        candidates = operands[0]
+        for operand in operands[1:]:
+            if not candidates:
+                break
+            candidates = intersect_postings(candidates, operand)
+        return [doc_id for doc_id in candidates if phrase_positions(self.index, node.tokens, doc_id)]
+
+    def match_counts(self, node: QueryNode, doc_id: int) -> Dict[str, int]:
+        """
+        Counts how often every positive term or phrase of the plan occurs in a
+        matching document, read straight from the stored positions.
+        """
+        counts: Dict[str, int] = {}
+        for leaf in positive_leaves(node):
+            if isinstance(leaf, Term):
+                count = len(self.index.get_positions(leaf.token, doc_id))
+                label = leaf.token
+            else:
+                count = len(phrase_positions(self.index, leaf.tokens, doc_id))
+                label = " ".join(leaf.tokens)
+            if count:
+                counts[label] = count
+        return counts
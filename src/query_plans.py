@@ -0,0 +1,95 @@
+# src/query_plans.py
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Manager calls whose plans must not read a whole table, with sample arguments
+INDEXED_LOOKUPS: Dict[str, Tuple[str, Tuple[Any, ...]]] = {
+    "get_applicant_by_id": ("get_applicant_by_id", (1,)),
+    "search_applicants_by_name": ("search_applicants_by_name", ("Mohammad",)),
+    "get_applications_by_role": ("get_applications_by_role", ("Engineer",)),
+    "get_applicant_applications": ("get_applicant_applications", (1,)),
+    "get_applicants_by_ids": ("get_applicants_by_ids", ([1, 2, 3],)),
+    "get_applications_by_applicant_ids": ("get_applications_by_applicant_ids", ([1, 2, 3],)),
+    "find_applications_by_skill": ("find_applications_by_skill", ("Python",)),
+}
+
+
+@dataclass
+class QueryPlan:
+    """
+    EXPLAIN output of one manager query.
+
+    Attributes:
+        name: Manager method the query came from.
+        steps: Plan lines as (step, is_full_table_scan).
+    """
+    name: str
+    steps: List[Tuple[str, bool]] = field(default_factory=list)
+
+    @property
+    def full_scans(self) -> List[str]:
+        return [step for step, full_scan in self.steps if full_scan]
+
+    def __str__(self) -> str:
+        lines = [f"{'FULL SCAN' if self.full_scans else 'indexed'}  {self.name}"]
+        lines.extend(f"    {'!' if full_scan else ' '} {step}" for step, full_scan in self.steps)
+        return "\n".join(lines)
+
+
+def captured_query(db, method: Callable[..., Any], *args) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+    """The statement a manager method sends to execute_query, captured instead of run."""
+    captured = []
+    db.execute_query = lambda query, params=None, name=None: captured.append((query, tuple(params or ())))
+    try:
+        method(*args)
+    finally:
+        del db.execute_query
+    return captured[0] if captured else None
+
+
+def explain_lookups(db, lookups: Dict[str, Tuple[str, Tuple[Any, ...]]] = INDEXED_LOOKUPS) -> List[QueryPlan]:
+    """
+    Runs EXPLAIN on the exact statements the manager methods build.
+
+    Args:
+        db: A connected ApplicantDatabaseManager.
+        lookups: Plan name -> (manager method name, sample arguments).
+
+    Returns:
+        List[QueryPlan]: One plan per lookup
+    """
+    plans = []
+    with db._connection() as connection:
+        cursor = connection.cursor()
+        for name, (method_name, args) in lookups.items():
+            statement = captured_query(db, getattr(db, method_name), *args)
+            if statement is None:
+                continue
+            query, params = statement
+            plans.append(QueryPlan(name, db.backend.explain(cursor, db.backend.sql(query), params)))
+        cursor.close()
+    return plans
+
+
+# Usage: python query_plans.py
+# Prints the plan of every indexed lookup; exits with status 1 if one reads a whole table.
+if __name__ == '__main__':
+    from database import ApplicantDatabaseManager
+
+    db = ApplicantDatabaseManager()
+    if not db.connect():
+        sys.exit(1)
+    try:
+        db.setup_extraction_tables()
+        db.migrate_schema()
+        plans = explain_lookups(db)
+        for plan in plans:
+            print(plan)
+        offenders = [plan.name for plan in plans if plan.full_scans]
+        print(f"{len(plans) - len(offenders)} of {len(plans)} lookups use indexes"
+              + (f"; full scans in: {', '.join(offenders)}" if offenders else ""))
+        sys.exit(1 if offenders else 0)
+    finally:
+        db.disconnect()
@@ -0,0 +1,218 @@
+# src/query_stats.py
+
+import bisect
+import functools
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+# Upper bounds of the latency histogram buckets in ms; slower statements land in a last, open bucket
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Statements slower than this are logged with their normalized SQL; 0 logs every statement
+DEFAULT_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', '500'))
+# Optional file the slow-query lines are appended to, besides the console
+DEFAULT_SLOW_QUERY_LOG = os.getenv('DB_SLOW_QUERY_LOG') or None
+RECENT_SLOW_QUERIES = 100
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\b\d+(?:\.\d+)?\b|%s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(query: str) -> str:
+    """
+    The shape of a statement: comments dropped, literals and placeholders
+    replaced by ?, IN lists and multi-row VALUES collapsed to (...), and
+    whitespace squeezed, so one slow-log line stands for every call.
+    """
+    text = _LITERAL.sub("?", _COMMENT.sub(" ", query))
+    text = _REPEATED_ROWS.sub("(...)", _PLACEHOLDER_LIST.sub("(...)", text))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass
+class QueryTiming:
+    """
+    Latency and volume of the statements recorded under one name.
+
+    Attributes:
+        calls: Statements executed.
+        errors: Statements that raised.
+        rows: Rows returned (SELECT) or affected (INSERT/UPDATE/DELETE).
+        total_ms: Summed duration.
+        max_ms: Slowest statement.
+        slow: Statements over the slow-query threshold.
+        buckets: Counts per LATENCY_BUCKETS_MS bucket, plus the open last one.
+    """
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    slow: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def percentile_ms(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls (max_ms for the open bucket)."""
+        if not self.calls:
+            return 0.0
+        rank = fraction * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return round(min(float(bound), self.max_ms), 3)
+        return round(self.max_ms, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "slow": self.slow,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile_ms(0.50),
+            "p95_ms": self.percentile_ms(0.95),
+            "p99_ms": self.percentile_ms(0.99),
+            "histogram": {label: count for label, count in zip(labels, self.buckets) if count},
+        }
+
+
+class Measurement:
+    """Handed out by QueryStats.measure; set rows before the block ends."""
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = 0
+
+
+class TimedCursor:
+    """Cursor proxy that records every execute/executemany under one name; everything else passes through."""
+    def __init__(self, cursor, stats: "QueryStats", name: str):
+        self._cursor = cursor
+        self._stats = stats
+        self._name = name
+
+    def execute(self, query, params=()):
+        with self._stats.measure(self._name, query) as measurement:
+            result = self._cursor.execute(query, params)
+            measurement.rows = max(self._cursor.rowcount, 0)
+        return result
+
+    def executemany(self, query, seq_of_params):
+        with self._stats.measure(self._name, query) as measurement:
+            result = self._cursor.executemany(query, seq_of_params)
+            measurement.rows = max(self._cursor.rowcount, 0)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class QueryStats:
+    """
+    Thread-safe latency histograms and row counts per query name, with a
+    slow-query log.
+
+    The manager records every statement it runs under the name of the
+    method that issued it (get_applicant_by_id, save_extracted_details, ...).
+    A statement slower than slow_threshold_ms is printed with its normalized
+    SQL, appended to log_path if set, and kept in recent_slow_queries.
+    """
+    def __init__(self, slow_threshold_ms: Optional[float] = DEFAULT_SLOW_QUERY_MS,
+                 log_path: Optional[str] = DEFAULT_SLOW_QUERY_LOG):
+        """
+        Args:
+            slow_threshold_ms: Slow-query threshold in ms, None to log nothing.
+            log_path: File the slow-query lines are appended to, if any.
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.log_path = log_path
+        self._timings: Dict[str, QueryTiming] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=RECENT_SLOW_QUERIES)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, name: str, query: str) -> Iterator[Measurement]:
+        """Times the block as one statement of `name`; an exception counts as an error and propagates."""
+        measurement = Measurement()
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield measurement
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.record(name, query, (time.perf_counter() - start) * 1000, measurement.rows, failed)
+
+    def cursor(self, cursor, name: str) -> TimedCursor:
+        """Wraps a DB-API cursor so each statement it runs is recorded under name."""
+        return TimedCursor(cursor, self, name)
+
+    def record(self, name: str, query: str, elapsed_ms: float, rows: int = 0, failed: bool = False):
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = QueryTiming()
+            timing.calls += 1
+            timing.errors += failed
+            timing.rows += rows
+            timing.total_ms += elapsed_ms
+            timing.max_ms = max(timing.max_ms, elapsed_ms)
+            timing.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+            slow = self.slow_threshold_ms is not None and elapsed_ms >= self.slow_threshold_ms
+            timing.slow += slow
+        if slow:
+            self._log_slow(name, query, elapsed_ms, rows, failed)
+
+    def _log_slow(self, name: str, query: str, elapsed_ms: float, rows: int, failed: bool):
+        entry = {"at": datetime.now().isoformat(timespec="seconds"), "name": name,
+                 "ms": round(elapsed_ms, 3), "rows": rows, "failed": failed, "sql": normalize_sql(query)}
+        with self._lock:
+            self._slow.append(entry)
+        line = (f"Slow query [{name}] {elapsed_ms:.1f} ms, {rows} rows"
+                f"{' (failed)' if failed else ''}: {entry['sql']}")
+        print(line)
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as log:
+                    log.write(f"{entry['at']} {line}\n")
+            except OSError as e:
+                print(f"Slow query log error: {e}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-name counters and latency percentiles, slowest total first, as plain dicts for dashboards."""
+        with self._lock:
+            timings = sorted(self._timings.items(), key=lambda item: item[1].total_ms, reverse=True)
+            return {name: timing.to_dict() for name, timing in timings}
+
+    def recent_slow_queries(self) -> List[Dict[str, Any]]:
+        """The latest slow statements, oldest first."""
+        with self._lock:
+            return list(self._slow)
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+            self._slow.clear()
+
+    def report(self) -> str:
+        lines = [f"{'query':<32} {'calls':>7} {'errors':>6} {'rows':>9} {'mean ms':>9} "
+                 f"{'p95 ms':>8} {'max ms':>9} {'slow':>5}"]
+        for name, stats in self.snapshot().items():
+            lines.append(f"{name:<32} {stats['calls']:>7} {stats['errors']:>6} {stats['rows']:>9} "
+                         f"{stats['mean_ms']:>9.3f} {stats['p95_ms']:>8.1f} {stats['max_ms']:>9.3f} {stats['slow']:>5}")
+        return "\n".join(lines)
@@ -0,0 +1,115 @@
+# src/regex_budget.py
+
+import glob
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from cv_extractor import (extract_education, extract_experience, extract_info_from_text,
+                          extract_skills, extract_summary, extract_text_from_pdf, segment_sections)
+
+DEFAULT_BUDGET_MS = 50.0
+ADVERSARIAL_SIZE = 200_000
+
+EXTRACTORS: Dict[str, Callable[[str], object]] = {
+    "summary": extract_summary,
+    "skills": extract_skills,
+    "experience": extract_experience,
+    "education": extract_education,
+    "segment": segment_sections,
+    "extract_info": extract_info_from_text,
+}
+
+
+@dataclass
+class BudgetResult:
+    """
+    Timings of every extractor on one document.
+
+    Attributes:
+        name: Path or label of the document.
+        chars: Length of the document text.
+        timings: Milliseconds per extractor.
+    """
+    name: str
+    chars: int
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def slowest(self) -> str:
+        return max(self.timings, key=self.timings.get)
+
+    def over_budget(self, budget_ms: float) -> List[str]:
+        return [name for name, ms in self.timings.items() if ms > budget_ms]
+
+
+def adversarial_inputs(size: int = ADVERSARIAL_SIZE) -> Dict[str, str]:
+    """
+    Inputs shaped to make backtracking patterns blow up: long runs of the
+    characters the old position/company/major groups accepted, repeated
+    anchor words that never complete an entry, and unclosed parentheses.
+    """
+    return {
+        "letter run": "a" * size,
+        "one long line": ("Lorem ipsum dolor, sit amet. " * (size // 29)),
+        "role words, no company": "Senior Engineer " * (size // 16),
+        "roles across lines": "Data Analyst at Acme\n" * (size // 21),
+        "company, no period": ("Software Engineer at Google Inc. " * (size // 33)) + "\n",
+        "unclosed period": "Software Engineer at Google Inc. (" + "2019 " * (size // 5),
+        "degree words": "Master of Art " * (size // 28) + "\n" + "Stanford College " * (size // 34),
+        "degree lines, no institution": "Bachelor of Science\n" * (size // 20),
+        "institution, no period": "Master of Art\n" + "Stanford University " * (size // 20),
+        "blank lines": "\n" * size,
+        "bullets": "• " * (size // 2),
+    }
+
+
+def time_document(name: str, text: str, extractors: Dict[str, Callable[[str], object]] = EXTRACTORS) -> BudgetResult:
+    result = BudgetResult(name, len(text))
+    for extractor_name, extractor in extractors.items():
+        start = time.perf_counter()
+        extractor(text)
+        result.timings[extractor_name] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def check_budget(documents: Dict[str, str], budget_ms: float = DEFAULT_BUDGET_MS) -> List[BudgetResult]:
+    """
+    Runs every extractor over every document.
+
+    Args:
+        documents: Document text by name.
+        budget_ms: Time one extractor may spend on one document.
+
+    Returns:
+        List[BudgetResult]: The documents with an extractor over the budget, slowest first
+    """
+    offenders = [result for result in (time_document(name, text) for name, text in documents.items())
+                 if result.over_budget(budget_ms)]
+    offenders.sort(key=lambda result: result.timings[result.slowest], reverse=True)
+    return offenders
+
+
+# Usage: python regex_budget.py [pdf_root] [budget_ms]
+# Exits with status 1 if any document is over the budget.
+if __name__ == '__main__':
+    pdf_root = sys.argv[1] if len(sys.argv) > 1 else "data"
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BUDGET_MS
+
+    documents = {f"adversarial: {name}": text for name, text in adversarial_inputs().items()}
+    pdf_paths = sorted(glob.glob(os.path.join(pdf_root, "**", "*.pdf"), recursive=True))
+    for path in pdf_paths:
+        text = extract_text_from_pdf(path)
+        if text:
+            documents[path] = text
+    print(f"Timing {len(documents)} documents ({len(pdf_paths)} PDFs under {pdf_root}), "
+          f"budget {budget_ms:.0f} ms per extractor")
+
+    offenders = check_budget(documents, budget_ms)
+    for result in offenders:
+        print(f"OVER  {result.name} ({result.chars} chars): "
+              + ", ".join(f"{name} {result.timings[name]:.1f} ms" for name in result.over_budget(budget_ms)))
+    print(f"{len(offenders)} of {len(documents)} documents over budget")
+    sys.exit(1 if offenders else 0)
@@ -0,0 +1,109 @@
+# src/result_cache.py
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 64
+
+CacheKey = Tuple[Tuple[str, ...], str, int, int, str]
+
+
+@dataclass
+class CachedSearch:
+    """
+    A stored search outcome.
+
+    Attributes:
+        results: The ranked results exactly as they were shown.
+        exact_match_time: Exact stage timing label of the original run.
+        fuzzy_match_time: Fuzzy stage timing label of the original run.
+        elapsed_ms: Wall time the original search took, in milliseconds.
+    """
+    results: Any
+    exact_match_time: str
+    fuzzy_match_time: str
+    elapsed_ms: float
+
+
+def make_cache_key(keywords: Iterable[str], algorithm: str, fuzzy_threshold: int, top_n: int,
+                   filters: str = "") -> CacheKey:
+    """
+    Builds a cache key that ignores keyword order, case, surrounding spaces and duplicates.
+
+    Args:
+        keywords: Keywords of the query.
+        algorithm: Exact matching algorithm ("KMP", "BM" or "AC").
+        fuzzy_threshold: Levenshtein threshold used by the fuzzy stage.
+        top_n: Number of results requested.
+        filters: Canonical form of the attribute filters of the search.
+
+    Returns:
+        CacheKey: A hashable key for SearchResultCache
+    """
+    normalized = tuple(sorted({k.strip().lower() for k in keywords if k.strip()}))
+    return (normalized, algorithm, int(fuzzy_threshold), int(top_n), filters)
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of search results tied to a corpus version.
+
+    Any change of the corpus version (i.e. any ingest) drops every entry, so a
+    hit is always consistent with the CVs currently loaded.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.corpus_version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, CachedSearch]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sync_version(self, corpus_version: int):
+        if corpus_version != self.corpus_version:
+            self._entries.clear()
+            self.corpus_version = corpus_version
+
+    def get(self, key: CacheKey, corpus_version: int) -> Optional[CachedSearch]:
+        """
+        Looks up a search and marks it as most recently used.
+
+        Args:
+            key: Key built with make_cache_key.
+            corpus_version: Current version of the search corpus.
+
+        Returns:
+            Optional[CachedSearch]: The cached search, or None on a miss
+        """
+        self._sync_version(corpus_version)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: CacheKey, corpus_version: int, entry: CachedSearch):
+        """
+        Stores a search, evicting the least recently used entry when full.
+
+        Args:
+            key: Key built with make_cache_key.
+            corpus_version: Version of the corpus the search ran against.
+            entry: The search outcome to store.
+        """
+        self._sync_version(corpus_version)
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops every cached search."""
+        self._entries.clear()
@@ -0,0 +1,193 @@
+# src/scoring.py
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a text into lowercase word tokens.
+
+    Args:
+        text (str): The text to tokenize
+
+    Returns:
+        List[str]: List of lowercase tokens in order of appearance
+    """
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def bm25_term_weight(tf: int, idf: float, doc_length: int, average_length: float,
+                     k1: float = DEFAULT_K1, b: float = DEFAULT_B) -> float:
+    """
+    BM25 contribution of a single keyword to a document's score.
+
+    Args:
+        tf: Match count of the keyword in the document.
+        idf: Inverse document frequency of the keyword.
+        doc_length: Token count of the document.
+        average_length: Average token count over the corpus.
+        k1: Term frequency saturation parameter.
+        b: Document length normalization parameter.
+
+    Returns:
+        float: The weighted score of the keyword
+    """
+    if tf <= 0:
+        return 0.0
+    length_norm = k1 * (1 - b + b * doc_length / (average_length or 1.0))
+    return idf * tf * (k1 + 1) / (tf + length_norm)
+
+
+class CorpusStatistics:
+    """
+    Keeps the per-document and per-term statistics BM25 needs.
+
+    The statistics are built once while the corpus loads and then updated
+    incrementally with add_document/remove_document, so ranking a query never
+    has to walk the corpus again.
+
+    Attributes:
+        doc_lengths (Dict[int, int]): Token count of every document.
+        doc_freq (Dict[str, int]): Number of documents containing each token.
+        total_length (int): Sum of all document lengths.
+    """
+    def __init__(self):
+        self.doc_lengths: Dict[int, int] = {}
+        self.doc_freq: Dict[str, int] = {}
+        self.total_length = 0
+        self._doc_terms: Dict[int, List[str]] = {}
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.doc_lengths)
+
+    @property
+    def average_length(self) -> float:
+        if not self.doc_lengths:
+            return 0.0
+        return self.total_length / len(self.doc_lengths)
+
+    def add_document(self, doc_id: int, text: str, tokens: Optional[List[str]] = None):
+        """
+        Adds (or replaces) a document in the statistics.
+
+        Args:
+            doc_id: Key of the document in the search corpus.
+            text: Full text of the document.
+            tokens: Already tokenized text, to avoid tokenizing twice.
+        """
+        if doc_id in self.doc_lengths:
+            self.remove_document(doc_id)
+
+        if tokens is None:
+            tokens = tokenize(text)
+        distinct_terms = list(Counter(tokens).keys())
+
+        self.doc_lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+        self._doc_terms[doc_id] = distinct_terms
+        for term in distinct_terms:
+            self.doc_freq[term] = self.doc_freq.get(term, 0) + 1
+
+    def remove_document(self, doc_id: int):
+        """
+        Removes a document from the statistics. Unknown ids are ignored.
+
+        Args:
+            doc_id: Key of the document in the search corpus.
+        """
+        if doc_id not in self.doc_lengths:
+            return
+
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        for term in self._doc_terms.pop(doc_id):
+            remaining = self.doc_freq[term] - 1
+            if remaining:
+                self.doc_freq[term] = remaining
+            else:
+                del self.doc_freq[term]
+
+    def keyword_doc_freq(self, keyword: str) -> int:
+        """
+        Returns the document frequency of a search keyword in the index.
+
+        Single-word keywords use the exact token frequency. For multi-word
+        keywords the smallest frequency among their words is used, which is
+        an upper bound on the number of documents containing the phrase.
+        This matches how the query language counts terms; keyword searches
+        that match substrings or fuzzily count their matched documents instead.
+
+        Args:
+            keyword: The keyword as typed by the user.
+
+        Returns:
+            int: Number of documents (estimated) containing the keyword
+        """
+        terms = tokenize(keyword)
+        if not terms:
+            return 0
+        return min(self.doc_freq.get(term, 0) for term in terms)
+
+
+class BM25Scorer:
+    """
+    Okapi BM25 ranking over precomputed CorpusStatistics.
+
+    Term frequencies come from the pattern matchers (KMP, BM, Aho-Corasick or
+    Levenshtein), so the scorer itself never reads document text.
+    """
+    def __init__(self, statistics: CorpusStatistics, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        """
+        Args:
+            statistics: Corpus statistics shared with the search corpus.
+            k1: Term frequency saturation parameter.
+            b: Document length normalization parameter (0 disables it).
+        """
+        self.statistics = statistics
+        self.k1 = k1
+        self.b = b
+
+    def idf(self, keyword: str, doc_freq: Optional[int] = None, doc_count: Optional[int] = None) -> float:
+        """
+        Inverse document frequency of a keyword, using the non-negative
+        variant ln(1 + (N - df + 0.5) / (df + 0.5)). df and N default to the
+        keyword's index frequency and the corpus size.
+        """
+        n = self.statistics.doc_count if doc_count is None else doc_count
+        if doc_freq is None:
+            doc_freq = self.statistics.keyword_doc_freq(keyword)
+        doc_freq = min(doc_freq, n)
+        return math.log(1 + (n - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def score(self, doc_id: int, term_frequencies: Dict[str, int],
+              keyword_idf: Optional[Dict[str, float]] = None) -> float:
+        """
+        Scores one document against the matched keywords.
+
+        Args:
+            doc_id: Key of the document in the search corpus.
+            term_frequencies: Mapping of keyword to its match count in the document.
+            keyword_idf: IDF per keyword computed by the caller; keywords missing
+                from it use idf(keyword).
+
+        Returns:
+            float: The BM25 score, 0.0 when nothing matched
+        """
+        doc_length = self.statistics.doc_lengths.get(doc_id, 0)
+        average_length = self.statistics.average_length
+        keyword_idf = keyword_idf or {}
+        return sum(
+            bm25_term_weight(tf, keyword_idf[keyword] if keyword in keyword_idf else self.idf(keyword),
+                             doc_length, average_length, self.k1, self.b)
+            for keyword, tf in term_frequencies.items()
+        )
@@ -0,0 +1,481 @@
+# src/search_executor.py
+
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from algorithm.KMP import kmp_search
+from algorithm.boyer_moore import bm_search
+from algorithm.aho_corasick import AhoCorasick
+from algorithm.levenshtein import levenshtein_search
+from algorithm.ngram_filter import NGramSignature
+from text_store import TextStore
+
+# (lower-cased cv text, q-gram signature), stored once per distinct text
+ShardText = Tuple[str, NGramSignature]
+# Match count per keyword, per text id
+TextMatches = Dict[int, Dict[str, int]]
+
+# How often a waiting search re-checks its cancellation token, in seconds
+POLL_INTERVAL = 0.05
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search when its CancellationToken is cancelled or expired."""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag with an optional deadline, shared between
+    the UI thread and the thread running a search.
+    """
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Seconds from now after which the search is abandoned (None = no deadline).
+        """
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+    def check(self):
+        """
+        Raises:
+            SearchCancelled: If the token was cancelled or its deadline passed
+        """
+        if self._event.is_set():
+            raise SearchCancelled("cancelled")
+        if self.expired:
+            raise SearchCancelled("deadline exceeded")
+
+
+@dataclass
+class ShardedSearchResult:
+    """
+    Matches of a sharded search, by text id.
+
+    Attributes:
+        exact_matches: Exact match counts of every text with a match.
+        fuzzy_matches: Levenshtein match counts of the keywords no text matched exactly.
+        found_keywords: Keywords matched exactly somewhere.
+        unfound_keywords: Keywords that went to the fuzzy stage.
+        exact_ms: Time of the exact stage.
+        fuzzy_ms: Time of the fuzzy stage.
+        exact_skipped: Texts the q-gram signatures ruled out in the exact stage.
+        fuzzy_skipped: Texts the q-gram signatures ruled out in the fuzzy stage.
+    """
+    exact_matches: TextMatches
+    fuzzy_matches: TextMatches
+    found_keywords: Set[str]
+    unfound_keywords: List[str]
+    exact_ms: float
+    fuzzy_ms: float
+    exact_skipped: int = 0
+    fuzzy_skipped: int = 0
+
+
+def exact_match_counts(cv_text_lower: str, keywords: List[str], algorithm: str,
+                       automaton: Optional[AhoCorasick] = None) -> Dict[str, int]:
+    """
+    Counts exact keyword occurrences in one CV with the selected algorithm.
+
+    Args:
+        cv_text_lower: Lower-cased CV text.
+        keywords: Lower-cased keywords.
+        algorithm: "KMP", "BM" or "AC".
+        automaton: Prebuilt Aho-Corasick automaton for the keywords (AC only).
+
+    Returns:
+        Dict[str, int]: Match count per keyword, only for keywords that matched
+    """
+    if algorithm == "AC":
+        if automaton is None:
+            automaton = AhoCorasick(keywords)
+        return {keyword: len(indices) for keyword, indices in automaton.search(cv_text_lower).items()}
+
+    search_function = bm_search if algorithm == "BM" else kmp_search
+    counts: Dict[str, int] = {}
+    for keyword in keywords:
+        matches = search_function(cv_text_lower, keyword)
+        if matches:
+            counts[keyword] = len(matches)
+    return counts
+
+
+def fuzzy_match_counts(cv_text_lower: str, keywords: List[str], threshold: int) -> Dict[str, int]:
+    """
+    Counts Levenshtein matches of the keywords in one CV.
+
+    Returns:
+        Dict[str, int]: Match count per keyword, only for keywords that matched
+    """
+    counts: Dict[str, int] = {}
+    for keyword in keywords:
+        matches = levenshtein_search(cv_text_lower, keyword, threshold)
+        if matches:
+            counts[keyword] = len(matches)
+    return counts
+
+
+def _worker_main(conn, generation):
+    """
+    Loop of a long-lived search worker. The worker keeps the texts of its
+    shard in memory and replies to every scan with the match counts per text.
+
+    A scan command carries the search generation it belongs to. The executor
+    moves the shared generation on when that search is cancelled or
+    superseded, and the scan then stops after the text it is on, replying
+    with what it has so the executor can discard it.
+    """
+    texts: Dict[int, ShardText] = {}
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        command = message[0]
+
+        if command == "load":
+            texts = dict(message[1])
+            conn.send(len(texts))
+        elif command == "add":
+            _, text_id, text = message
+            texts[text_id] = text
+            conn.send(len(texts))
+        elif command == "exact":
+            _, keywords, algorithm, text_ids, search_generation = message
+            matches: TextMatches = {}
+            skipped = 0
+            automaton = AhoCorasick(keywords) if algorithm == "AC" else None
+            for text_id in (texts if text_ids is None else text_ids):
+                if generation.value != search_generation:
+                    break
+                text, signature = texts[text_id]
+                candidates = [k for k in keywords if signature.might_contain(k)]
+                if not candidates:
+                    skipped += 1
+                    continue
+                counts = exact_match_counts(text, candidates, algorithm, automaton)
+                if counts:
+                    matches[text_id] = counts
+            conn.send((matches, skipped))
+        elif command == "fuzzy":
+            _, keywords, threshold, text_ids, search_generation = message
+            matches = {}
+            skipped = 0
+            for text_id in (texts if text_ids is None else text_ids):
+                if generation.value != search_generation:
+                    break
+                text, signature = texts[text_id]
+                candidates = [k for k in keywords if signature.might_match_fuzzy(k, threshold)]
+                if not candidates:
+                    skipped += 1
+                    continue
+                counts = fuzzy_match_counts(text, candidates, threshold)
+                if counts:
+                    matches[text_id] = counts
+            conn.send((matches, skipped))
+        elif command == "stop":
+            break
+    conn.close()
+
+
+class ShardedSearchExecutor:
+    """
+    Runs exact and fuzzy keyword matching on long-lived worker processes.
+
+    The distinct texts of the corpus are split into one shard per worker by
+    text id, so a text shared by several applications is shipped and matched
+    once. Searches return match counts per text id; mapping them to documents
+    and ranking is left to the caller.
+    """
+    def __init__(self, num_workers: Optional[int] = None):
+        """
+        Args:
+            num_workers: Number of worker processes (default: CPU count).
+        """
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self._context = multiprocessing.get_context("spawn")
+        self._connections: List[Any] = []
+        self._processes: List[Any] = []
+        self._outstanding: List[int] = []
+        self._text_ids: Set[int] = set()
+        self._lock = threading.Lock()
+        # Generation of the search the workers may scan for; moving it on stops their scans
+        self._generation = self._context.RawValue("q", 0)
+
+    def start(self):
+        """Starts the worker processes if they are not running yet."""
+        if self._processes:
+            return
+        for _ in range(self.num_workers):
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(target=_worker_main, args=(child_conn, self._generation), daemon=True)
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+            self._outstanding.append(0)
+
+    def shutdown(self):
+        """Stops all worker processes."""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.send(("stop",))
+                    conn.close()
+                except (OSError, BrokenPipeError):
+                    pass
+            for process in self._processes:
+                process.join(timeout=2)
+                if process.is_alive():
+                    process.terminate()
+            self._connections = []
+            self._processes = []
+            self._outstanding = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._processes)
+
+    def shard_of(self, text_id: int) -> int:
+        return text_id % self.num_workers
+
+    def load(self, text_store: TextStore):
+        """
+        Distributes the distinct texts of the corpus over the workers, replacing what they held.
+
+        Args:
+            text_store: TextStore of the corpus.
+        """
+        self.start()
+        shard_texts: List[Dict[int, ShardText]] = [{} for _ in range(self.num_workers)]
+        for text_id in range(len(text_store)):
+            shard_texts[self.shard_of(text_id)][text_id] = (text_store.lowered[text_id],
+                                                            text_store.signatures[text_id])
+        self._text_ids = set(range(len(text_store)))
+        with self._lock:
+            self._drain()
+            for conn, texts in zip(self._connections, shard_texts):
+                conn.send(("load", texts))
+            for conn in self._connections:
+                conn.recv()
+
+    def add_text(self, text_id: int, text_lower: str, signature: NGramSignature):
+        """Sends a new distinct text to the worker owning its text id, unless it holds it already."""
+        self.start()
+        if text_id in self._text_ids:
+            return
+        conn = self._connections[self.shard_of(text_id)]
+        with self._lock:
+            self._drain()
+            self._text_ids.add(text_id)
+            conn.send(("add", text_id, (text_lower, signature)))
+            conn.recv()
+
+    def _acquire_lock(self, token: Optional[CancellationToken]):
+        """Takes the executor lock, checking the token while a previous search still holds it."""
+        while not self._lock.acquire(timeout=POLL_INTERVAL):
+            if token is not None:
+                token.check()
+
+    def _next_generation(self) -> int:
+        """Starts a new search generation; scans of every earlier one stop at their next text."""
+        self._generation.value += 1
+        return self._generation.value
+
+    def _drain(self, token: Optional[CancellationToken] = None):
+        """
+        Discards replies still owed by workers from a cancelled search. Their
+        scans were stopped when it was cancelled, so this waits for at most
+        one text per worker; the token of the caller is honoured meanwhile.
+        """
+        while any(self._outstanding):
+            if token is not None:
+                token.check()
+            owing = {conn: i for i, conn in enumerate(self._connections) if self._outstanding[i]}
+            for conn in wait(list(owing), timeout=POLL_INTERVAL):
+                conn.recv()
+                self._outstanding[owing[conn]] -= 1
+
+    def _send_all(self, messages: List[Tuple], token: Optional[CancellationToken] = None) -> List[Any]:
+        """
+        Sends one command to each worker and collects the replies in worker order.
+        When the token fires, the workers' scans are stopped, the remaining
+        replies are left to _drain and SearchCancelled is raised without
+        waiting for them.
+        """
+        self._drain(token)
+        for i, (conn, message) in enumerate(zip(self._connections, messages)):
+            conn.send(message)
+            self._outstanding[i] += 1
+
+        replies: List[Any] = [None] * len(self._connections)
+        waiting = {conn: i for i, conn in enumerate(self._connections)}
+        try:
+            while waiting:
+                if token is not None:
+                    token.check()
+                for conn in wait(list(waiting), timeout=POLL_INTERVAL):
+                    i = waiting.pop(conn)
+                    replies[i] = conn.recv()
+                    self._outstanding[i] -= 1
+        except BaseException:
+            self._next_generation()
+            raise
+        return replies
+
+    def _split_by_shard(self, text_ids: Optional[List[int]]) -> List[Optional[List[int]]]:
+        """Splits a text filter into the part each worker holds."""
+        if text_ids is None:
+            return [None] * self.num_workers
+        parts: List[List[int]] = [[] for _ in range(self.num_workers)]
+        for text_id in text_ids:
+            if text_id in self._text_ids:
+                parts[self.shard_of(text_id)].append(text_id)
+        return parts
+
+    def _scan(self, messages: List[Tuple], token: Optional[CancellationToken]) -> Tuple[TextMatches, int]:
+        """Runs one scan command per worker and merges their matches and skip counts."""
+        matches: TextMatches = {}
+        skipped = 0
+        for shard_matches, shard_skipped in self._send_all(messages, token):
+            matches.update(shard_matches)
+            skipped += shard_skipped
+        return matches, skipped
+
+    def search(self, keywords: List[str], algorithm: str, fuzzy_threshold: int,
+               token: Optional[CancellationToken] = None,
+               on_exact_matches: Optional[Callable[[TextMatches, float], None]] = None,
+               text_ids: Optional[List[int]] = None) -> ShardedSearchResult:
+        """
+        Runs the exact stage on every shard in parallel, then the fuzzy stage
+        for keywords no shard matched exactly.
+
+        Args:
+            keywords: Lower-cased keywords.
+            algorithm: "KMP", "BM" or "AC".
+            fuzzy_threshold: Levenshtein threshold of the fuzzy stage.
+            token: Cancellation token checked while waiting for the workers or for a
+                previous search to stop; when it fires, the workers stop scanning too.
+            on_exact_matches: Called with the exact matches and the exact stage
+                time (ms) before the fuzzy stage starts.
+            text_ids: Texts to search (None = all); each worker only
+                receives and visits its own part.
+
+        Returns:
+            ShardedSearchResult: Matches per text id and stage timings
+
+        Raises:
+            SearchCancelled: If the token is cancelled or expires
+        """
+        self.start()
+        self._acquire_lock(token)
+        try:
+            generation = self._next_generation()
+            shard_text_ids = self._split_by_shard(text_ids)
+            start_exact = time.perf_counter()
+            exact_matches, exact_skipped = self._scan(
+                [("exact", keywords, algorithm, part, generation) for part in shard_text_ids], token)
+            exact_ms = (time.perf_counter() - start_exact) * 1000
+            found_keywords: Set[str] = set()
+            for counts in exact_matches.values():
+                found_keywords.update(counts)
+
+            unfound_keywords = [k for k in keywords if k not in found_keywords]
+            fuzzy_matches: TextMatches = {}
+            fuzzy_ms = 0.0
+            fuzzy_skipped = 0
+            if unfound_keywords:
+                if on_exact_matches is not None:
+                    on_exact_matches(exact_matches, exact_ms)
+                start_fuzzy = time.perf_counter()
+                fuzzy_matches, fuzzy_skipped = self._scan(
+                    [("fuzzy", unfound_keywords, fuzzy_threshold, part, generation) for part in shard_text_ids],
+                    token)
+                fuzzy_ms = (time.perf_counter() - start_fuzzy) * 1000
+        finally:
+            self._lock.release()
+        return ShardedSearchResult(exact_matches, fuzzy_matches, found_keywords, unfound_keywords,
+                                   exact_ms, fuzzy_ms, exact_skipped, fuzzy_skipped)
+
+
+def benchmark_speedup(cv_database: List[Dict[str, Any]], keywords: List[str],
+                      worker_counts: Optional[List[int]] = None, algorithm: str = "KMP",
+                      fuzzy_threshold: int = 2, repeats: int = 3) -> List[Tuple[int, float, float]]:
+    """
+    Measures search time of the sharded executor for several worker counts.
+
+    Args:
+        cv_database: CV entries with "cv_text".
+        keywords: Lower-cased keywords to search.
+        worker_counts: Worker counts to try (default: 1, 2, 4, ... up to CPU count).
+        algorithm: Exact matching algorithm.
+        fuzzy_threshold: Levenshtein threshold.
+        repeats: Runs per worker count; the best run is kept.
+
+    Returns:
+        List[Tuple[int, float, float]]: (workers, seconds, speedup over 1 worker)
+    """
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpu_count:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cpu_count:
+            worker_counts.append(cpu_count)
+
+    text_store = TextStore()
+    for entry in cv_database:
+        text_store.add(entry.get("cv_text", ""))
+    rows: List[Tuple[int, float, float]] = []
+    baseline = None
+    for workers in worker_counts:
+        executor = ShardedSearchExecutor(workers)
+        try:
+            executor.load(text_store)
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                executor.search(keywords, algorithm, fuzzy_threshold)
+                best = min(best, time.perf_counter() - start)
+        finally:
+            executor.shutdown()
+        if baseline is None:
+            baseline = best
+        rows.append((workers, best, baseline / best if best else 0.0))
+    return rows
+
+
+# For benchmarking: python search_executor.py [pdf_root] [keyword,keyword,...]
+if __name__ == '__main__':
+    import glob
+    import sys
+    from pdf_extractor import extract_text_pypdf2
+
+    pdf_root = sys.argv[1] if len(sys.argv) > 1 else os.path.join("archive", "data", "data")
+    bench_keywords = sys.argv[2].split(",") if len(sys.argv) > 2 else ["python", "accounting", "managment"]
+    bench_keywords = [k.strip().lower() for k in bench_keywords if k.strip()]
+
+    pdf_paths = sorted(glob.glob(os.path.join(pdf_root, "*", "*.pdf")))
+    corpus = [{"id": i, "cv_text": extract_text_pypdf2(path)} for i, path in enumerate(pdf_paths)]
+    print(f"Loaded {len(corpus)} CVs from {pdf_root}, keywords: {bench_keywords}")
+
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    for workers, seconds, speedup in benchmark_speedup(corpus, bench_keywords):
+        print(f"{workers:>8} {seconds:>10.3f} {speedup:>7.2f}x")
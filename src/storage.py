@@ -0,0 +1,691 @@
+# src/storage.py
+
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import mysql.connector
+from mysql.connector import Error
+
+from db_pool import ConnectionPool, DEFAULT_CHECKOUT_TIMEOUT, DEFAULT_HEALTH_CHECK_IDLE, DEFAULT_POOL_SIZE
+
+DEFAULT_SQLITE_PATH = os.path.join("archive", "applicants.sqlite3")
+# Rows fetched per round trip by the streaming queries
+STREAM_BATCH_SIZE = 1000
+# Ids per IN (...) list in batched lookups; far below the placeholder limits of both drivers
+IN_LIST_CHUNK_SIZE = 500
+
+# Version of the tables and indexes the manager provisions. Bump it when
+# core_schema, extraction_schema or create_indexes change, so existing
+# databases are migrated on their next connect.
+SCHEMA_VERSION = 2
+SCHEMA_VERSION_TABLE = "SchemaVersion"
+# MySQL server error for a database that does not exist
+ER_BAD_DB_ERROR = 1049
+
+
+class StorageError(Exception):
+    """Raised when the storage backend cannot be opened or used."""
+
+
+# What the manager catches around a statement, whatever the backend
+DatabaseError = (Error, sqlite3.Error, StorageError)
+
+# (table, index name, columns) of the secondary indexes every backend creates
+SECONDARY_INDEXES = (
+    ("ApplicationDetail", "idx_application_detail_applicant", "(applicant_id, detail_id)"),
+    ("ApplicationDetail", "idx_application_detail_role", "(application_role)"),
+    ("ApplicantProfile", "idx_applicant_profile_first_name", "(first_name)"),
+    ("ApplicantProfile", "idx_applicant_profile_last_name", "(last_name)"),
+)
+
+
+class StorageBackend(ABC):
+    """
+    A database ApplicantDatabaseManager can run on. Queries are written once
+    in the MySQL dialect with %s placeholders; a backend rewrites them with
+    sql() and supplies the few fragments that differ between dialects.
+    """
+    name = ""
+    insert_ignore = "INSERT IGNORE"
+    # Calendar year of birth, the key of BirthYearStatistics
+    birth_year_expression = "YEAR(date_of_birth)"
+
+    def sql(self, query: str) -> str:
+        return query
+
+    @abstractmethod
+    def open(self) -> bool:
+        """
+        Prepares the database for use. A server backend may connect lazily,
+        on the first acquire(), and create the database then if missing.
+        Returns False on failure.
+        """
+
+    @abstractmethod
+    def close(self):
+        """Closes every connection."""
+
+    @abstractmethod
+    def acquire(self):
+        """Checks out a connection for the calling thread; pair with release()."""
+
+    @abstractmethod
+    def release(self, connection, discard: bool = False):
+        """Returns a connection, rolling back any open transaction."""
+
+    @abstractmethod
+    def table_exists(self, cursor, table: str) -> bool:
+        pass
+
+    @abstractmethod
+    def core_schema(self) -> str:
+        """DDL dropping and recreating ApplicantProfile and ApplicationDetail, ';'-separated."""
+
+    @abstractmethod
+    def extraction_schema(self) -> str:
+        """DDL creating the CV extraction tables if missing, ';'-separated."""
+
+    @abstractmethod
+    def statistics_schema(self) -> str:
+        """DDL creating the RoleStatistics and BirthYearStatistics summary tables if missing, ';'-separated."""
+
+    @abstractmethod
+    def increment_on_conflict(self, key: str, counter: str) -> str:
+        """Clause making an INSERT of an existing key add 1 to counter instead."""
+
+    @abstractmethod
+    def create_indexes(self, cursor) -> List[str]:
+        """Creates the missing SECONDARY_INDEXES and the name search index. Returns the names created."""
+
+    @abstractmethod
+    def name_search(self, term: str) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        """
+        Condition on ApplicantProfile.applicant_id selecting, through the name
+        search index, at least every applicant whose first or last name
+        contains term, with its parameters. None if the index cannot serve
+        the term (too short), in which case only LIKE applies.
+        """
+
+    @abstractmethod
+    def explain(self, cursor, query: str, params: Tuple[Any, ...] = ()) -> List[Tuple[str, bool]]:
+        """The plan of a query as (step, is_full_table_scan) lines."""
+
+    def dict_cursor(self, connection):
+        """Cursor returning rows as column -> value dicts."""
+        return connection.cursor(dictionary=True)
+
+    def stream_cursor(self, connection, dictionary: bool = False):
+        """Cursor that fetches rows from the server as they are read instead of all at once."""
+        return self.dict_cursor(connection) if dictionary else connection.cursor()
+
+    def close_stream(self, connection, cursor):
+        """Closes a stream cursor, also when its rows were not all read."""
+        cursor.close()
+
+    def begin(self, connection):
+        """
+        Starts a transaction for a group of writes; commit or roll it back on
+        the connection. Pooled MySQL connections run in autocommit mode, so
+        reads never leave a transaction open for release to roll back.
+        """
+        connection.start_transaction()
+
+    @contextmanager
+    def bulk_load(self, connection) -> Iterator[None]:
+        """
+        Session settings for loading many rows in one transaction, which is
+        started on entry: key checks off, restored on exit. Commit inside the
+        block; an uncommitted transaction is rolled back on exit.
+        """
+        self.begin(connection)
+        yield
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    def schema_state(self, cursor) -> Optional[Tuple[Optional[int], bool]]:
+        """
+        (recorded schema version, whether any applicant exists) in one query,
+        or None if the version table or ApplicantProfile is missing.
+        """
+        try:
+            cursor.execute(f"SELECT MAX(version), EXISTS (SELECT 1 FROM ApplicantProfile) "
+                           f"FROM {SCHEMA_VERSION_TABLE}")
+            version, has_data = cursor.fetchone()
+        except DatabaseError:
+            return None
+        return version, bool(has_data)
+
+    def record_schema_version(self, cursor, version: int = SCHEMA_VERSION):
+        """Marks the database as provisioned at version; commit afterwards."""
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} "
+                       f"(version INTEGER NOT NULL PRIMARY KEY, applied_at TIMESTAMP NOT NULL)")
+        cursor.execute(self.sql(f"{self.insert_ignore} INTO {SCHEMA_VERSION_TABLE} (version, applied_at) "
+                                f"VALUES (%s, %s)"), (version, datetime.now()))
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrows a connection for a with block. If the block raises, the
+        transaction is rolled back; a connection that cannot be rolled back
+        is discarded.
+        """
+        connection = self.acquire()
+        discard = False
+        try:
+            yield connection
+        except BaseException:
+            try:
+                connection.rollback()
+            except DatabaseError:
+                discard = True
+            raise
+        finally:
+            self.release(connection, discard)
+
+
+class MySQLBackend(StorageBackend):
+    """MySQL server behind a ConnectionPool (see db_pool)."""
+    name = "mysql"
+
+    def __init__(self, config: Dict[str, Any], database_name: str, pool_size: int = DEFAULT_POOL_SIZE,
+                 checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+                 health_check_idle: float = DEFAULT_HEALTH_CHECK_IDLE):
+        self.config = config
+        self.database_name = database_name
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_idle = health_check_idle
+        self.pool: Optional[ConnectionPool] = None
+
+    def open(self) -> bool:
+        # No round trip here: the pool connects on the first checkout, and
+        # creates the database then if the server does not have it yet
+        self.pool = ConnectionPool(dict(self.config, autocommit=True), size=self.pool_size, checkout_timeout=self.checkout_timeout,
+                                   health_check_idle=self.health_check_idle, connect=self._connect)
+        print(f"MySQL connection pool ready for {self.config['host']}/{self.config['database']} "
+              f"({self.pool_size} connections, opened on demand)")
+        return True
+
+    def _connect(self, **config):
+        try:
+            return mysql.connector.connect(**config)
+        except Error as e:
+            if getattr(e, "errno", None) != ER_BAD_DB_ERROR:
+                raise
+        self._create_database()
+        return mysql.connector.connect(**config)
+
+    def _create_database(self):
+        server_config = self.config.copy()
+        server_config.pop('database')
+        connection = mysql.connector.connect(**server_config)
+        try:
+            cursor = connection.cursor()
+            print(f"Database '{self.database_name}' doesn't exist. Creating...")
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database_name} "
+                           f"CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+            cursor.close()
+            print(f"Database '{self.database_name}' created successfully")
+        finally:
+            connection.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+            print("MySQL connection pool closed")
+
+    def acquire(self):
+        if self.pool is None:
+            raise StorageError("MySQL backend is not open")
+        return self.pool.acquire()
+
+    def release(self, connection, discard: bool = False):
+        self.pool.release(connection, discard)
+
+    def table_exists(self, cursor, table: str) -> bool:
+        cursor.execute("SHOW TABLES LIKE %s", (table,))
+        return cursor.fetchone() is not None
+
+    @staticmethod
+    def _index_exists(cursor, table: str, index: str) -> bool:
+        cursor.execute(f"SHOW INDEX FROM {table} WHERE Key_name = %s", (index,))
+        return bool(cursor.fetchall())
+
+    def create_indexes(self, cursor) -> List[str]:
+        # MySQL has no CREATE INDEX IF NOT EXISTS
+        created = []
+        for table, index, columns in SECONDARY_INDEXES:
+            if not self._index_exists(cursor, table, index):
+                cursor.execute(f"CREATE INDEX {index} ON {table} {columns}")
+                created.append(index)
+        if not self._index_exists(cursor, "ApplicantProfile", "ft_applicant_profile_name"):
+            # The ngram parser drops every token containing a stopword, and the
+            # default list has "a" and "i", so index the names without one
+            cursor.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+            cursor.execute("CREATE FULLTEXT INDEX ft_applicant_profile_name "
+                           "ON ApplicantProfile (first_name, last_name) WITH PARSER ngram")
+            created.append("ft_applicant_profile_name")
+        return created
+
+    def name_search(self, term: str) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        # Bigrams (ngram_token_size 2); a phrase of them matches the substring
+        if len(term) < 2 or not term.replace(" ", "").isalnum():
+            return None
+        return "MATCH(first_name, last_name) AGAINST (%s IN BOOLEAN MODE)", (f'"{term}"',)
+
+    def explain(self, cursor, query: str, params: Tuple[Any, ...] = ()) -> List[Tuple[str, bool]]:
+        cursor.execute("EXPLAIN " + query, params)
+        columns = [desc[0] for desc in cursor.description]
+        plan = []
+        for row in cursor.fetchall():
+            step = dict(zip(columns, row))
+            plan.append((f"{step['table']}: {step['type']} key={step['key']} rows={step['rows']} "
+                         f"{step['Extra'] or ''}".rstrip(), step['type'] == 'ALL'))
+        return plan
+
+    @contextmanager
+    def bulk_load(self, connection) -> Iterator[None]:
+        # InnoDB ignores ALTER TABLE ... DISABLE KEYS; skipping the foreign
+        # key and unique checks is what speeds up its loads
+        cursor = connection.cursor()
+        cursor.execute("SET foreign_key_checks = 0, unique_checks = 0")
+        try:
+            self.begin(connection)
+            yield
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            cursor.execute("SET foreign_key_checks = 1, unique_checks = 1")
+            cursor.close()
+
+    def stream_cursor(self, connection, dictionary: bool = False):
+        # Unbuffered: the server sends the result set while it is read
+        return connection.cursor(buffered=False, dictionary=dictionary)
+
+    def close_stream(self, connection, cursor):
+        # The protocol cannot send another statement before an unbuffered
+        # result is read to the end, so drain what the reader left
+        if connection.unread_result:
+            connection.consume_results()
+        cursor.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.pool.stats() if self.pool else {}
+
+    def core_schema(self) -> str:
+        return """
+            SET NAMES 'utf8mb4' COLLATE 'utf8mb4_unicode_ci';
+
+            SET FOREIGN_KEY_CHECKS = 0;
+
+            DROP TABLE IF EXISTS ApplicationSkill;
+            DROP TABLE IF EXISTS JobHistory;
+            DROP TABLE IF EXISTS EducationHistory;
+            DROP TABLE IF EXISTS CvExtraction;
+            DROP TABLE IF EXISTS ApplicationDetail;
+            DROP TABLE IF EXISTS ApplicantProfile;
+
+            SET FOREIGN_KEY_CHECKS = 1;
+
+            CREATE TABLE ApplicantProfile (
+                applicant_id INT AUTO_INCREMENT PRIMARY KEY,
+                first_name VARCHAR(50),
+                last_name VARCHAR(50),
+                date_of_birth DATE,
+                address VARCHAR(255),
+                phone_number VARCHAR(20)
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+            CREATE TABLE ApplicationDetail (
+                detail_id INT AUTO_INCREMENT PRIMARY KEY,
+                applicant_id INT NOT NULL,
+                application_role VARCHAR(100),
+                cv_path TEXT,
+                FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """
+
+    def extraction_schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS CvExtraction (
+                detail_id INT PRIMARY KEY,
+                content_hash CHAR(64) NOT NULL,
+                extracted_at DATETIME NOT NULL,
+                summary TEXT,
+                FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+            CREATE TABLE IF NOT EXISTS Skill (
+                skill_id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                UNIQUE KEY uq_skill_name (name)
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+            CREATE TABLE IF NOT EXISTS ApplicationSkill (
+                detail_id INT NOT NULL,
+                skill_id INT NOT NULL,
+                PRIMARY KEY (detail_id, skill_id),
+                KEY idx_application_skill_skill (skill_id, detail_id),
+                FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE,
+                FOREIGN KEY (skill_id) REFERENCES Skill(skill_id)
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+            CREATE TABLE IF NOT EXISTS JobHistory (
+                job_id INT AUTO_INCREMENT PRIMARY KEY,
+                detail_id INT NOT NULL,
+                position VARCHAR(255),
+                company VARCHAR(255),
+                period VARCHAR(100),
+                KEY idx_job_history_detail (detail_id),
+                KEY idx_job_history_position (position),
+                KEY idx_job_history_company (company),
+                FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+            CREATE TABLE IF NOT EXISTS EducationHistory (
+                education_id INT AUTO_INCREMENT PRIMARY KEY,
+                detail_id INT NOT NULL,
+                degree VARCHAR(255),
+                institution VARCHAR(255),
+                period VARCHAR(100),
+                KEY idx_education_history_detail (detail_id),
+                KEY idx_education_history_institution (institution),
+                FOREIGN KEY (detail_id) REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """
+
+    def statistics_schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS RoleStatistics (
+                role VARCHAR(100) PRIMARY KEY,
+                application_count INT NOT NULL
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+            CREATE TABLE IF NOT EXISTS BirthYearStatistics (
+                birth_year INT PRIMARY KEY,
+                applicant_count INT NOT NULL
+            )ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """
+
+    def increment_on_conflict(self, key: str, counter: str) -> str:
+        return f"ON DUPLICATE KEY UPDATE {counter} = {counter} + 1"
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Embedded SQLite file, no server needed.
+
+    The file runs in WAL mode, so readers never block the writer, with
+    synchronous=NORMAL (durable at checkpoints, safe under WAL), an
+    in-memory temp store, a 64 MB page cache and a 256 MB memory map. Every
+    thread gets its own connection, as sqlite3 connections are not meant to
+    be shared while in use.
+    """
+    name = "sqlite"
+    insert_ignore = "INSERT OR IGNORE"
+    birth_year_expression = "CAST(strftime('%Y', date_of_birth) AS INTEGER)"
+
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -65536",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA busy_timeout = 5000",
+    )
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._open = False
+
+    def sql(self, query: str) -> str:
+        return query.replace("%s", "?")
+
+    def _new_connection(self) -> sqlite3.Connection:
+        # DATE and TIMESTAMP columns come back as date/datetime, as they do from MySQL
+        connection = sqlite3.connect(self.path, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+        for pragma in self.PRAGMAS:
+            connection.execute(pragma)
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def open(self) -> bool:
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._open = True
+            self.release(self.acquire())
+            print(f"Opened SQLite database: {self.path}")
+            return True
+        except (OSError, sqlite3.Error) as e:
+            self._open = False
+            print(f"SQLite open error: {e}")
+            return False
+
+    def close(self):
+        self._open = False
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def acquire(self):
+        if not self._open:
+            raise StorageError("SQLite backend is not open")
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._new_connection()
+        return connection
+
+    def begin(self, connection):
+        # sqlite3 opens a transaction before the first write itself
+        pass
+
+    def release(self, connection, discard: bool = False):
+        if discard:
+            self._local.connection = None
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+            connection.close()
+        elif connection.in_transaction:
+            connection.rollback()
+
+    def table_exists(self, cursor, table: str) -> bool:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? COLLATE NOCASE", (table,))
+        return cursor.fetchone() is not None
+
+    def create_indexes(self, cursor) -> List[str]:
+        created = []
+        for table, index, columns in SECONDARY_INDEXES:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index,))
+            if cursor.fetchone() is None:
+                cursor.execute(f"CREATE INDEX {index} ON {table} {columns}")
+                created.append(index)
+        if not self.table_exists(cursor, "ApplicantNameSearch"):
+            # Trigram full-text index over the names, kept in sync by triggers;
+            # it answers substring queries of three characters or more
+            cursor.executescript("""
+                CREATE VIRTUAL TABLE ApplicantNameSearch USING fts5(
+                    first_name, last_name,
+                    content='ApplicantProfile', content_rowid='applicant_id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS applicant_name_search_insert AFTER INSERT ON ApplicantProfile BEGIN
+                    INSERT INTO ApplicantNameSearch (rowid, first_name, last_name)
+                    VALUES (new.applicant_id, new.first_name, new.last_name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS applicant_name_search_delete AFTER DELETE ON ApplicantProfile BEGIN
+                    INSERT INTO ApplicantNameSearch (ApplicantNameSearch, rowid, first_name, last_name)
+                    VALUES ('delete', old.applicant_id, old.first_name, old.last_name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS applicant_name_search_update AFTER UPDATE ON ApplicantProfile BEGIN
+                    INSERT INTO ApplicantNameSearch (ApplicantNameSearch, rowid, first_name, last_name)
+                    VALUES ('delete', old.applicant_id, old.first_name, old.last_name);
+                    INSERT INTO ApplicantNameSearch (rowid, first_name, last_name)
+                    VALUES (new.applicant_id, new.first_name, new.last_name);
+                END;
+                INSERT INTO ApplicantNameSearch (ApplicantNameSearch) VALUES ('rebuild');
+            """)
+            created.append("ApplicantNameSearch")
+        return created
+
+    def name_search(self, term: str) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        if len(term) < 3:
+            return None
+        phrase = '"' + term.replace('"', '""') + '"'
+        return "applicant_id IN (SELECT rowid FROM ApplicantNameSearch WHERE ApplicantNameSearch MATCH %s)", (phrase,)
+
+    def explain(self, cursor, query: str, params: Tuple[Any, ...] = ()) -> List[Tuple[str, bool]]:
+        cursor.execute("EXPLAIN QUERY PLAN " + self.sql(query), params)
+        plan = []
+        for _, _, _, detail in cursor.fetchall():
+            # "SCAN t" reads the table; "SCAN t USING (COVERING) INDEX" reads an index
+            full_scan = detail.startswith("SCAN ") and "USING" not in detail and "VIRTUAL TABLE" not in detail
+            plan.append((detail, full_scan))
+        return plan
+
+    def dict_cursor(self, connection):
+        cursor = connection.cursor()
+        cursor.row_factory = lambda cur, row: {column[0]: value for column, value in zip(cur.description, row)}
+        return cursor
+
+    @contextmanager
+    def bulk_load(self, connection) -> Iterator[None]:
+        # Both pragmas are no-ops inside a transaction, so they are set before
+        # the load starts one and restored after it ended. The load is one
+        # transaction; skip the fsyncs until it is committed.
+        if connection.in_transaction:
+            connection.rollback()
+        connection.execute("PRAGMA foreign_keys = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        try:
+            yield
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"path": self.path, "open": len(self._connections)}
+
+    def core_schema(self) -> str:
+        return """
+            DROP TABLE IF EXISTS ApplicationSkill;
+            DROP TABLE IF EXISTS JobHistory;
+            DROP TABLE IF EXISTS EducationHistory;
+            DROP TABLE IF EXISTS CvExtraction;
+            DROP TABLE IF EXISTS ApplicationDetail;
+            DROP TABLE IF EXISTS ApplicantNameSearch;
+            DROP TABLE IF EXISTS ApplicantProfile;
+
+            CREATE TABLE ApplicantProfile (
+                applicant_id INTEGER PRIMARY KEY,
+                first_name TEXT,
+                last_name TEXT,
+                date_of_birth DATE,
+                address TEXT,
+                phone_number TEXT
+            );
+
+            CREATE TABLE ApplicationDetail (
+                detail_id INTEGER PRIMARY KEY,
+                applicant_id INTEGER NOT NULL REFERENCES ApplicantProfile(applicant_id),
+                application_role TEXT,
+                cv_path TEXT
+            );
+            """
+
+    def extraction_schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS CvExtraction (
+                detail_id INTEGER PRIMARY KEY REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE,
+                content_hash TEXT NOT NULL,
+                extracted_at TIMESTAMP NOT NULL,
+                summary TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS Skill (
+                skill_id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL COLLATE NOCASE UNIQUE
+            );
+
+            CREATE TABLE IF NOT EXISTS ApplicationSkill (
+                detail_id INTEGER NOT NULL REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE,
+                skill_id INTEGER NOT NULL REFERENCES Skill(skill_id),
+                PRIMARY KEY (detail_id, skill_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_application_skill_skill ON ApplicationSkill (skill_id, detail_id);
+
+            CREATE TABLE IF NOT EXISTS JobHistory (
+                job_id INTEGER PRIMARY KEY,
+                detail_id INTEGER NOT NULL REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE,
+                position TEXT,
+                company TEXT,
+                period TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_job_history_detail ON JobHistory (detail_id);
+            CREATE INDEX IF NOT EXISTS idx_job_history_position ON JobHistory (position);
+            CREATE INDEX IF NOT EXISTS idx_job_history_company ON JobHistory (company);
+
+            CREATE TABLE IF NOT EXISTS EducationHistory (
+                education_id INTEGER PRIMARY KEY,
+                detail_id INTEGER NOT NULL REFERENCES ApplicationDetail(detail_id) ON DELETE CASCADE,
+                degree TEXT,
+                institution TEXT,
+                period TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_education_history_detail ON EducationHistory (detail_id);
+            CREATE INDEX IF NOT EXISTS idx_education_history_institution ON EducationHistory (institution)
+            """
+
+    def statistics_schema(self) -> str:
+        return """
+            CREATE TABLE IF NOT EXISTS RoleStatistics (
+                role TEXT PRIMARY KEY,
+                application_count INTEGER NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS BirthYearStatistics (
+                birth_year INTEGER PRIMARY KEY,
+                applicant_count INTEGER NOT NULL
+            )
+            """
+
+    def increment_on_conflict(self, key: str, counter: str) -> str:
+        # UPSERT (SQLite 3.24+)
+        return f"ON CONFLICT ({key}) DO UPDATE SET {counter} = {counter} + 1"
+
+
+def create_backend(name: Optional[str] = None, config: Optional[Dict[str, Any]] = None,
+                   database_name: str = "applicant_db") -> StorageBackend:
+    """
+    Builds the backend selected by name or the DB_BACKEND environment variable
+    ("mysql", the default, or "sqlite" with the file at SQLITE_PATH).
+    """
+    name = (name or os.getenv("DB_BACKEND", "mysql")).lower()
+    if name == "sqlite":
+        return SQLiteBackend(os.getenv("SQLITE_PATH", DEFAULT_SQLITE_PATH))
+    if name == "mysql":
+        return MySQLBackend(
+            config or {}, database_name,
+            pool_size=int(os.getenv('MYSQL_POOL_SIZE', str(DEFAULT_POOL_SIZE))),
+            checkout_timeout=float(os.getenv('MYSQL_POOL_TIMEOUT', str(DEFAULT_CHECKOUT_TIMEOUT))),
+            health_check_idle=float(os.getenv('MYSQL_POOL_HEALTH_CHECK_IDLE', str(DEFAULT_HEALTH_CHECK_IDLE)))
+        )
+    raise ValueError(f"unknown storage backend: {name}")
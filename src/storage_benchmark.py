@@ -0,0 +1,118 @@
+# src/storage_benchmark.py
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from database import ApplicantDatabaseManager
+from storage import SQLiteBackend, StorageBackend, create_backend
+
+QUERY_REPEATS = 200
+
+
+@dataclass
+class BackendTimings:
+    """
+    Timings of one backend on the seed data.
+
+    Attributes:
+        backend: Backend name.
+        startup_seconds: Recreate the tables and load the seed rows.
+        reopen_seconds: connect() again once the tables are there.
+        load_seconds: get_all_applicant_data_joined, the GUI's startup query.
+        rows: Rows returned by the startup query.
+        latencies_ms: Latency samples per query name.
+    """
+    backend: str
+    startup_seconds: float = 0.0
+    reopen_seconds: float = 0.0
+    load_seconds: float = 0.0
+    rows: int = 0
+    latencies_ms: Dict[str, List[float]] = field(default_factory=dict)
+
+    def report(self) -> str:
+        lines = [f"{self.backend}: startup {self.startup_seconds * 1000:.1f} ms, "
+                 f"reopen {self.reopen_seconds * 1000:.1f} ms, "
+                 f"load {self.rows} rows in {self.load_seconds * 1000:.1f} ms"]
+        for name, samples in self.latencies_ms.items():
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            lines.append(f"  {name:<28} median {statistics.median(ordered):7.3f} ms   p95 {p95:7.3f} ms")
+        return "\n".join(lines)
+
+
+def _timed(function: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def benchmark_backend(backend: StorageBackend, repeats: int = QUERY_REPEATS) -> Optional[BackendTimings]:
+    """
+    Provisions an empty database on the backend, then times the startup load
+    and the point queries the GUI and the CLI run.
+
+    The backend's existing tables are dropped and re-seeded, so point it at
+    a scratch database.
+
+    Returns:
+        BackendTimings, or None if the backend cannot be opened or the startup query fails
+    """
+    timings = BackendTimings(backend.name)
+    db = ApplicantDatabaseManager(backend=backend)
+
+    if not db.connect():
+        return None
+    timings.startup_seconds = _timed(lambda: (db.setup_database(), db.seed_all_data()))
+    db.disconnect()
+
+    timings.reopen_seconds = _timed(db.connect)
+
+    start = time.perf_counter()
+    rows = db.get_all_applicant_data_joined()
+    timings.load_seconds = time.perf_counter() - start
+    if rows is None:
+        db.disconnect()
+        return None
+    timings.rows = len(rows)
+
+    queries: Dict[str, Callable[[int], object]] = {
+        "get_applicant_by_id": lambda i: db.get_applicant_by_id(i % 80 + 1),
+        "search_applicants_by_name": lambda i: db.search_applicants_by_name("Mohammad"),
+        "get_applications_by_role": lambda i: db.get_applications_by_role("Engineer"),
+        "get_role_statistics": lambda i: db.get_role_statistics(),
+        "get_age_distribution": lambda i: db.get_age_distribution(),
+    }
+    for name, query in queries.items():
+        timings.latencies_ms[name] = [_timed(lambda: query(i)) * 1000 for i in range(repeats)]
+
+    db.disconnect()
+    return timings
+
+
+# Usage: python storage_benchmark.py [sqlite] [mysql (--database SCRATCH_DB | --yes)]
+# SQLite (the default) runs on a temporary file. MySQL drops and re-seeds the tables, so it
+# needs a scratch database to run on (created if missing), or --yes to use MYSQL_DATABASE.
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    names = [arg for arg in args if arg in ("sqlite", "mysql")] or ["sqlite"]
+    scratch_database = args[args.index("--database") + 1] if "--database" in args else None
+    if "mysql" in names and not scratch_database and "--yes" not in args:
+        print("The MySQL benchmark drops and re-seeds its database's tables. Pass --database SCRATCH_DB "
+              "to run it on a scratch database, or --yes to run it on MYSQL_DATABASE.")
+        sys.exit(2)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for name in names:
+            if name == "sqlite":
+                backend = SQLiteBackend(os.path.join(scratch, "benchmark.sqlite3"))
+            else:
+                config = ApplicantDatabaseManager(backend=name).config
+                database = scratch_database or config["database"]
+                backend = create_backend(name, dict(config, database=database), database)
+            timings = benchmark_backend(backend)
+            print(timings.report() if timings else f"{name}: not available")
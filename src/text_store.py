@@ -0,0 +1,83 @@
+# src/text_store.py
+
+import hashlib
+from typing import Dict, List, Optional
+
+from algorithm.ngram_filter import NGramSignature
+
+FILE_HASH_CHUNK = 1 << 20
+
+
+def content_hash(text: str) -> bytes:
+    """Returns the SHA-256 digest identifying a CV text."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+
+
+def file_digest(path: str) -> bytes:
+    """
+    Returns the SHA-256 digest of a file's bytes, so identical CV files can
+    share one text extraction.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(FILE_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+class TextStore:
+    """
+    Content-addressed store of the distinct CV texts of the corpus.
+
+    Every distinct text is kept once, together with its lower-cased form
+    and q-gram signature, and corpus documents point at it by text id.
+    Searches match each text once and fan the counts out to the documents
+    in linked_docs.
+
+    Attributes:
+        texts (List[str]): Distinct texts, indexed by text id.
+        lowered (List[str]): Lower-cased texts as the matchers see them.
+        signatures (List[NGramSignature]): Q-gram signature of every text.
+        hashes (List[bytes]): Content hash of every text.
+        linked_docs (Dict[int, List[int]]): Document indexes using each text.
+    """
+    def __init__(self):
+        self.texts: List[str] = []
+        self.lowered: List[str] = []
+        self.signatures: List[NGramSignature] = []
+        self.hashes: List[bytes] = []
+        self.linked_docs: Dict[int, List[int]] = {}
+        self._ids_by_hash: Dict[bytes, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, text: str, signature: Optional[NGramSignature] = None) -> int:
+        """
+        Stores a text unless an identical one is already stored.
+
+        Args:
+            text: The CV text.
+            signature: Precomputed signature of the lower-cased text.
+
+        Returns:
+            int: Id of the stored text
+        """
+        key = content_hash(text)
+        text_id = self._ids_by_hash.get(key)
+        if text_id is not None:
+            return text_id
+
+        text_id = len(self.texts)
+        lowered = text.lower()
+        self._ids_by_hash[key] = text_id
+        self.texts.append(text)
+        self.lowered.append(lowered)
+        self.signatures.append(signature or NGramSignature.from_text(lowered))
+        self.hashes.append(key)
+        self.linked_docs[text_id] = []
+        return text_id
+
+    def link(self, text_id: int, doc_index: int):
+        """Records that a corpus document uses a stored text."""
+        self.linked_docs[text_id].append(doc_index)
@@ -0,0 +1,25 @@
+# tests/conftest.py
+
+import os
+import sys
+
+import pytest
+
+# The modules under src/ import each other by bare name, as when run from there
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """An ApplicantDatabaseManager on a fresh SQLite file with the full schema in place."""
+    pytest.importorskip("mysql.connector")
+    pytest.importorskip("dotenv")
+    from database import ApplicantDatabaseManager
+    from storage import SQLiteBackend
+
+    manager = ApplicantDatabaseManager(backend=SQLiteBackend(str(tmp_path / "applicants.db")), check_schema=False)
+    assert manager.connect()
+    manager.setup_database()
+    assert manager.setup_extraction_tables()
+    yield manager
+    manager.disconnect()
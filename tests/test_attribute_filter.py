@@ -0,0 +1,79 @@
+# tests/test_attribute_filter.py
+
+from datetime import date
+
+import pytest
+
+from attribute_filter import AttributeIndex, SearchFilters, age_from_birthdate, bits_to_indexes
+
+TODAY = date(2025, 6, 15)
+ROLES = ("Designer", "Accountant", None, "Data Scientist")
+
+
+def documents():
+    for doc_index in range(200):
+        birthdate = None if doc_index % 11 == 0 else f"{1975 + doc_index % 30}-0{1 + doc_index % 9}-15"
+        yield doc_index, ROLES[doc_index % len(ROLES)], birthdate
+
+
+def brute_force(docs, filters):
+    kept = []
+    for doc_index, role, birthdate in docs:
+        age = age_from_birthdate(birthdate, TODAY) if birthdate else None
+        if filters.roles and role not in filters.roles:
+            continue
+        if filters.min_age is not None and (age is None or age < filters.min_age):
+            continue
+        if filters.max_age is not None and (age is None or age > filters.max_age):
+            continue
+        kept.append(doc_index)
+    return kept
+
+
+@pytest.fixture
+def index():
+    attribute_index = AttributeIndex(today=TODAY)
+    for document in documents():
+        attribute_index.add_document(*document)
+    return attribute_index
+
+
+@pytest.mark.parametrize("filters", [
+    SearchFilters(roles=("Designer",)),
+    SearchFilters(roles=("Designer", "Data Scientist")),
+    SearchFilters(min_age=30),
+    SearchFilters(max_age=35),
+    SearchFilters(roles=("Accountant",), min_age=25, max_age=40),
+    SearchFilters(roles=("Nobody",)),
+])
+def test_filters_match_brute_force(index, filters):
+    assert index.doc_indexes(filters) == brute_force(documents(), filters)
+
+
+def test_empty_filters_scan_everything(index):
+    assert index.doc_indexes(SearchFilters()) is None
+    assert bits_to_indexes(index.all_bits) == list(range(200))
+
+
+def test_removed_and_replaced_documents(index):
+    index.remove_document(4)
+    index.add_document(8, "Accountant", "2000-01-01")
+    index.remove_document(999)
+    docs = [(d, r, b) for d, r, b in documents() if d != 4]
+    docs = [(8, "Accountant", "2000-01-01") if d == 8 else (d, r, b) for d, r, b in docs]
+
+    assert len(index) == 199
+    for filters in (SearchFilters(roles=("Designer",)), SearchFilters(roles=("Accountant",), max_age=30)):
+        assert index.doc_indexes(filters) == brute_force(docs, filters)
+
+
+def test_age_from_birthdate():
+    assert age_from_birthdate("2000-06-15", TODAY) == 25
+    assert age_from_birthdate("2000-06-16", TODAY) == 24
+    assert age_from_birthdate("not a date", TODAY) is None
+
+
+def test_bits_to_indexes():
+    assert bits_to_indexes(0) == []
+    assert bits_to_indexes(0b101001) == [0, 3, 5]
+    assert bits_to_indexes(1 << 500) == [500]
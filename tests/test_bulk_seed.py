@@ -0,0 +1,66 @@
+# tests/test_bulk_seed.py
+
+import pytest
+
+from bulk_seed import iter_sql_rows
+
+
+def write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_sql_dump_rows(tmp_path):
+    dump = write(tmp_path / "seed.sql", """
+SET NAMES 'utf8mb4';
+CREATE TABLE ApplicantProfile (applicant_id INT);
+INSERT INTO ApplicantProfile (applicant_id, first_name, address) VALUES
+-- a comment between rows
+(1, 'O''Brien', 'Jl. Kenanga\\nNo. 12'),
+(2, NULL, 'multi
+line');
+INSERT INTO `ApplicationDetail` VALUES (7, 1, 'Designer', 'data/1.pdf');
+""")
+    assert list(iter_sql_rows(dump)) == [
+        ("ApplicantProfile", ("applicant_id", "first_name", "address"), (1, "O'Brien", "Jl. Kenanga\nNo. 12")),
+        ("ApplicantProfile", ("applicant_id", "first_name", "address"), (2, None, "multi\nline")),
+        ("ApplicationDetail", (), (7, 1, "Designer", "data/1.pdf")),
+    ]
+
+
+def test_unterminated_string_is_an_error(tmp_path):
+    dump = write(tmp_path / "bad.sql", "INSERT INTO ApplicantProfile (first_name) VALUES ('never closed);\n")
+    with pytest.raises(ValueError):
+        list(iter_sql_rows(dump))
+
+
+@pytest.fixture
+def seed_files(tmp_path):
+    applicants = write(tmp_path / "ApplicantProfile.csv",
+                       "applicant_id,first_name,last_name,date_of_birth,address,phone_number\n"
+                       + "".join(f"{i},Name{i},Last{i},199{i % 3}-05-01,Jakarta,0812\n" for i in range(1, 1201)))
+    applications = write(tmp_path / "ApplicationDetail.csv",
+                         "detail_id,applicant_id,application_role,cv_path\n"
+                         + "".join(f"{i},{i},{'Designer' if i % 2 else ''},data/{i}.pdf\n" for i in range(1, 1201)))
+    return [applicants, applications]
+
+
+def test_seed_replaces_data_and_statistics(sqlite_db, seed_files):
+    sqlite_db.add_applicant("Old", "Row", "1980-01-01", "Bandung", "0812")
+    report = sqlite_db.seed_all_data(seed_files)
+
+    assert report.rows == {"ApplicantProfile": 1200, "ApplicationDetail": 1200}
+    assert report.statements == 6
+    assert len(sqlite_db.get_all_applicants()["data"]) == 1200
+    assert sqlite_db.search_applicants_by_name("Old")["data"] == []
+    roles = {role: count for role, count in sqlite_db.get_role_statistics()["data"]}
+    assert roles == {"Designer": 600, "No Role Specified": 600}
+    assert sum(count for _, count in sqlite_db.get_age_distribution()["data"]) == 1200
+
+
+def test_failed_seed_keeps_previous_data(sqlite_db, seed_files, tmp_path):
+    sqlite_db.add_applicant("Kept", "Row", "1980-01-01", "Bandung", "0812")
+    broken = write(tmp_path / "ApplicationDetail.csv", "detail_id,no_such_column\n1,x\n")
+
+    assert sqlite_db.seed_all_data([seed_files[0], broken]) is None
+    assert [row[1] for row in sqlite_db.get_all_applicants()["data"]] == ["Kept"]
@@ -0,0 +1,85 @@
+# tests/test_exporters.py
+
+import csv
+import gzip
+import io
+import json
+from datetime import date
+
+import pytest
+
+from exporters import APPLICATION_EXPORT_QUERY, export_applications_by_role, export_query, write_json, write_ndjson
+
+COLUMNS = ("id", "name", "born")
+ROWS = [(1, "Ana \"A\"\nPutri", date(1995, 4, 2)), (2, "Budi", None)]
+
+
+def one_pass(rows):
+    """Rows that can be read once only, as a streamed cursor hands them out."""
+    return (row for row in rows)
+
+
+@pytest.mark.parametrize("rows", [ROWS, []])
+def test_json_matches_json_dump(rows):
+    out = io.StringIO()
+    assert write_json(out, COLUMNS, one_pass(rows)) == len(rows)
+    expected = [{"id": row[0], "name": row[1], "born": row[2] and row[2].strftime("%Y-%m-%d")} for row in rows]
+    assert out.getvalue() == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_ndjson_writes_one_object_per_line():
+    out = io.StringIO()
+    assert write_ndjson(out, COLUMNS, one_pass(ROWS)) == 2
+    lines = out.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "name": "Ana \"A\"\nPutri", "born": "1995-04-02"},
+        {"id": 2, "name": "Budi", "born": None},
+    ]
+
+
+@pytest.fixture
+def applications(sqlite_db):
+    roles = ("Designer", "Data Scientist", None)
+    for i in range(30):
+        applicant_id = sqlite_db.add_applicant(f"Name{i}", "Last", "1990-01-01", "Jakarta", "0812")
+        sqlite_db.add_application(applicant_id, roles[i % 3], f"data/{i}.pdf")
+    return sqlite_db
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_query_streams_every_row(applications, tmp_path, compress):
+    path = str(tmp_path / ("applications.csv.gz" if compress else "applications.csv"))
+    report = export_query(applications, APPLICATION_EXPORT_QUERY.format(where=""), path, "csv", compress=compress,
+                          batch_size=7)
+
+    assert report.rows == 30 and report.files == [path]
+    with (gzip.open(path, "rt", newline="") if compress else open(path, newline="")) as exported:
+        rows = list(csv.reader(exported))
+    assert rows[0][:2] == ["detail_id", "applicant_id"]
+    assert [int(row[0]) for row in rows[1:]] == list(range(1, 31))
+
+
+def test_export_query_json_round_trips(applications, tmp_path):
+    path = str(tmp_path / "applications.json")
+    export_query(applications, APPLICATION_EXPORT_QUERY.format(where="WHERE ad.application_role = %s"), path,
+                 "json", params=("Designer",))
+    with open(path, encoding="utf-8") as exported:
+        rows = json.load(exported)
+    assert len(rows) == 10 and {row["application_role"] for row in rows} == {"Designer"}
+
+
+def test_failed_export_leaves_no_file(applications, tmp_path):
+    path = tmp_path / "broken.csv"
+    with pytest.raises(ValueError):
+        export_query(applications, "SELECT 1", str(path), "xml")
+    with pytest.raises(Exception):
+        export_query(applications, "SELECT * FROM NoSuchTable", str(path))
+    assert not path.exists()
+
+
+def test_export_by_role_writes_one_file_per_role(applications, tmp_path):
+    report = export_applications_by_role(applications, "ndjson", workers=2, directory=str(tmp_path))
+
+    assert report.rows == 30
+    assert sorted(path.name for path in tmp_path.glob("*.ndjson")) == [
+        "applications_Data-Scientist.ndjson", "applications_Designer.ndjson", "applications_no-role.ndjson"]
@@ -0,0 +1,165 @@
+# tests/test_index_store.py
+
+import os
+
+import pytest
+
+from index_store import (HEADER, INDEX_MAGIC, LAZY_SECTIONS, SECTION_ENTRY, SECTIONS, IndexFormatError,
+                         corpus_fingerprint, load_index, save_index)
+from inverted_index import InvertedIndex
+from query_language import QueryEvaluator, parse_query
+from scoring import BM25Scorer, CorpusStatistics, tokenize
+from text_store import TextStore
+
+TEXTS = [
+    "Python developer with SQL and Django. Machine learning projects.",
+    "Senior Java engineer: Spring, SQL, Kafka",
+    "Data scientist, python, pandas, machine learning",
+    "Accountant with SAP experience " * 50,
+]
+FINGERPRINT = b"\x01" * 32
+QUERIES = ["python", "sql AND java", '"machine learning"', "python NOT django", "sap OR kafka"]
+
+
+def build_corpus():
+    """Corpus as the app builds it: applications point at distinct texts, indexed by text id."""
+    text_store, index, statistics = TextStore(), InvertedIndex(), CorpusStatistics()
+    cv_database = []
+    for doc_index, text in enumerate(TEXTS + TEXTS[:2]):
+        text_id = text_store.add(text)
+        text_store.link(text_id, doc_index)
+        cv_database.append({"id": doc_index, "name": f"Applicant {doc_index}", "role": "Dev", "text_id": text_id})
+        if text_id not in statistics.doc_lengths:
+            tokens = tokenize(text)
+            statistics.add_document(text_id, text, tokens)
+            index.add_document(text_id, text, tokens)
+    return cv_database, text_store, index, statistics
+
+
+@pytest.fixture
+def saved(tmp_path):
+    corpus = build_corpus()
+    path = str(tmp_path / "index.bin")
+    save_index(path, *corpus, FINGERPRINT)
+    return path, corpus
+
+
+def test_round_trip(saved):
+    path, (cv_database, text_store, index, statistics) = saved
+    loaded = load_index(path, FINGERPRINT)
+
+    assert loaded.cv_database == cv_database
+    assert len(loaded.text_store) == len(text_store) == len(TEXTS)
+    for text_id in range(len(text_store)):
+        assert loaded.text_store.texts[text_id] == text_store.texts[text_id]
+        assert loaded.text_store.hashes[text_id] == text_store.hashes[text_id]
+        assert loaded.text_store.signatures[text_id].bits == text_store.signatures[text_id].bits
+        assert loaded.text_store.linked_docs[text_id] == text_store.linked_docs[text_id]
+    assert sorted(loaded.inverted_index.vocabulary()) == sorted(index.vocabulary())
+    for token in index.vocabulary():
+        assert loaded.inverted_index.get_postings(token) == index.get_postings(token)
+        assert loaded.corpus_stats.doc_freq[token] == statistics.doc_freq[token]
+        for text_id in index.get_postings(token):
+            assert loaded.inverted_index.get_positions(token, text_id) == index.get_positions(token, text_id)
+    assert loaded.corpus_stats.doc_lengths == statistics.doc_lengths
+    assert loaded.corpus_stats.average_length == pytest.approx(statistics.average_length)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_search_on_loaded_index_matches(saved, query):
+    path, (_, _, index, statistics) = saved
+    loaded = load_index(path, FINGERPRINT)
+    plan = parse_query(query)
+    expected, actual = QueryEvaluator(index), QueryEvaluator(loaded.inverted_index)
+    assert actual.evaluate(plan) == expected.evaluate(plan)
+    for text_id in expected.evaluate(plan):
+        counts = expected.match_counts(plan, text_id)
+        assert actual.match_counts(plan, text_id) == counts
+        assert BM25Scorer(loaded.corpus_stats).score(text_id, counts) == pytest.approx(
+            BM25Scorer(statistics).score(text_id, counts))
+
+
+def test_loaded_index_takes_new_and_removed_texts(saved):
+    path, (_, text_store, index, statistics) = saved
+    loaded = load_index(path, FINGERPRINT)
+    text = "Kotlin and python developer"
+    for store, target_index, target_statistics in ((text_store, index, statistics),
+                                                   (loaded.text_store, loaded.inverted_index, loaded.corpus_stats)):
+        text_id = store.add(text)
+        target_index.add_document(text_id, text)
+        target_statistics.add_document(text_id, text)
+        target_index.remove_document(1)
+        target_statistics.remove_document(1)
+    for query in QUERIES + ["kotlin"]:
+        plan = parse_query(query)
+        assert QueryEvaluator(loaded.inverted_index).evaluate(plan) == QueryEvaluator(index).evaluate(plan)
+    assert loaded.corpus_stats.doc_freq.get("java") == statistics.doc_freq.get("java")
+    assert loaded.corpus_stats.doc_lengths == statistics.doc_lengths
+
+
+def test_other_fingerprint_is_rejected(saved):
+    path, _ = saved
+    with pytest.raises(IndexFormatError, match="corpus changed"):
+        load_index(path, b"\x02" * 32)
+
+
+def test_missing_file_is_rejected(tmp_path):
+    with pytest.raises(IndexFormatError):
+        load_index(str(tmp_path / "missing.bin"), FINGERPRINT)
+
+
+def test_fingerprint_follows_the_cv_files(tmp_path):
+    cv_path = tmp_path / "cv.pdf"
+    cv_path.write_bytes(b"%PDF first")
+    records = [({"applicant_id": 1, "cv_path": "cv.pdf"}, str(cv_path))]
+    before = corpus_fingerprint(records)
+    assert corpus_fingerprint(records) == before
+
+    cv_path.write_bytes(b"%PDF second version")
+    assert corpus_fingerprint(records) != before
+    assert corpus_fingerprint([({"applicant_id": 2, "cv_path": "cv.pdf"}, str(cv_path))]) != corpus_fingerprint(records)
+
+
+def flip_last_byte(path, section):
+    with open(path, "r+b") as index_file:
+        index_file.seek(HEADER.size + SECTIONS.index(section) * SECTION_ENTRY.size)
+        offset, length = SECTION_ENTRY.unpack(index_file.read(SECTION_ENTRY.size))
+        index_file.seek(offset + length - 1)
+        last = index_file.read(1)[0]
+        index_file.seek(offset + length - 1)
+        index_file.write(bytes([last ^ 1]))
+
+
+@pytest.mark.parametrize("section", [name for name in SECTIONS if name not in LAZY_SECTIONS])
+def test_corrupt_checked_section_fails_the_load(saved, section):
+    path, _ = saved
+    flip_last_byte(path, section)
+    with pytest.raises(IndexFormatError):
+        load_index(path, FINGERPRINT)
+
+
+@pytest.mark.parametrize("section", LAZY_SECTIONS)
+def test_corrupt_lazy_section_fails_on_first_read(saved, section):
+    path, (_, text_store, index, _) = saved
+    flip_last_byte(path, section)
+    loaded = load_index(path, FINGERPRINT)
+    with pytest.raises(IndexFormatError, match=section):
+        for text_id in range(len(text_store)):
+            loaded.text_store.texts[text_id]
+        for token in index.vocabulary():
+            for text_id in loaded.inverted_index.get_postings(token):
+                loaded.inverted_index.get_positions(token, text_id)
+
+
+def test_other_format_version_is_rejected(saved):
+    path, _ = saved
+    with open(path, "r+b") as index_file:
+        index_file.seek(len(INDEX_MAGIC))
+        index_file.write((1).to_bytes(4, "little"))
+    with pytest.raises(IndexFormatError, match="format version"):
+        load_index(path, FINGERPRINT)
+
+
+def test_save_leaves_no_temporary_file(saved):
+    path, _ = saved
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
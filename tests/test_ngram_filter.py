@@ -0,0 +1,64 @@
+# tests/test_ngram_filter.py
+
+import random
+
+import pytest
+
+from algorithm.levenshtein import levenshtein_search
+from algorithm.ngram_filter import NGramSignature
+
+# A small alphabet makes near matches, and so the interesting cases, common
+ALPHABET = "abcde "
+
+
+def random_text(rng, length):
+    return "".join(rng.choice(ALPHABET) for _ in range(length))
+
+
+def mutate(rng, keyword, edits):
+    chars = list(keyword)
+    for _ in range(edits):
+        operation = rng.choice(("substitute", "insert", "delete"))
+        position = rng.randrange(len(chars) + (operation == "insert")) if chars else 0
+        if operation == "substitute" and chars:
+            chars[position] = rng.choice(ALPHABET)
+        elif operation == "insert":
+            chars.insert(position, rng.choice(ALPHABET))
+        elif chars:
+            del chars[position]
+    return "".join(chars)
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 2])
+def test_fuzzy_filter_never_rejects_a_match(threshold):
+    rng = random.Random(threshold)
+    checked = 0
+    for _ in range(400):
+        keyword = random_text(rng, rng.randint(3, 10)).strip() or "abc"
+        planted = mutate(rng, keyword, rng.randint(0, threshold))
+        text = random_text(rng, 30) + planted + random_text(rng, 30)
+        if levenshtein_search(text, keyword, threshold):
+            checked += 1
+            assert NGramSignature.from_text(text).might_match_fuzzy(keyword, threshold), (text, keyword)
+    assert checked > 100
+
+
+def test_exact_filter_never_rejects_a_match():
+    rng = random.Random(7)
+    for _ in range(300):
+        text = random_text(rng, 80)
+        start = rng.randrange(len(text) - 1)
+        keyword = text[start:start + rng.randint(1, 12)]
+        assert NGramSignature.from_text(text).might_contain(keyword)
+
+
+def test_filter_rejects_unrelated_keywords():
+    signature = NGramSignature.from_text("experienced python developer with sql and django")
+    assert not signature.might_contain("kotlin")
+    assert not signature.might_match_fuzzy("kubernetes", 1)
+    assert signature.might_match_fuzzy("pyton", 1)
+
+
+def test_signature_round_trips_through_bytes():
+    signature = NGramSignature.from_text("python developer")
+    assert NGramSignature(bytes(signature.bits)).might_contain("python")
@@ -0,0 +1,66 @@
+# tests/test_query_language.py
+
+import pytest
+
+from inverted_index import InvertedIndex
+from query_language import (And, Not, Or, Phrase, QueryEvaluator, QuerySyntaxError, Term, is_boolean_query,
+                            parse_query)
+
+
+@pytest.mark.parametrize("query", [
+    "",
+    "   ",
+    "python AND",
+    "NOT",
+    "(python OR sql",
+    "python)",
+    "python AND ()",
+    '"  ,  "',
+    "OR python",
+])
+def test_malformed_queries_raise(query):
+    with pytest.raises(QuerySyntaxError):
+        parse_query(query)
+
+
+def test_syntax_error_is_a_value_error():
+    assert issubclass(QuerySyntaxError, ValueError)
+
+
+def test_precedence():
+    assert parse_query("a OR b AND NOT c") == Or((Term("a"), And((Term("b"), Not(Term("c"))))))
+    assert parse_query("python django, sql") == Or((And((Term("python"), Term("django"))), Term("sql")))
+    assert parse_query('"Machine Learning"') == Phrase(("machine", "learning"))
+
+
+def test_is_boolean_query():
+    assert is_boolean_query('python AND "machine learning"')
+    assert not is_boolean_query("python, sql, and more")
+
+
+@pytest.fixture
+def evaluator():
+    index = InvertedIndex()
+    texts = ["python machine learning", "java sql", "python sql", "learning machine python"]
+    for doc_id, text in enumerate(texts):
+        index.add_document(doc_id, text)
+    return QueryEvaluator(index)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("python", [0, 2, 3]),
+    ("python AND sql", [2]),
+    ("java OR python", [0, 1, 2, 3]),
+    ("sql NOT java", [2]),
+    ("NOT python", [1]),
+    ('"machine learning"', [0]),
+    ('python AND ("machine learning" OR java)', [0]),
+    ("kotlin", []),
+])
+def test_evaluate(evaluator, query, expected):
+    assert evaluator.evaluate(parse_query(query)) == expected
+
+
+def test_match_counts_skip_negated_leaves(evaluator):
+    assert evaluator.match_counts(parse_query('"machine learning" python NOT java'), 0) == {
+        "machine learning": 1, "python": 1}
@@ -0,0 +1,52 @@
+# tests/test_query_plans.py
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("dotenv")
+
+from database import ApplicantDatabaseManager
+from query_plans import INDEXED_LOOKUPS, explain_lookups
+from storage import SQLiteBackend
+
+ROLES = ("Software Engineer", "Data Scientist", "Accountant", "Designer")
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = ApplicantDatabaseManager(backend=SQLiteBackend(str(tmp_path / "plans.db")), check_schema=False)
+    assert manager.connect()
+    manager.setup_database()
+    assert manager.setup_extraction_tables()
+    for i in range(200):
+        applicant_id = manager.add_applicant(f"Mohammad{i}", f"Lastname{i}", "1990-01-01", "Jakarta", "0812")
+        manager.add_application(applicant_id, ROLES[i % len(ROLES)], f"data/cv_{i}.pdf")
+    yield manager
+    manager.disconnect()
+
+
+@pytest.fixture
+def plans(db):
+    return {plan.name: plan for plan in explain_lookups(db)}
+
+
+def test_every_lookup_avoids_full_scans(plans):
+    assert set(plans) == set(INDEXED_LOOKUPS)
+    for plan in plans.values():
+        assert not plan.full_scans, str(plan)
+
+
+def test_role_lookup_uses_role_index(plans):
+    steps = " ".join(step for step, _ in plans["get_applications_by_role"].steps)
+    assert "idx_application_detail_role" in steps
+
+
+@pytest.mark.parametrize("name", ["get_applicant_applications", "get_applications_by_applicant_ids"])
+def test_applicant_lookups_use_applicant_index(plans, name):
+    steps = " ".join(step for step, _ in plans[name].steps)
+    assert "idx_application_detail_applicant" in steps
+
+
+def test_name_search_uses_full_text_table(plans):
+    steps = " ".join(step for step, _ in plans["search_applicants_by_name"].steps)
+    assert "ApplicantNameSearch" in steps and "VIRTUAL TABLE" in steps
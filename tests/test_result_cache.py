@@ -0,0 +1,52 @@
+# tests/test_result_cache.py
+
+from result_cache import CachedSearch, SearchResultCache, make_cache_key
+
+
+def entry(label):
+    return CachedSearch(results=[label], exact_match_time="1 ms", fuzzy_match_time="N/A", elapsed_ms=1.0)
+
+
+def test_key_ignores_order_case_spaces_and_duplicates():
+    assert make_cache_key([" Python", "sql", "python "], "KMP", 2, 10) == make_cache_key(["SQL", "python"], "KMP", 2, 10)
+    assert make_cache_key(["python"], "KMP", 2, 10) != make_cache_key(["python"], "BM", 2, 10)
+    assert make_cache_key(["python"], "KMP", 2, 10) != make_cache_key(["python"], "KMP", 2, 10, "role=Designer")
+
+
+def test_hit_needs_the_same_corpus_version():
+    cache = SearchResultCache()
+    key = make_cache_key(["python"], "KMP", 2, 10)
+    cache.put(key, 1, entry("a"))
+
+    assert cache.get(key, 1).results == ["a"]
+    assert cache.get(key, 2) is None
+    # The version change dropped the entry for good
+    assert cache.get(key, 1) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_put_under_a_new_version_drops_older_entries():
+    cache = SearchResultCache()
+    old, new = make_cache_key(["old"], "KMP", 2, 10), make_cache_key(["new"], "KMP", 2, 10)
+    cache.put(old, 1, entry("old"))
+    cache.put(new, 2, entry("new"))
+    assert len(cache) == 1 and cache.get(new, 2).results == ["new"]
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchResultCache(max_entries=2)
+    keys = [make_cache_key([word], "KMP", 2, 10) for word in ("a", "b", "c")]
+    cache.put(keys[0], 1, entry("a"))
+    cache.put(keys[1], 1, entry("b"))
+    cache.get(keys[0], 1)
+    cache.put(keys[2], 1, entry("c"))
+
+    assert cache.get(keys[1], 1) is None
+    assert cache.get(keys[0], 1) is not None and cache.get(keys[2], 1) is not None
+
+
+def test_zero_size_cache_stores_nothing():
+    cache = SearchResultCache(max_entries=0)
+    key = make_cache_key(["python"], "KMP", 2, 10)
+    cache.put(key, 1, entry("a"))
+    assert len(cache) == 0 and cache.get(key, 1) is None
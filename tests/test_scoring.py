@@ -0,0 +1,81 @@
+# tests/test_scoring.py
+
+import math
+
+import pytest
+
+from scoring import BM25Scorer, CorpusStatistics, tokenize
+
+DOCS = {
+    0: "Python developer with SQL and Django",
+    1: "Senior Java engineer, Spring and SQL",
+    2: "Data scientist: python, pandas, machine learning",
+    3: "Accountant with SAP experience",
+    4: "python python python",
+}
+
+
+def build(docs):
+    statistics = CorpusStatistics()
+    for doc_id, text in docs.items():
+        statistics.add_document(doc_id, text)
+    return statistics
+
+
+def assert_same_statistics(actual, expected):
+    assert actual.doc_lengths == expected.doc_lengths
+    assert actual.doc_freq == expected.doc_freq
+    assert actual.total_length == expected.total_length
+    assert actual.average_length == pytest.approx(expected.average_length)
+
+
+def test_remove_matches_rebuild():
+    statistics = build(DOCS)
+    statistics.remove_document(1)
+    statistics.remove_document(4)
+    statistics.remove_document(99)
+    assert_same_statistics(statistics, build({k: v for k, v in DOCS.items() if k not in (1, 4)}))
+
+
+def test_replace_matches_rebuild():
+    statistics = build(DOCS)
+    statistics.add_document(2, "Go developer")
+    assert_same_statistics(statistics, build({**DOCS, 2: "Go developer"}))
+
+
+def test_add_after_remove_matches_rebuild():
+    statistics = build(DOCS)
+    for doc_id in list(DOCS):
+        statistics.remove_document(doc_id)
+    assert statistics.doc_count == 0 and not statistics.doc_freq and statistics.total_length == 0
+    for doc_id, text in reversed(list(DOCS.items())):
+        statistics.add_document(doc_id, text, tokenize(text))
+    assert_same_statistics(statistics, build(DOCS))
+
+
+def test_scores_match_rebuild():
+    incremental = build(DOCS)
+    incremental.remove_document(3)
+    incremental.add_document(5, "python and sql")
+    rebuilt = build({**{k: v for k, v in DOCS.items() if k != 3}, 5: "python and sql"})
+    term_frequencies = {"python": 2, "sql": 1}
+    for doc_id in rebuilt.doc_lengths:
+        assert BM25Scorer(incremental).score(doc_id, term_frequencies) == pytest.approx(
+            BM25Scorer(rebuilt).score(doc_id, term_frequencies))
+
+
+def test_idf_uses_index_frequency_unless_given():
+    scorer = BM25Scorer(build(DOCS))
+    assert scorer.idf("python") == pytest.approx(math.log(1 + (5 - 3 + 0.5) / (3 + 0.5)))
+    assert scorer.idf("machine learning") == scorer.idf("machine", doc_freq=1)
+    assert scorer.idf("python", doc_freq=1, doc_count=2) == pytest.approx(math.log(1 + 1.5 / 1.5))
+    assert scorer.idf("kotlin") > scorer.idf("python")
+
+
+def test_score_prefers_given_keyword_idf():
+    scorer = BM25Scorer(build(DOCS))
+    term_frequencies = {"python": 1, "sql": 1}
+    halved = {"python": scorer.idf("python") / 2}
+    expected = scorer.score(0, {"python": 1}) / 2 + scorer.score(0, {"sql": 1})
+    assert scorer.score(0, term_frequencies, halved) == pytest.approx(expected)
+    assert scorer.score(0, {}) == 0.0
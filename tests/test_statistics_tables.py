@@ -0,0 +1,43 @@
+# tests/test_statistics_tables.py
+
+from datetime import datetime
+
+
+def role_counts(db):
+    return {role: count for role, count in db.get_role_statistics()["data"]}
+
+
+def age_counts(db):
+    return {age: count for age, count in db.get_age_distribution()["data"]}
+
+
+def test_add_application_counts_roles(sqlite_db):
+    first = sqlite_db.add_applicant("Ana", "Putri", "1995-04-02", "Bandung", "0812")
+    second = sqlite_db.add_applicant("Budi", "Santoso", "1990-12-30", "Jakarta", "0813")
+    sqlite_db.add_application(first, "Data Scientist", "data/a.pdf")
+    sqlite_db.add_application(first, "Software Engineer", "data/b.pdf")
+    sqlite_db.add_application(second, "Software Engineer", "data/c.pdf")
+    sqlite_db.add_application(second, None, "data/d.pdf")
+
+    assert role_counts(sqlite_db) == {"Software Engineer": 2, "Data Scientist": 1, "No Role Specified": 1}
+
+
+def test_add_applicant_counts_birth_years(sqlite_db):
+    year = datetime.now().year
+    sqlite_db.add_applicant("Ana", "Putri", "1995-04-02", "Bandung", "0812")
+    sqlite_db.add_applicant("Citra", "Lestari", "1995-11-20", "Medan", "0814")
+    sqlite_db.add_applicant("Dewi", "Anggraini", None, "Surabaya", "0815")
+
+    assert age_counts(sqlite_db) == {year - 1995: 2, None: 1}
+
+
+def test_refresh_statistics_matches_incremental_counts(sqlite_db):
+    for i in range(12):
+        applicant_id = sqlite_db.add_applicant(f"Name{i}", "Last", f"{1985 + i % 4}-01-01", "Jakarta", "0812")
+        sqlite_db.add_application(applicant_id, ("Designer", "Accountant", None)[i % 3], f"data/{i}.pdf")
+    roles, ages = role_counts(sqlite_db), age_counts(sqlite_db)
+
+    assert sqlite_db.refresh_statistics()
+    assert role_counts(sqlite_db) == roles
+    assert age_counts(sqlite_db) == ages
+    assert sum(roles.values()) == sum(ages.values()) == 12